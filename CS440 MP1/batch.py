@@ -0,0 +1,121 @@
+# batch.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains a headless batch runner for the search methods.
+Every (maze file, method) pair is run once and reported as one JSON line:
+    {"maze": ..., "method": ..., "path_length": ..., "states_explored": ...,
+     "wall_seconds": ..., "peak_memory_bytes": ...}
+or, if the search raised, the same keys up to "method" plus "error".
+Nothing here imports pygame.
+"""
+
+import argparse
+import glob
+import importlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from maze import Maze
+
+
+def expandMazeFiles(patterns):
+    """
+    Expands file names and glob patterns, keeping the order given and dropping repeats
+    :param patterns: list of paths or glob patterns
+    :return: list of paths
+    """
+    filenames = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        for filename in matches:
+            if filename not in filenames:
+                filenames.append(filename)
+    return filenames
+
+
+def runOne(filename, method, engine="search_alt", traceMemory=True):
+    """
+    Loads a maze and runs one search method on it
+    peak_memory_bytes is the tracemalloc peak over loading and searching; tracing slows the search down,
+    so with traceMemory=False it is None and wall_seconds is the untraced time
+    :param filename:
+    :param method: a key of the engine's search() dispatch
+    :param engine: module name, "search_alt" or "search"
+    :param traceMemory:
+    :return: dict for one JSON line
+    """
+    record = {"maze": filename, "method": method}
+    module = importlib.import_module(engine)
+    if traceMemory:
+        tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        maze = Maze(filename)
+        path, states_explored = module.search(maze, method)
+        record["path_length"] = len(path)
+        record["states_explored"] = states_explored
+        record["wall_seconds"] = round(time.perf_counter() - start, 6)
+        record["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1] if traceMemory else None
+    except Exception as error:
+        record["error"] = "%s: %s" % (type(error).__name__, error)
+    finally:
+        if traceMemory:
+            tracemalloc.stop()
+    return record
+
+
+def runBatch(filenames, methods, out, engine="search_alt", traceMemory=True):
+    """
+    Runs every method on every maze file and writes one JSON line per pair to out
+    :param filenames:
+    :param methods:
+    :param out: writable text stream
+    :param engine:
+    :param traceMemory:
+    :return: number of pairs that raised
+    """
+    failures = 0
+    for filename in filenames:
+        for method in methods:
+            record = runOne(filename, method, engine, traceMemory)
+            failures += "error" in record
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+    return failures
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='CS440 MP1 Headless Batch Search')
+
+    parser.add_argument('mazes', nargs='+',
+                        help='maze files or glob patterns, e.g. "*.txt" [REQUIRED]')
+    parser.add_argument('--methods', dest="methods", nargs='+', default=["astar"],
+                        help='search methods to run on every maze - default astar')
+    parser.add_argument('--engine', dest="engine", default="search_alt", choices=["search_alt", "search"],
+                        help='module whose search() is run - default search_alt')
+    parser.add_argument('--no-memory', dest="traceMemory", default=True, action="store_false",
+                        help='skip tracemalloc, so wall_seconds is untraced and peak_memory_bytes is null')
+    parser.add_argument('--output', dest="output", default=None,
+                        help='file to write the JSON lines to - default stdout')
+    parser.add_argument('--budget', dest="budget", type=int, default=None,
+                        help='states idastar and smastar may keep in memory - default search_alt.MEMORY_BUDGET')
+
+    args = parser.parse_args()
+    if args.budget is not None:
+        importlib.import_module("search_alt").MEMORY_BUDGET = args.budget
+    filenames = expandMazeFiles(args.mazes)
+    if args.output is None:
+        failures = runBatch(filenames, args.methods, sys.stdout, args.engine, args.traceMemory)
+    else:
+        with open(args.output, 'w') as f:
+            failures = runBatch(filenames, args.methods, f, args.engine, args.traceMemory)
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,193 @@
+# benchmark.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains a small benchmark that shows how the cost of the search
+functions grows with the size of the maze, a comparison of search methods
+over the bundled maze files, and a suite that runs every method on generated
+mazes (generate.py) of growing size.
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from generate import generateMaze, writeMaze
+from maze import Maze
+import search
+import search_alt
+
+"""
+Every method of the search_alt dispatch, which the suite runs by default
+"""
+ALL_METHODS = ["bfs", "dfs", "greedy", "astar", "greedy_table", "astar_table", "astar_exact", "alt", "idastar",
+               "smastar", "arastar", "junction", "junction_dijkstra", "dstar", "hpastar", "astar_mst", "tsp", "jps",
+               "bibfs", "biastar"]
+
+"""
+(layout, dots) pairs the suite generates at every size: the three layouts with one dot, and two multi-dot ones
+"""
+SUITE_MAZES = [("perfect", 1), ("braided", 1), ("rooms", 1), ("braided", 8), ("rooms", 8)]
+
+
+def writeOpenMaze(filename, size):
+    """
+    Writes a size x size open room with the start in the top left corner and
+    a single objective in the bottom right corner, in the format Maze reads
+    :param filename:
+    :param size: number of rows and columns, including the outer wall
+    :return:
+    """
+    lines = ['%' * size]
+    for row in range(1, size - 1):
+        line = ['%'] + [' '] * (size - 2) + ['%']
+        if row == 1:
+            line[1] = 'P'
+        if row == size - 2:
+            line[size - 2] = '.'
+        lines.append(''.join(line))
+    lines.append('%' * size)
+    with open(filename, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def timeAstar(executor, size):
+    """
+    Runs an A* executor on a size x size open room.
+    :param executor: search.astar_executor (what mp1.py runs) or search_alt.astar_executor
+    :param size:
+    :return: path length, states explored, seconds
+    """
+    fd, filename = tempfile.mkstemp(suffix='.txt')
+    os.close(fd)
+    try:
+        writeOpenMaze(filename, size)
+        maze = Maze(filename)
+    finally:
+        os.remove(filename)
+    start = time.perf_counter()
+    path, states_explored = executor(maze, maze.getStart(), maze.getObjectives())
+    seconds = time.perf_counter() - start
+    return len(path), states_explored, seconds
+
+
+def timeMethod(method, filename):
+    """
+    Runs one search method of search_alt on a maze file
+    :param method: a key of the search_alt.search dispatch, e.g. "astar" or "jps"
+    :param filename:
+    :return: path length, states explored, seconds
+    """
+    maze = Maze(filename)
+    start = time.perf_counter()
+    path, states_explored = search_alt.search(maze, method)
+    seconds = time.perf_counter() - start
+    return len(path), states_explored, seconds
+
+
+def compareMethods(filenames, methods):
+    """
+    Prints path length, states explored and run time of every method on every maze file
+    :param filenames:
+    :param methods:
+    :return:
+    """
+    print("%-20s %-10s %10s %10s %10s" % ("maze", "method", "path", "states", "seconds"))
+    for filename in filenames:
+        for method in methods:
+            path_length, states_explored, seconds = timeMethod(method, filename)
+            print("%-20s %-10s %10d %10d %10.3f" % (os.path.basename(filename), method, path_length,
+                                                    states_explored, seconds))
+
+
+def runSuite(sizes, methods, out, seed=0, timeout=60.0, mazes=SUITE_MAZES):
+    """
+    Generates a size x size maze for every (layout, dots) pair and size, runs every method on it and writes
+    one JSON line per run: batch.py's fields plus layout, size, dots and nodes_per_second.
+    Each run is a separate batch.py process, so the peak memory is that run's alone and a run that takes
+    longer than timeout seconds is killed and reported with an "error" instead of stalling the suite
+    :param sizes: list of row (and column) counts
+    :param methods:
+    :param out: writable text stream
+    :param seed:
+    :param timeout: seconds per run
+    :param mazes: list of (layout, dots)
+    :return: list of the records written
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    records = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            for layout, dots in mazes:
+                filename = os.path.join(directory, "%s_%d_%d.txt" % (layout, size, dots))
+                writeMaze(generateMaze(layout, size, size, seed, dots), filename)
+                for method in methods:
+                    command = [sys.executable, os.path.join(here, "batch.py"), filename, "--methods", method]
+                    try:
+                        result = subprocess.run(command, cwd=here, capture_output=True, text=True, timeout=timeout)
+                        record = json.loads(result.stdout.splitlines()[-1])
+                    except subprocess.TimeoutExpired:
+                        record = {"maze": filename, "method": method, "error": "timeout after %gs" % timeout}
+                    record.update({"layout": layout, "size": size, "dots": dots})
+                    if "error" not in record:
+                        record["nodes_per_second"] = round(record["states_explored"] /
+                                                           max(record["wall_seconds"], 1e-9))
+                    out.write(json.dumps(record) + "\n")
+                    out.flush()
+                    records.append(record)
+    return records
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='CS440 MP1 Search Benchmark')
+
+    parser.add_argument('--sizes', dest="sizes", type=int, nargs='+', default=[50, 100, 200, 400, 800],
+                        help='maze sizes to run - default 50 100 200 400 800')
+
+    parser.add_argument('--compare', dest="compare", nargs='*', default=None,
+                        help='compare --methods on these maze files instead - default every bundled maze')
+    parser.add_argument('--suite', default=False, action="store_true",
+                        help='run --methods on generated mazes of every --sizes and print JSON lines instead')
+    parser.add_argument('--methods', dest="methods", nargs='+', default=None,
+                        help='methods for --compare (default astar jps) or --suite (default all of them)')
+    parser.add_argument('--seed', dest="seed", type=int, default=0,
+                        help='seed of the --suite mazes - default 0')
+    parser.add_argument('--timeout', dest="timeout", type=float, default=60.0,
+                        help='seconds allowed per --suite run - default 60')
+
+    args = parser.parse_args()
+    if args.suite:
+        runSuite(args.sizes, args.methods or ALL_METHODS, sys.stdout, args.seed, args.timeout)
+        raise SystemExit
+    if args.compare is not None:
+        here = os.path.dirname(os.path.abspath(__file__))
+        compareMethods(args.compare or sorted(glob.glob(os.path.join(here, '*.txt'))), args.methods or ["astar", "jps"])
+        raise SystemExit
+    engines = [("search", search.astar_executor), ("search_alt", search_alt.astar_executor)]
+    # time_ratio is the growth of the run time from the previous size; states_ratio is the same for
+    # the states explored. A* with incremental g-costs keeps the two roughly equal
+    print("%-10s %8s %10s %10s %10s %12s %12s %12s" % ("engine", "size", "path", "states", "seconds",
+                                                       "states/sec", "time_ratio", "states_ratio"))
+    for name, executor in engines:
+        previous = None
+        for size in args.sizes:
+            path_length, states_explored, seconds = timeAstar(executor, size)
+            if previous is None:
+                time_ratio, states_ratio = "-", "-"
+            else:
+                time_ratio = "%.2f" % (seconds / max(previous[1], 1e-9))
+                states_ratio = "%.2f" % (states_explored / max(previous[0], 1))
+            print("%-10s %8d %10d %10d %10.3f %12.0f %12s %12s" % (name, size, path_length, states_explored, seconds,
+                                                                   states_explored / max(seconds, 1e-9),
+                                                                   time_ratio, states_ratio))
+            previous = (states_explored, seconds)
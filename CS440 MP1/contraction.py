@@ -0,0 +1,110 @@
+# contraction.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the corridor contraction of a maze into a junction graph.
+Every open cell with exactly two open neighbours lies on a corridor, which has only one way in and one way out,
+so a search gains nothing by stopping on it. The graph keeps the other cells (junctions and dead ends) and
+any cell asked for (the start and the objectives) as nodes, and turns each corridor between two nodes into
+one edge weighted with its length. An edge remembers only its first step; the cells in between are found
+again by walking the corridor when a path is expanded back to cells.
+Degree-2 cells that are kept split their corridor in two, and a corridor that loops back to where it left is dropped.
+"""
+
+
+class JunctionGraph:
+    """The junction graph of a maze, contracted lazily: the corridors leaving a node are walked the first time
+    its edges are asked for, so a search pays only for the part of the maze it reaches, and build() contracts
+    the whole maze up front
+
+        Attributes:
+            keep: set of (row, col) cells that are nodes even if they lie on a corridor
+            edges: dict from every node contracted so far to a list of (neighbour node, length, first step) edges,
+                   first step being the cell next to the node on the corridor (the neighbour node itself when
+                   the two are adjacent); corridors that come back to the node they left are dropped
+            corridorCells: number of open cells that are not nodes, set by build()
+    """
+
+    def __init__(self, maze, keep=()):
+        """
+        Return the JunctionGraph of maze, with nothing contracted yet
+        :param maze:
+        :param keep: (row, col) cells that must be nodes even if they lie on a corridor
+        """
+        self.maze = maze
+        self.keep = set(keep)
+        self.edges = {}
+        self.corridorCells = None
+
+    def __len__(self):
+        return len(self.edges)
+
+    def isNode(self, position):
+        """True if position is an open cell that is kept or does not have exactly two open neighbours"""
+        return self.maze.isValidMove(position[0], position[1]) and (
+            position in self.keep or len(self.maze.getNeighbors(position[0], position[1])) != 2)
+
+    def nodeEdges(self, node):
+        """
+        The edges of a node, walking its corridors the first time
+        :param node: (row, col) for which isNode is True
+        :return: list of (neighbour node, length, first step)
+        """
+        node_edges = self.edges.get(node)
+        if node_edges is not None:
+            return node_edges
+        maze = self.maze
+        keep = self.keep
+        node_edges = []
+        for step in maze.getNeighbors(node[0], node[1]):
+            previous, current, length = node, step, 1
+            while True:
+                neighbours = maze.getNeighbors(current[0], current[1])
+                if len(neighbours) != 2 or current in keep:
+                    break
+                previous, current = current, neighbours[1] if neighbours[0] == previous else neighbours[0]
+                length += 1
+            if current != node:
+                node_edges.append((current, length, step))
+        self.edges[node] = node_edges
+        return node_edges
+
+    def build(self):
+        """
+        Contracts the whole maze, finding the nodes from the degree of every cell of Maze.openMask()
+        :return: self
+        """
+        import numpy as np
+
+        open_mask = self.maze.openMask()
+        rows, cols = open_mask.shape
+        degree = np.zeros((rows, cols), dtype=np.int8)
+        degree[1:, :] += open_mask[:-1, :]
+        degree[:-1, :] += open_mask[1:, :]
+        degree[:, 1:] += open_mask[:, :-1]
+        degree[:, :-1] += open_mask[:, 1:]
+        node_mask = open_mask & (degree != 2)
+        for row, col in self.keep:
+            node_mask[row, col] = open_mask[row, col]
+        for row, col in zip(*np.nonzero(node_mask)):
+            self.nodeEdges((int(row), int(col)))
+        self.corridorCells = int(open_mask.sum()) - len(self.edges)
+        return self
+
+    def expandEdge(self, node, step, end):
+        """
+        The cells of the corridor an edge stands for
+        :param node: node the edge leaves
+        :param step: its first step
+        :param end: node it reaches
+        :return: list of (row, col) from node to end, both included
+        """
+        cells = [node, step]
+        while cells[-1] != end:
+            neighbours = self.maze.getNeighbors(cells[-1][0], cells[-1][1])
+            cells.append(neighbours[1] if neighbours[0] == cells[-2] else neighbours[0])
+        return cells
@@ -0,0 +1,143 @@
+# distances.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the exact maze distances used by the multi-objective searches.
+One BFS is run from each point of interest (start and objectives) over the CSR
+adjacency of the Maze, and the distances between those points are kept in a NumPy matrix.
+NumPy is imported when the matrix is built, so importing this file does not need it.
+"""
+
+from array import array
+
+UNREACHABLE = -1
+
+
+def bfsTree(maze, source, targets=()):
+    """
+    Runs a BFS from source over the flat cell ids of the maze
+    If targets are given the BFS stops as soon as all of them have been discovered, otherwise it floods
+    everything reachable. The distances and parents of every discovered cell are final either way
+    :param maze:
+    :param source: (row, col) tuple
+    :param targets: cell ids whose discovery order should be recorded
+    :return: distance array, parent array (both indexed by cell id, -1 when unreached), states explored,
+             dict from each reached target to the order in which the BFS discovered it
+    """
+    rows, cols = maze.getDimensions()
+    size = rows * cols
+    distance = array('i', [UNREACHABLE]) * size
+    parent = array('i', [UNREACHABLE]) * size
+    offsets = maze.neighborOffsets
+    neighbour_ids = maze.neighborIds
+    source_id = maze.getCellId(source[0], source[1])
+    distance[source_id] = 0
+    targets = set(targets)
+    discovered = {}
+    if source_id in targets:
+        discovered[source_id] = 0
+    # -1 never reaches 0, so with no targets the BFS runs until the frontier is empty
+    remaining = len(targets) - len(discovered) if targets else -1
+    frontier = [source_id]
+    num_states_explored = 0
+    depth = 0
+    while frontier and remaining != 0:
+        depth += 1
+        next_frontier = []
+        for cell in frontier:
+            num_states_explored += 1
+            for index in range(offsets[cell], offsets[cell + 1]):
+                neighbour = neighbour_ids[index]
+                if distance[neighbour] == UNREACHABLE:
+                    distance[neighbour] = depth
+                    parent[neighbour] = cell
+                    next_frontier.append(neighbour)
+                    if neighbour in targets:
+                        discovered[neighbour] = len(discovered)
+                        remaining -= 1
+                        if remaining == 0:
+                            break
+            if remaining == 0:
+                break
+        frontier = next_frontier
+    return distance, parent, num_states_explored, discovered
+
+
+class ObjectiveDistances:
+    """Exact maze distances between a fixed set of points, computed with one BFS per point
+
+        Attributes:
+            points: list of (row, col) tuples, in matrix order
+            index: dict from point to its row/column in matrix
+            matrix: k x k NumPy int32 array of maze distances, UNREACHABLE (-1) if there is no path
+            order: k x k NumPy int32 array, order[i, j] is the order in which the BFS from point i reached
+                   point j, which breaks ties between points at the same distance the way a BFS would
+            states_explored: cells expanded over all the BFS passes, each of which stops once it has
+                             discovered every point
+
+        Only the k x k matrices are kept by default. With keepTrees=True the BFS parent array of every
+        point is kept as well (k int32 arrays of rows * cols), which path() needs.
+    """
+
+    def __init__(self, maze, points, keepTrees=False):
+        """Return an ObjectiveDistances Object over the given points"""
+        import numpy as np
+
+        self.maze = maze
+        self.points = []
+        for point in points:
+            if point not in self.points:
+                self.points.append(point)
+        self.index = {point: i for i, point in enumerate(self.points)}
+        self.matrix = np.full((len(self.points), len(self.points)), UNREACHABLE, dtype=np.int32)
+        self.order = np.full((len(self.points), len(self.points)), UNREACHABLE, dtype=np.int32)
+        point_ids = [maze.getCellId(point[0], point[1]) for point in self.points]
+        self.states_explored = 0
+        self.__parents = [] if keepTrees else None
+        for i, point in enumerate(self.points):
+            distance, parent, states_explored, discovered = bfsTree(maze, point, point_ids)
+            if keepTrees:
+                self.__parents.append(parent)
+            self.states_explored += states_explored
+            for j, other_id in enumerate(point_ids):
+                self.matrix[i, j] = distance[other_id]
+                self.order[i, j] = discovered.get(other_id, UNREACHABLE)
+
+    def distance(self, a, b):
+        """Maze distance between two of the points, UNREACHABLE if there is no path"""
+        return int(self.matrix[self.index[a], self.index[b]])
+
+    def nearest(self, current, candidates):
+        """
+        The candidate point closest to current by maze distance, ties going to the one a BFS from current reaches first
+        :param current: one of self.points
+        :param candidates: list of points
+        :return: a point, or None if none of them is reachable
+        """
+        i = self.index[current]
+        reachable = [point for point in candidates if self.matrix[i, self.index[point]] != UNREACHABLE]
+        if not reachable:
+            return None
+        return min(reachable, key=lambda point: self.order[i, self.index[point]])
+
+    def path(self, start, point):
+        """
+        Shortest path between two of the points, read off the BFS tree rooted at the second one
+        Needs keepTrees=True
+        :param start: one of self.points
+        :param point: one of self.points
+        :return: list of (row, col) tuples from start to point, [] if there is no path
+        """
+        if self.distance(start, point) == UNREACHABLE:
+            return []
+        parent = self.__parents[self.index[point]]
+        cell = self.maze.getCellId(start[0], start[1])
+        path = [start]
+        while parent[cell] != UNREACHABLE:
+            cell = parent[cell]
+            path.append(self.maze.getPosition(cell))
+        return path
@@ -0,0 +1,145 @@
+# dstar.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains D* Lite, an incremental search that keeps its state between plans.
+The search runs backwards, from the objectives to the start, so g(s) is the distance from s to the nearest
+objective and stays valid when the start moves. rhs(s) is the one-step lookahead of g(s): 0 on an objective,
+otherwise 1 + the smallest g of an open neighbour. A cell whose g and rhs differ is inconsistent and sits on the
+queue; replanning pops inconsistent cells in key order until the start is consistent and no queued key is
+below it. A wall change only makes the changed cell and its neighbours inconsistent, and an objective change only
+the cells added or removed, so a replan after a small change touches the cells whose distance it alters rather
+than the whole maze.
+The keys use the Manhattan distance to the start, which moves; km adds up the distances the start has moved so
+the keys already on the queue stay lower bounds instead of being recomputed.
+"""
+
+import math
+
+from frontier import IndexedHeap
+import observers
+
+
+class DStarLite:
+    """D* Lite over a Maze, reading the start, objectives and wall changes from it at every replan()
+
+        Attributes:
+            maze: the Maze planned over, changed through setStart, setObjectives and setWall
+            start: start of the last plan
+            goals: set of the objectives of the last plan
+            km: sum of the Manhattan distances the start has moved
+            g: dict from cell to its distance to the nearest goal, infinite when missing
+            rhs: dict from cell to its one-step lookahead, infinite when missing
+            queue: IndexedHeap of the inconsistent cells, keyed by flat cell id
+            version: Maze.getVersion() at the last plan; later wall changes are read at the next one
+    """
+
+    def __init__(self, maze):
+        """Return a DStarLite for maze, with nothing searched yet"""
+        self.maze = maze
+        self.start = maze.getStart()
+        self.goals = set()
+        self.km = 0
+        self.g = {}
+        self.rhs = {}
+        self.version = maze.getVersion()
+        self.queue = IndexedHeap()
+
+    def __key(self, cell):
+        best = min(self.g.get(cell, math.inf), self.rhs.get(cell, math.inf))
+        return (best + abs(cell[0] - self.start[0]) + abs(cell[1] - self.start[1]) + self.km, best)
+
+    def __updateVertex(self, cell):
+        maze = self.maze
+        if not maze.isValidMove(cell[0], cell[1]):
+            lookahead = math.inf
+        elif cell in self.goals:
+            lookahead = 0
+        else:
+            g = self.g
+            lookahead = min([g.get(neighbor, math.inf) for neighbor in maze.getNeighbors(cell[0], cell[1])],
+                            default=math.inf) + 1
+        if lookahead == math.inf:
+            self.rhs.pop(cell, None)
+        else:
+            self.rhs[cell] = lookahead
+        queue = self.queue
+        key = cell[0] * maze.cols + cell[1]
+        if key in queue:
+            queue.remove(key)
+        if self.g.get(cell, math.inf) != lookahead:
+            queue.push(key, self.__key(cell), cell)
+
+    def __computeShortestPath(self, observer):
+        maze = self.maze
+        queue = self.queue
+        g = self.g
+        rhs = self.rhs
+        start = self.start
+        num_states_explored = 0
+        while queue and (queue.peek()[2] < self.__key(start) or rhs.get(start, math.inf) != g.get(start, math.inf)):
+            key, cell, old_priority = queue.pop()
+            if observer is not None:
+                observer.on_pop(cell, old_priority, len(queue))
+            new_priority = self.__key(cell)
+            if old_priority < new_priority:
+                queue.push(key, new_priority, cell)
+                if observer is not None:
+                    observer.on_stale(cell)
+                continue
+            num_states_explored += 1
+            neighbors = maze.getNeighbors(cell[0], cell[1])
+            if observer is not None:
+                observer.on_expand(cell, neighbors)
+            if g.get(cell, math.inf) > rhs.get(cell, math.inf):
+                g[cell] = rhs[cell]
+            else:
+                g.pop(cell, None)
+                self.__updateVertex(cell)
+            for neighbor in neighbors:
+                self.__updateVertex(neighbor)
+        return num_states_explored
+
+    def replan(self):
+        """
+        Brings the plan up to date with the maze's start, objectives and the walls changed since the last plan,
+        repairing only the cells those changes affect
+        :return: path from the start to the nearest objective ([] if none is reachable), num_states_explored
+                 (cells expanded by this call)
+        """
+        observer = observers.attached
+        if observer is not None:
+            observer.on_phase("search")
+        maze = self.maze
+        start = maze.getStart()
+        self.km += abs(start[0] - self.start[0]) + abs(start[1] - self.start[1])
+        self.start = start
+        goals = set(maze.getObjectives())
+        changed = self.goals ^ goals
+        self.goals = goals
+        for cell in changed:
+            self.__updateVertex(cell)
+        for cell in maze.getChangesSince(self.version):
+            self.__updateVertex(cell)
+            for neighbor in maze.getNeighbors(cell[0], cell[1]):
+                self.__updateVertex(neighbor)
+        self.version = maze.getVersion()
+        num_states_explored = self.__computeShortestPath(observer)
+        path = []
+        g = self.g
+        if g.get(start, math.inf) != math.inf:
+            if observer is not None:
+                observer.on_goal(start)
+                observer.on_phase("reconstruct")
+            path = [start]
+            current = start
+            while current not in goals:
+                current = min(maze.getNeighbors(current[0], current[1]), key=lambda cell: g.get(cell, math.inf))
+                path.append(current)
+        if observer is not None:
+            observer.on_finish()
+        return path, num_states_explored
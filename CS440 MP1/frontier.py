@@ -0,0 +1,165 @@
+# frontier.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the IndexedHeap used as the frontier of the informed searches.
+"""
+
+
+class IndexedHeap:
+    """A binary min-heap that holds at most one entry per key and supports decrease-key
+
+        queue.PriorityQueue takes a lock on every put/get and keeps duplicates, so a state pushed
+        three times is popped three times and two of those pops are thrown away through visited.
+        Here every key (the flat cell id of a state) has one slot; pushing it again with a lower
+        priority moves the existing entry up instead. Entries with the same priority come out in
+        the order they were pushed.
+
+        Attributes:
+            stale_pops_avoided: pushes that updated or were folded into an entry already on the heap,
+                                i.e. the pops a duplicate-keeping queue would have had to skip
+            peak_size: the largest number of entries the heap held at once
+    """
+
+    def __init__(self):
+        """Return an empty IndexedHeap"""
+        self.__heap = []        # entries are [priority, push order, key, item]
+        self.__index = {}       # key -> position of its entry in self.__heap
+        self.__counter = 0
+        self.stale_pops_avoided = 0
+        self.peak_size = 0
+
+    def __len__(self):
+        return len(self.__heap)
+
+    def __contains__(self, key):
+        return key in self.__index
+
+    def priority(self, key):
+        """Return the priority the key currently has on the heap"""
+        return self.__heap[self.__index[key]][0]
+
+    def push(self, key, priority, item=None):
+        """
+        Insert the key, or lower its priority if it is already on the heap
+        :param key: hashable id of the state, normally row * cols + col
+        :param priority: smaller comes out first
+        :param item: value handed back by pop(), normally the position tuple
+        :return: True if the heap changed, False if the key was already there with a priority as good
+        """
+        self.__counter += 1
+        position = self.__index.get(key)
+        if position is not None:
+            self.stale_pops_avoided += 1
+            entry = self.__heap[position]
+            if priority >= entry[0]:
+                return False
+            entry[0] = priority
+            entry[1] = self.__counter
+            entry[3] = item
+            self.__siftUp(position)
+            return True
+        self.__heap.append([priority, self.__counter, key, item])
+        self.__index[key] = len(self.__heap) - 1
+        self.__siftUp(len(self.__heap) - 1)
+        if len(self.__heap) > self.peak_size:
+            self.peak_size = len(self.__heap)
+        return True
+
+    def pop(self):
+        """
+        Remove the entry with the smallest priority
+        :return: key, item, priority
+        """
+        heap = self.__heap
+        top = heap[0]
+        last = heap.pop()
+        del self.__index[top[2]]
+        if heap:
+            heap[0] = last
+            self.__index[last[2]] = 0
+            self.__siftDown(0)
+        return top[2], top[3], top[0]
+
+    def peek(self):
+        """
+        The entry pop() would return, left on the heap
+        :return: key, item, priority
+        """
+        top = self.__heap[0]
+        return top[2], top[3], top[0]
+
+    def remove(self, key):
+        """
+        Take a key off the heap, wherever its entry is
+        :param key: a key that is on the heap
+        :return: item, priority
+        """
+        heap = self.__heap
+        position = self.__index.pop(key)
+        entry = heap[position]
+        last = heap.pop()
+        if position < len(heap):
+            heap[position] = last
+            self.__index[last[2]] = position
+            self.__siftDown(position)
+            self.__siftUp(self.__index[last[2]])
+        return entry[3], entry[0]
+
+    def items(self):
+        """
+        Every entry on the heap, in no particular order
+        :return: list of (key, item, priority)
+        """
+        return [(entry[2], entry[3], entry[0]) for entry in self.__heap]
+
+    def noteDuplicate(self):
+        """Count a push the caller skipped because its key is already on the heap with a priority as good"""
+        self.stale_pops_avoided += 1
+
+    def stats(self):
+        """Return the counters as a dict"""
+        return {"stale_pops_avoided": self.stale_pops_avoided, "peak_frontier_size": self.peak_size}
+
+    def __siftUp(self, position):
+        heap = self.__heap
+        index = self.__index
+        entry = heap[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            parent_entry = heap[parent]
+            if entry[0] < parent_entry[0] or (entry[0] == parent_entry[0] and entry[1] < parent_entry[1]):
+                heap[position] = parent_entry
+                index[parent_entry[2]] = position
+                position = parent
+            else:
+                break
+        heap[position] = entry
+        index[entry[2]] = position
+
+    def __siftDown(self, position):
+        heap = self.__heap
+        index = self.__index
+        size = len(heap)
+        entry = heap[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and (heap[right][0] < heap[child][0] or
+                                 (heap[right][0] == heap[child][0] and heap[right][1] < heap[child][1])):
+                child = right
+            child_entry = heap[child]
+            if child_entry[0] < entry[0] or (child_entry[0] == entry[0] and child_entry[1] < entry[1]):
+                heap[position] = child_entry
+                index[child_entry[2]] = position
+                position = child
+            else:
+                break
+        heap[position] = entry
+        index[entry[2]] = position
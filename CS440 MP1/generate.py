@@ -0,0 +1,184 @@
+# generate.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains a seeded generator for maze files in the format Maze reads.
+Layouts:
+    perfect - a spanning tree carved by randomized DFS, so every pair of cells has exactly one path
+    braided - a perfect maze with a fraction of its dead ends knocked through, so there are loops
+    rooms   - open rooms on a regular grid, every shared wall having one door
+Any layout takes a number of dots; the start and the dots go on distinct random open cells.
+Grids are lists of bytearray rows of b'%', b' ', b'P' and b'.', which keeps 5000 x 5000 at about 25 MB.
+The same layout, size, seed and dots always produce the same file.
+"""
+
+import argparse
+import random
+
+WALL = ord('%')
+OPEN = ord(' ')
+START = ord('P')
+DOT = ord('.')
+
+
+def perfectMaze(rows, cols, seed):
+    """
+    Carves a perfect maze with an iterative randomized DFS
+    Cells sit on odd rows and columns and the walls between them are knocked out as the DFS moves,
+    so even dimensions leave a spare wall row or column on the bottom or right
+    :param rows: at least 3
+    :param cols: at least 3
+    :param seed:
+    :return: list of bytearray rows
+    """
+    rng = random.Random(seed)
+    grid = [bytearray([WALL]) * cols for _ in range(rows)]
+    cell_rows, cell_cols = (rows - 1) // 2, (cols - 1) // 2
+    visited = bytearray(cell_rows * cell_cols)
+    moves = ((-1, 0), (1, 0), (0, -1), (0, 1))
+    stack = [(0, 0)]
+    visited[0] = 1
+    grid[1][1] = OPEN
+    while stack:
+        row, col = stack[-1]
+        options = [(row + drow, col + dcol) for drow, dcol in moves
+                   if 0 <= row + drow < cell_rows and 0 <= col + dcol < cell_cols
+                   and not visited[(row + drow) * cell_cols + col + dcol]]
+        if not options:
+            stack.pop()
+            continue
+        next_row, next_col = options[rng.randrange(len(options))]
+        visited[next_row * cell_cols + next_col] = 1
+        grid[row + next_row + 1][col + next_col + 1] = OPEN
+        grid[2 * next_row + 1][2 * next_col + 1] = OPEN
+        stack.append((next_row, next_col))
+    return grid
+
+
+def braidedMaze(rows, cols, seed, braid=0.5):
+    """
+    A perfect maze with about braid of its dead ends opened into a neighbouring corridor
+    :param rows:
+    :param cols:
+    :param seed:
+    :param braid: fraction of dead ends to remove, 0 to 1
+    :return: list of bytearray rows
+    """
+    grid = perfectMaze(rows, cols, seed)
+    rng = random.Random(seed + 1)
+    for row in range(1, rows - 1, 2):
+        for col in range(1, cols - 1, 2):
+            walls = [(drow, dcol) for drow, dcol in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                     if grid[row + drow][col + dcol] == WALL]
+            if len(walls) != 3 or rng.random() >= braid:
+                continue
+            inner = [(drow, dcol) for drow, dcol in walls
+                     if 0 < row + 2 * drow < rows - 1 and 0 < col + 2 * dcol < cols - 1]
+            if inner:
+                drow, dcol = inner[rng.randrange(len(inner))]
+                grid[row + drow][col + dcol] = OPEN
+    return grid
+
+
+def openRooms(rows, cols, seed, roomSize=16):
+    """
+    Rooms of roomSize x roomSize open cells separated by one-cell walls, each wall between two rooms
+    having one door at a random place
+    :param rows:
+    :param cols:
+    :param seed:
+    :param roomSize:
+    :return: list of bytearray rows
+    """
+    rng = random.Random(seed)
+    step = roomSize + 1
+    grid = []
+    for row in range(rows):
+        if row % step == 0 or row == rows - 1:
+            grid.append(bytearray([WALL]) * cols)
+        else:
+            line = bytearray([OPEN]) * cols
+            line[0:cols:step] = bytearray([WALL]) * len(range(0, cols, step))
+            line[cols - 1] = WALL
+            grid.append(line)
+    for top in range(0, rows - 1, step):
+        for left in range(0, cols - 1, step):
+            bottom, right = min(top + step, rows - 1), min(left + step, cols - 1)
+            if right < cols - 1 and bottom - top > 1:
+                grid[rng.randrange(top + 1, bottom)][right] = OPEN
+            if bottom < rows - 1 and right - left > 1:
+                grid[bottom][rng.randrange(left + 1, right)] = OPEN
+    return grid
+
+
+LAYOUTS = {"perfect": perfectMaze, "braided": braidedMaze, "rooms": openRooms}
+
+
+def placePoints(grid, seed, dots=1):
+    """
+    Puts the start and the dots on distinct random open cells of the grid, in place
+    :param grid: list of bytearray rows
+    :param seed:
+    :param dots:
+    :return: start as (row, col), list of dots as (row, col)
+    """
+    rng = random.Random(seed + 2)
+    rows, cols = len(grid), len(grid[0])
+    points = []
+    taken = set()
+    while len(points) < dots + 1:
+        row, col = rng.randrange(rows), rng.randrange(cols)
+        if grid[row][col] == OPEN and (row, col) not in taken:
+            taken.add((row, col))
+            points.append((row, col))
+    grid[points[0][0]][points[0][1]] = START
+    for row, col in points[1:]:
+        grid[row][col] = DOT
+    return points[0], points[1:]
+
+
+def generateMaze(layout, rows, cols, seed=0, dots=1):
+    """
+    :param layout: a key of LAYOUTS
+    :param rows:
+    :param cols:
+    :param seed:
+    :param dots:
+    :return: list of bytearray rows with the start and the dots placed
+    """
+    grid = LAYOUTS[layout](rows, cols, seed)
+    placePoints(grid, seed, dots)
+    return grid
+
+
+def writeMaze(grid, filename):
+    """Writes a grid in the format Maze reads"""
+    with open(filename, 'wb') as f:
+        for line in grid:
+            f.write(line)
+            f.write(b'\n')
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='CS440 MP1 Maze Generator')
+
+    parser.add_argument('layout', choices=sorted(LAYOUTS),
+                        help='maze layout [REQUIRED]')
+    parser.add_argument('rows', type=int,
+                        help='number of rows, including the outer wall [REQUIRED]')
+    parser.add_argument('cols', type=int,
+                        help='number of columns, including the outer wall [REQUIRED]')
+    parser.add_argument('filename',
+                        help='path of the maze file to write [REQUIRED]')
+    parser.add_argument('--seed', dest="seed", type=int, default=0,
+                        help='random seed - default 0')
+    parser.add_argument('--dots', dest="dots", type=int, default=1,
+                        help='number of objectives - default 1')
+
+    args = parser.parse_args()
+    writeMaze(generateMaze(args.layout, args.rows, args.cols, args.seed, args.dots), args.filename)
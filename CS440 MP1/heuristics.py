@@ -0,0 +1,99 @@
+# heuristics.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the per-cell heuristic table used by the table modes of greedy and A*.
+Instead of looping over every objective for every state pushed, the distance from each cell to
+its nearest remaining objective is computed once for the whole grid and then read with one lookup.
+When an objective is consumed only the cells it was nearest to are recomputed.
+"""
+
+"""
+Value of a cell that no remaining objective can be reached from (exact tables), or of every cell once none remain
+"""
+NO_PATH = 1 << 30
+
+
+class HeuristicTable:
+    """The minimum distance from every cell to the remaining objectives
+
+        Attributes:
+            cols: number of columns of the maze, cell id = row * cols + col
+            exact: False for Manhattan distances, True for exact maze distances (wavefront BFS per objective)
+            objectives: the (row, col) objectives, in the order given
+            values: NumPy int32 array indexed by flat cell id
+            lookup: memoryview of values, whose items are plain ints, for the executors to index per push
+            owner: NumPy int32 array, the index in objectives of the nearest remaining objective of each cell
+
+        Exact tables keep one int32 distance field per objective (4 bytes per cell per objective) so that
+        consume() can take the minimum over the remaining ones without another BFS.
+    """
+
+    def __init__(self, maze, objectives, exact=False):
+        """Return a HeuristicTable over every cell of maze"""
+        import numpy as np
+
+        rows, cols = maze.getDimensions()
+        self.cols = cols
+        self.exact = exact
+        self.objectives = list(objectives)
+        self.__remaining = list(range(len(self.objectives)))
+        if exact:
+            from wavefront import distanceGrid
+            self.__fields = []
+            for objective in self.objectives:
+                field = distanceGrid(maze, [objective]).ravel()
+                field[field < 0] = NO_PATH
+                self.__fields.append(field)
+        else:
+            self.__rows = np.repeat(np.arange(rows, dtype=np.int32), cols)
+            self.__cols = np.tile(np.arange(cols, dtype=np.int32), rows)
+        self.values, self.owner = self.__minimum(np.arange(rows * cols))
+        self.lookup = memoryview(self.values)
+
+    def value(self, position):
+        """Heuristic value of a (row, col) position"""
+        return self.lookup[position[0] * self.cols + position[1]]
+
+    def consume(self, objective):
+        """
+        Drops an objective and recomputes the cells for which it was the nearest
+        :param objective: (row, col), ignored if it is not one of the remaining objectives
+        :return: number of cells recomputed
+        """
+        import numpy as np
+
+        if objective not in self.objectives:
+            return 0
+        index = self.objectives.index(objective)
+        if index not in self.__remaining:
+            return 0
+        self.__remaining.remove(index)
+        cells = np.flatnonzero(self.owner == index)
+        values, owner = self.__minimum(cells)
+        self.values[cells] = values
+        self.owner[cells] = owner
+        return len(cells)
+
+    def __minimum(self, cells):
+        import numpy as np
+
+        values = np.full(len(cells), NO_PATH, dtype=np.int32)
+        owner = np.full(len(cells), -1, dtype=np.int32)
+        if not self.exact:
+            rows, cols = self.__rows[cells], self.__cols[cells]
+        for index in self.__remaining:
+            if self.exact:
+                field = self.__fields[index][cells]
+            else:
+                row, col = self.objectives[index]
+                field = np.abs(rows - row)
+                field += np.abs(cols - col)
+            better = field < values
+            values[better] = field[better]
+            owner[better] = index
+        return values, owner
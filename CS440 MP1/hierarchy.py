@@ -0,0 +1,383 @@
+# hierarchy.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains hierarchical path-finding A* (HPA*).
+The maze is cut into square clusters of CLUSTER_SIZE cells a side. Wherever open cells face each other across
+the border of two clusters there is an entrance: a run of such pairs shorter than ENTRANCE_SPLIT gets one
+pair of entrance nodes in its middle, a longer run one at each end. The abstract graph has an edge of length 1
+across every entrance and, inside every cluster, an edge between each two of its entrance nodes weighted with the
+distance between them without leaving the cluster. Those distances are found for every cluster at once by a NumPy
+BFS that may not cross a cluster border, one BFS per rank of entrance node within its cluster.
+A query joins the start and the objectives to the nodes of their clusters, runs A* over the abstract graph and
+refines each abstract edge back into cells with a BFS inside one cluster, so its cost depends on the path length
+and the cluster size rather than on the size of the maze. The paths are near-optimal, not optimal: a path is
+only as short as the entrances it has to go through allow.
+Building the graph is the expensive part, so clusterGraph() keeps it in CACHE_DIR, in a NumPy .npz file named
+after the SHA-256 of the maze file and the cluster size, and later queries on the same maze file load it instead.
+"""
+
+import os
+
+from frontier import IndexedHeap
+import observers
+
+"""
+Rows and columns of cells in a cluster
+"""
+CLUSTER_SIZE = 16
+
+"""
+Runs of facing open cells at least this long get an entrance at each end, shorter ones one in the middle
+"""
+ENTRANCE_SPLIT = 6
+
+"""
+Directory the abstract graphs are cached in, relative to the working directory
+"""
+CACHE_DIR = "hpa_cache"
+
+"""
+Version of the cache file layout; files of another version are built again
+"""
+CACHE_FORMAT = 1
+
+
+def borderEntrances(both, size):
+    """
+    Entrances along a set of parallel cluster borders
+    :param both: borders x length bool NumPy array, True where the cells on both sides of the border are open
+    :param size: cluster size; a run is cut where it passes from one cluster to the next along the border
+    :return: border index, position along the border - int NumPy arrays, one entry per entrance
+    """
+    import numpy as np
+
+    position = np.arange(both.shape[1])
+    previous = np.zeros_like(both)
+    previous[:, 1:] = both[:, :-1]
+    following = np.zeros_like(both)
+    following[:, :-1] = both[:, 1:]
+    border, first = np.nonzero(both & (~previous | (position % size == 0)))
+    _, last = np.nonzero(both & (~following | (position % size == size - 1)))
+    long = last - first + 1 >= ENTRANCE_SPLIT
+    borders = np.concatenate([border, border[long]])
+    positions = np.concatenate([np.where(long, first, (first + last) // 2), last[long]])
+    return borders, positions
+
+
+class ClusterGraph:
+    """The abstract graph of a maze cut into clusters, built by build() or read back by load()
+
+        Attributes:
+            clusterSize: rows and columns of cells in a cluster
+            clusterCols: number of clusters across the maze; cluster (r, c) has id r * clusterCols + c
+            nodes: sorted int64 NumPy array of the flat cell ids of the entrance nodes; nodes are
+                   referred to by their index in it
+            offsets, targets, costs: the edges in CSR form, targets[offsets[i]:offsets[i + 1]] being the nodes that
+                                     node i has an edge to and costs the lengths of those edges
+            clusterOffsets, clusterNodes: the nodes of cluster c are
+                                          clusterNodes[clusterOffsets[c]:clusterOffsets[c + 1]]
+    """
+
+    def __init__(self, maze, clusterSize=CLUSTER_SIZE):
+        """Return an empty ClusterGraph of maze"""
+        self.maze = maze
+        self.clusterSize = clusterSize
+        self.clusterCols = -(-maze.getDimensions()[1] // clusterSize)
+        self.nodes = None
+        self.offsets = None
+        self.targets = None
+        self.costs = None
+        self.clusterOffsets = None
+        self.clusterNodes = None
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def clusterOf(self, position):
+        """Id of the cluster a (row, col) position lies in"""
+        return position[0] // self.clusterSize * self.clusterCols + position[1] // self.clusterSize
+
+    def build(self):
+        """
+        Finds the entrances and the distances between the entrance nodes of every cluster
+        :return: self
+        """
+        import numpy as np
+
+        size = self.clusterSize
+        open_mask = self.maze.openMask()
+        rows, cols = open_mask.shape
+        cluster_count = -(-rows // size) * self.clusterCols
+
+        border_cols = np.arange(size, cols, size)
+        border, row = borderEntrances((open_mask[:, border_cols - 1] & open_mask[:, border_cols]).T, size)
+        vertical = row * cols + border_cols[border]
+        border_rows = np.arange(size, rows, size)
+        border, col = borderEntrances(open_mask[border_rows - 1, :] & open_mask[border_rows, :], size)
+        horizontal = border_rows[border] * cols + col
+        first = np.concatenate([vertical - 1, horizontal - cols]).astype(np.int64)
+        second = np.concatenate([vertical, horizontal]).astype(np.int64)
+        nodes = np.unique(np.concatenate([first, second]))
+        first = np.searchsorted(nodes, first)
+        second = np.searchsorted(nodes, second)
+        sources, targets, costs = [first, second], [second, first], [np.ones(2 * first.size, dtype=np.int64)]
+
+        node_rows, node_cols = np.divmod(nodes, cols)
+        node_cluster = node_rows // size * self.clusterCols + node_cols // size
+        cluster_nodes = np.argsort(node_cluster, kind='stable')
+        cluster_offsets = np.searchsorted(node_cluster[cluster_nodes], np.arange(cluster_count + 1))
+        rank = np.empty(nodes.size, dtype=np.int64)
+        rank[cluster_nodes] = np.arange(nodes.size) - cluster_offsets[node_cluster[cluster_nodes]]
+        cluster_sizes = np.diff(cluster_offsets)
+
+        # the padded grid labels every open cell with its cluster and everything else with -1, so one comparison
+        # keeps the BFS off walls and inside the cluster it started in
+        width = cols + 2
+        label = np.full((rows + 2, width), -1, dtype=np.int64)
+        cell_cluster = (np.arange(rows) // size)[:, None] * self.clusterCols + (np.arange(cols) // size)[None, :]
+        label[1:-1, 1:-1] = np.where(open_mask, cell_cluster, -1)
+        label = label.ravel()
+        padded = (node_rows + 1) * width + node_cols + 1
+        steps = np.array([width, -width, 1, -1])
+        distance = np.empty(label.size, dtype=np.int32)
+        for k in range(int(rank.max()) + 1 if nodes.size else 0):
+            distance.fill(-1)
+            frontier = padded[rank == k]
+            distance[frontier] = 0
+            depth = 0
+            while frontier.size:
+                depth += 1
+                neighbours = (frontier[:, None] + steps).ravel()
+                neighbours = neighbours[(label[neighbours] == np.repeat(label[frontier], 4)) &
+                                        (distance[neighbours] < 0)]
+                frontier = np.unique(neighbours)
+                distance[frontier] = depth
+            partners = np.flatnonzero((cluster_sizes[node_cluster] > k) & (rank != k))
+            lengths = distance[padded[partners]]
+            reached = lengths > 0
+            sources.append(cluster_nodes[cluster_offsets[node_cluster[partners[reached]]] + k])
+            targets.append(partners[reached])
+            costs.append(lengths[reached].astype(np.int64))
+
+        sources = np.concatenate(sources)
+        targets = np.concatenate(targets)
+        order = np.lexsort((targets, sources))
+        self.nodes = nodes
+        self.offsets = np.searchsorted(sources[order], np.arange(nodes.size + 1)).astype(np.int64)
+        self.targets = targets[order].astype(np.int32)
+        self.costs = np.concatenate(costs)[order].astype(np.int32)
+        self.clusterOffsets = cluster_offsets.astype(np.int64)
+        self.clusterNodes = cluster_nodes.astype(np.int32)
+        return self
+
+    def save(self, filename):
+        """Writes the graph to a .npz file through a temporary file, so a reader never sees a partial one"""
+        import numpy as np
+
+        temporary = filename + ".tmp"
+        with open(temporary, 'wb') as f:
+            np.savez(f, format=CACHE_FORMAT, clusterSize=self.clusterSize, nodes=self.nodes, offsets=self.offsets,
+                     targets=self.targets, costs=self.costs, clusterOffsets=self.clusterOffsets,
+                     clusterNodes=self.clusterNodes)
+        os.replace(temporary, filename)
+
+    def load(self, filename):
+        """
+        Reads a graph written by save()
+        :param filename:
+        :return: self, or None if the file has another layout version or cluster size
+        """
+        import numpy as np
+
+        with np.load(filename) as arrays:
+            if int(arrays["format"]) != CACHE_FORMAT or int(arrays["clusterSize"]) != self.clusterSize:
+                return None
+            for name in ("nodes", "offsets", "targets", "costs", "clusterOffsets", "clusterNodes"):
+                setattr(self, name, arrays[name])
+        return self
+
+    def __localSearch(self, source, target=None):
+        # BFS from source that does not leave its cluster; stops once target is found
+        maze = self.maze
+        size = self.clusterSize
+        top, left = source[0] // size * size, source[1] // size * size
+        distance = {source: 0}
+        parent = {}
+        frontier = [source]
+        num_states_explored = 0
+        while frontier and target not in distance:
+            next_frontier = []
+            for current in frontier:
+                num_states_explored += 1
+                for neighbor in maze.getNeighbors(current[0], current[1]):
+                    inside = top <= neighbor[0] < top + size and left <= neighbor[1] < left + size
+                    if inside and neighbor not in distance:
+                        distance[neighbor] = distance[current] + 1
+                        parent[neighbor] = current
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return distance, parent, num_states_explored
+
+    def findPath(self, start, goals):
+        """
+        HPA* from start to the nearest of goals, as far as the abstract graph can tell
+        :param start: (row, col)
+        :param goals: list of (row, col)
+        :return: path ([] if no goal is reachable), num_states_explored (abstract nodes expanded plus the cells
+                 the searches inside clusters expanded)
+        """
+        observer = observers.attached
+        if observer is not None:
+            observer.on_phase("search")
+        maze = self.maze
+        cols = maze.getDimensions()[1]
+        nodes = memoryview(self.nodes)
+        offsets = memoryview(self.offsets)
+        targets = memoryview(self.targets)
+        costs = memoryview(self.costs)
+        cluster_offsets = memoryview(self.clusterOffsets)
+        cluster_nodes = memoryview(self.clusterNodes)
+        count = len(self.nodes)
+        start_id = count
+        goals = [goal for goal in goals if maze.isValidMove(goal[0], goal[1])]
+        if not maze.isValidMove(start[0], start[1]):
+            goals = []
+
+        def position(node):
+            return start if node == start_id else goals[node - count - 1] if node > count else divmod(nodes[node], cols)
+
+        def clusterMembers(cell):
+            cluster = self.clusterOf(cell)
+            return cluster_nodes[cluster_offsets[cluster]:cluster_offsets[cluster + 1]]
+
+        # the start and the goals join the graph as extra nodes, with edges to the nodes of their clusters
+        num_states_explored = 0
+        extra = {start_id: []}
+        goal_parents = []
+        if goals:
+            start_distance, start_parent, explored = self.__localSearch(start)
+            num_states_explored += explored
+            for node in clusterMembers(start):
+                if position(node) in start_distance:
+                    extra[start_id].append((node, start_distance[position(node)]))
+            for index, goal in enumerate(goals):
+                if goal in start_distance:
+                    extra[start_id].append((count + 1 + index, start_distance[goal]))
+                goal_distance, goal_parent, explored = self.__localSearch(goal)
+                num_states_explored += explored
+                goal_parents.append(goal_parent)
+                for node in clusterMembers(goal):
+                    if position(node) in goal_distance:
+                        extra.setdefault(node, []).append((count + 1 + index, goal_distance[position(node)]))
+
+        def heuristic(node):
+            row, col = position(node)
+            return min(abs(row - goal[0]) + abs(col - goal[1]) for goal in goals)
+
+        frontier = IndexedHeap()
+        parent_map = {}
+        g_score = {start_id: 0}
+        closed = set()
+        reached = None
+        if goals:
+            start_heuristic = heuristic(start_id)
+            frontier.push(start_id, (start_heuristic, start_heuristic), start)
+            if observer is not None:
+                observer.on_push(start, (start_heuristic, start_heuristic), len(frontier))
+        while frontier:
+            node, cell, priority = frontier.pop()
+            if observer is not None:
+                observer.on_pop(cell, priority, len(frontier))
+            closed.add(node)
+            num_states_explored += 1
+            if node > count:
+                reached = node
+                if observer is not None:
+                    observer.on_goal(cell)
+                break
+            edges = [] if node == start_id else [(targets[index], costs[index])
+                                                 for index in range(offsets[node], offsets[node + 1])]
+            edges.extend(extra.get(node, ()))
+            if observer is not None:
+                observer.on_expand(cell, [position(target) for target, _ in edges])
+            for target, cost in edges:
+                target_cost = g_score[node] + cost
+                if target in closed or target_cost >= g_score.get(target, target_cost + 1):
+                    if observer is not None:
+                        observer.on_stale(position(target))
+                    continue
+                g_score[target] = target_cost
+                parent_map[target] = node
+                target_heuristic = heuristic(target)
+                target_priority = (target_cost + target_heuristic, target_heuristic)
+                frontier.push(target, target_priority, position(target))
+                if observer is not None:
+                    observer.on_push(position(target), target_priority, len(frontier))
+        path = []
+        if reached is not None:
+            if observer is not None:
+                observer.on_phase("reconstruct")
+            abstract = [reached]
+            while abstract[-1] != start_id:
+                abstract.append(parent_map[abstract[-1]])
+            abstract.reverse()
+            path = [start]
+            for node, target in zip(abstract, abstract[1:]):
+                cell, end = position(node), position(target)
+                if target > count:
+                    # goal searches grew from the goal, so their parents lead towards it
+                    goal_parent = goal_parents[target - count - 1]
+                    while cell != end:
+                        cell = goal_parent[cell]
+                        path.append(cell)
+                    continue
+                if node == start_id:
+                    segment_parent = start_parent
+                elif self.clusterOf(cell) != self.clusterOf(end):
+                    path.append(end)
+                    continue
+                else:
+                    _, segment_parent, explored = self.__localSearch(cell, end)
+                    num_states_explored += explored
+                segment = [end]
+                while segment[-1] != cell:
+                    segment.append(segment_parent[segment[-1]])
+                path.extend(reversed(segment[:-1]))
+        if observer is not None:
+            observer.on_finish()
+        return path, num_states_explored
+
+
+def cachePath(maze, clusterSize=CLUSTER_SIZE, cacheDir=CACHE_DIR):
+    """
+    :return: file the abstract graph of maze is cached in, or None if maze has no digest (setWall changed it)
+    """
+    digest = maze.getDigest()
+    if digest is None:
+        return None
+    return os.path.join(cacheDir, "%s-%d.npz" % (digest, clusterSize))
+
+
+def clusterGraph(maze, clusterSize=CLUSTER_SIZE, cacheDir=CACHE_DIR):
+    """
+    The ClusterGraph of maze, loaded from the cache if it has been built for the same maze file before,
+    otherwise built and added to the cache
+    :param maze:
+    :param clusterSize:
+    :param cacheDir: cache directory, made if missing; None to always build
+    :return: ClusterGraph
+    """
+    graph = ClusterGraph(maze, clusterSize)
+    filename = cachePath(maze, clusterSize, cacheDir) if cacheDir is not None else None
+    if filename is not None and os.path.exists(filename) and graph.load(filename) is not None:
+        return graph
+    graph.build()
+    if filename is not None:
+        os.makedirs(cacheDir, exist_ok=True)
+        graph.save(filename)
+    return graph
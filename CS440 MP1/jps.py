@@ -0,0 +1,102 @@
+# jps.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the jumps of Jump Point Search on the 4-connected, uniform-cost MP1 grids.
+Of all the shortest paths through an open stretch, only the ones that run vertically first and
+turn horizontally as late as possible are kept, so the search only has to stop (expand a state) at:
+    - a horizontal move's cell whose cell above or below opens up when the previous one was a wall
+      (a forced neighbour), or that is an objective
+    - a vertical move's cell from which a horizontal scan, left or right, reaches such a cell
+Every cell in between is stepped over without being pushed on the frontier.
+"""
+
+HORIZONTAL = ((0, -1), (0, 1))
+VERTICAL = ((-1, 0), (1, 0))
+
+
+def isOpen(maze, row, col):
+    """True if (row, col) is inside the maze and not a wall"""
+    return 0 <= row < maze.rows and 0 <= col < maze.cols and not maze.walls[row * maze.cols + col]
+
+
+def jumpHorizontal(maze, row, col, dcol, goals):
+    """
+    Steps from (row, col) along the row until the next jump point
+    :param maze:
+    :param row:
+    :param col:
+    :param dcol: -1 or 1
+    :param goals: set of (row, col) objectives
+    :return: (row, col) of the jump point, None if a wall comes first
+    """
+    while True:
+        next_col = col + dcol
+        if not isOpen(maze, row, next_col):
+            return None
+        if (row, next_col) in goals:
+            return row, next_col
+        for drow in (-1, 1):
+            if isOpen(maze, row + drow, next_col) and not isOpen(maze, row + drow, col):
+                return row, next_col
+        col = next_col
+
+
+def jumpVertical(maze, row, col, drow, goals):
+    """
+    Steps from (row, col) along the column until a cell from which a horizontal jump succeeds
+    :param maze:
+    :param row:
+    :param col:
+    :param drow: -1 or 1
+    :param goals: set of (row, col) objectives
+    :return: (row, col) of the jump point, None if a wall comes first
+    """
+    while True:
+        next_row = row + drow
+        if not isOpen(maze, next_row, col):
+            return None
+        if (next_row, col) in goals:
+            return next_row, col
+        if jumpHorizontal(maze, next_row, col, -1, goals) or jumpHorizontal(maze, next_row, col, 1, goals):
+            return next_row, col
+        row = next_row
+
+
+def jumpSuccessors(maze, position, direction, goals):
+    """
+    The jump points reachable from position, skipping the move back the way it was reached
+    :param maze:
+    :param position: (row, col) jump point
+    :param direction: (drow, dcol) of the move that reached position, None for the start
+    :param goals: set of (row, col) objectives
+    :return: list of ((row, col), (drow, dcol)) pairs
+    """
+    successors = []
+    for move in HORIZONTAL + VERTICAL:
+        if direction is not None and move == (-direction[0], -direction[1]):
+            continue
+        if move[0] == 0:
+            jump_point = jumpHorizontal(maze, position[0], position[1], move[1], goals)
+        else:
+            jump_point = jumpVertical(maze, position[0], position[1], move[0], goals)
+        if jump_point is not None:
+            successors.append((jump_point, move))
+    return successors
+
+
+def expandSegment(a, b):
+    """
+    The cells of the straight move from a to b, without a
+    :param a: (row, col)
+    :param b: (row, col) in the same row or column as a
+    :return: list of (row, col) tuples ending at b
+    """
+    drow = (b[0] > a[0]) - (b[0] < a[0])
+    dcol = (b[1] > a[1]) - (b[1] < a[1])
+    length = abs(b[0] - a[0]) + abs(b[1] - a[1])
+    return [(a[0] + drow * step, a[1] + dcol * step) for step in range(1, length + 1)]
@@ -0,0 +1,185 @@
+# landmarks.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the landmark (ALT: A*, landmarks, triangle inequality) heuristic.
+A few landmark cells are picked far apart and the exact maze distance from each of them to every cell is kept.
+For any landmark L the triangle inequality gives |d(L, a) - d(L, b)| <= d(a, b), so the largest of those
+differences over the landmarks is an admissible and consistent estimate of the distance between a and b. Behind a
+long detour, where the Manhattan distance says almost nothing, a landmark beyond the goal sees most of it.
+The distances are one int32 field per landmark (4 bytes per cell per landmark), found with the wavefront BFS, and
+are saved next to the maze file together with its SHA-256, so only the first run on a maze file pays for them.
+"""
+
+import os
+
+from distances import UNREACHABLE
+from heuristics import NO_PATH
+
+"""
+Number of landmarks picked
+"""
+LANDMARK_COUNT = 8
+
+"""
+Suffix of the file the landmark distances of a maze file are saved in, next to it
+"""
+LANDMARK_SUFFIX = ".landmarks.npz"
+
+
+class Landmarks:
+    """Landmark cells and the exact maze distance from each to every cell
+
+        Attributes:
+            count: number of landmarks asked for
+            cells: list of the flat ids of the landmarks, fewer than count if the maze has fewer open cells
+            distances: landmarks x cells int32 NumPy array, UNREACHABLE (-1) where a landmark does not reach
+    """
+
+    def __init__(self, maze, count=LANDMARK_COUNT):
+        """Return an empty Landmarks for maze"""
+        self.maze = maze
+        self.count = count
+        self.cells = None
+        self.distances = None
+
+    def build(self):
+        """
+        Picks the landmarks by farthest-point selection: the first is the cell farthest from the first open cell,
+        and each next one the cell farthest from all landmarks so far, any cell none of them reaches coming first,
+        so every part of the maze that is cut off from the rest gets a landmark while there are some left
+        :return: self
+        """
+        import numpy as np
+        from wavefront import distanceGrid
+
+        maze = self.maze
+        cols = maze.getDimensions()[1]
+        open_cells = maze.openMask().ravel()
+        cells = []
+        fields = []
+        if open_cells.any():
+            seed = int(np.argmax(open_cells))
+            nearest = distanceGrid(maze, [divmod(seed, cols)]).ravel().astype(np.int64)
+            while len(cells) < min(self.count, int(open_cells.sum())):
+                unreached = open_cells & (nearest == UNREACHABLE)
+                if len(cells) and unreached.any():
+                    cell = int(np.argmax(unreached))
+                else:
+                    cell = int(np.argmax(np.where(open_cells, nearest, -1)))
+                field = distanceGrid(maze, [divmod(cell, cols)]).ravel()
+                cells.append(cell)
+                fields.append(field)
+                if len(cells) == 1:
+                    nearest = field.astype(np.int64)
+                else:
+                    reached = field != UNREACHABLE
+                    nearest = np.where(reached & ((nearest == UNREACHABLE) | (field < nearest)), field, nearest)
+        self.cells = cells
+        self.distances = np.array(fields, dtype=np.int32).reshape(len(fields), open_cells.size)
+        return self
+
+    def save(self, filename):
+        """Writes the landmarks and the maze's digest to a .npz file through a temporary file"""
+        import numpy as np
+
+        temporary = filename + ".tmp"
+        with open(temporary, 'wb') as f:
+            np.savez(f, digest=self.maze.getDigest(), count=self.count, cells=np.array(self.cells, dtype=np.int64),
+                     distances=self.distances)
+        os.replace(temporary, filename)
+
+    def load(self, filename):
+        """
+        Reads landmarks written by save()
+        :param filename:
+        :return: self, or None if they were saved for another maze file or landmark count
+        """
+        import numpy as np
+
+        with np.load(filename) as arrays:
+            if str(arrays["digest"]) != self.maze.getDigest() or int(arrays["count"]) != self.count:
+                return None
+            self.cells = [int(cell) for cell in arrays["cells"]]
+            self.distances = arrays["distances"]
+        return self
+
+
+def landmarkPath(maze):
+    """:return: file the landmarks of maze are saved in, or None if maze has no digest (setWall changed it)"""
+    if maze.getDigest() is None:
+        return None
+    return maze.getFilename() + LANDMARK_SUFFIX
+
+
+def loadLandmarks(maze, count=LANDMARK_COUNT):
+    """
+    The Landmarks of maze, read from next to the maze file if they have been saved for the same file contents,
+    otherwise built and saved there
+    :param maze:
+    :param count:
+    :return: Landmarks
+    """
+    landmarks = Landmarks(maze, count)
+    filename = landmarkPath(maze)
+    if filename is not None and os.path.exists(filename) and landmarks.load(filename) is not None:
+        return landmarks
+    landmarks.build()
+    if filename is not None:
+        landmarks.save(filename)
+    return landmarks
+
+
+class LandmarkBound:
+    """The landmark lower bound on the distance from every cell to the nearest remaining objective, read like a
+    HeuristicTable by astar_executor (lookup[cell id]) but computed when a cell is looked up
+
+        Attributes:
+            cols: number of columns of the maze, cell id = row * cols + col
+            exact: False; like a Manhattan table, the executors weight it when there are more than two objectives
+            lookup: self, indexed by flat cell id
+    """
+
+    def __init__(self, landmarks, objectives):
+        """Return the bound towards objectives, (row, col) tuples"""
+        self.cols = landmarks.maze.getDimensions()[1]
+        self.exact = False
+        self.lookup = self
+        self.__fields = [memoryview(field) for field in landmarks.distances]
+        self.__goals = []
+        for objective in objectives:
+            goal = objective[0] * self.cols + objective[1]
+            self.__goals.append((objective, [field[goal] for field in self.__fields]))
+
+    def __getitem__(self, cellId):
+        row, col = divmod(cellId, self.cols)
+        fields = self.__fields
+        best = NO_PATH
+        for objective, goal_distances in self.__goals:
+            bound = abs(row - objective[0]) + abs(col - objective[1])
+            for field, goal_distance in zip(fields, goal_distances):
+                distance = field[cellId]
+                if distance >= 0 and goal_distance >= 0 and abs(distance - goal_distance) > bound:
+                    bound = abs(distance - goal_distance)
+            if bound < best:
+                best = bound
+        return best
+
+    def value(self, position):
+        """Bound at a (row, col) position"""
+        return self[position[0] * self.cols + position[1]]
+
+    def consume(self, objective):
+        """
+        Drops an objective
+        :param objective: (row, col), ignored if it is not one of the remaining objectives
+        :return: number of objectives dropped
+        """
+        remaining = [goal for goal in self.__goals if goal[0] != objective]
+        dropped = len(self.__goals) - len(remaining)
+        self.__goals = remaining
+        return dropped
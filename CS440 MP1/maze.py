@@ -10,13 +10,110 @@
 """
 This file contains the Maze class, which reads in a maze file and creates
 a representation of the maze that is exposed through a simple interface.
+
+The maze is kept in a compact form: every cell has a flat integer id (row * cols + col)
+and walls is indexed by that id. A text maze file is streamed a row at a time into a
+bit-packed wall mask (PackedWalls, one bit per cell) while the start and objectives are
+recorded, so no per-cell Python objects are made. Mazes of up to UNPACK_LIMIT cells also
+get an unpacked bytearray copy as walls, which is faster to index; larger ones use the
+PackedWalls directly.
+
+saveBinary() writes the packed form behind a small header. Maze() recognises such a file
+by its first bytes and memory-maps it instead of reading it, so opening one takes about
+constant time and the mask is paged in from disk as the search touches it.
+
+The open neighbours of every cell can also be read in CSR form, i.e. the ids
+neighborIds[neighborOffsets[id]:neighborOffsets[id + 1]]. Those arrays take 20 bytes
+a cell, so they are built the first time they are used rather than at load.
+
+Walls can be changed after loading with setWall(). Every change is appended to a change log,
+read back with getChangesSince(), so an incremental search (dstar.py) can repair only the part
+of its state a change touches; the CSR arrays are dropped and rebuilt the next time they are used.
 """
 
-import re
 import copy
+import hashlib
+import mmap
+import struct
+from array import array
+
+"""
+Mazes with more cells than this keep their walls bit-packed only
+"""
+UNPACK_LIMIT = 1 << 24
+
+"""
+Binary maze files start with MAGIC and then HEADER: rows, cols, start row, start col (-1 if none), objective count;
+then an (row, col) int32 pair per objective, then the PackedWalls rows
+"""
+MAGIC = b'CS440MZ\x01'
+HEADER = struct.Struct('<IIiiI')
+POINT = struct.Struct('<ii')
+
+"""
+bytes.translate tables: a text row to '1' (wall) / '0' characters for packing, and those characters back to 1 / 0 bytes
+"""
+WALL_DIGITS = bytes(ord('1') if chr(i) == '%' else ord('0') for i in range(256))
+DIGIT_BYTES = bytes(1 if chr(i) == '1' else 0 for i in range(256))
+
+
+class PackedWalls:
+    """A wall mask with one bit per cell, indexed by flat cell id like a bytearray
+
+        Each row takes rowBytes = ceil(cols / 8) bytes and cell (row, col) is bit col % 8 of byte
+        row * rowBytes + col // 8. The bytes are a bytearray, or an mmap of a binary maze file.
+    """
+
+    def __init__(self, rows, cols, buffer=None, offset=0):
+        """Return a PackedWalls over buffer (from offset on), or an all-open one if buffer is None"""
+        self.rows = rows
+        self.cols = cols
+        self.rowBytes = (cols + 7) // 8
+        self.buffer = bytearray(rows * self.rowBytes) if buffer is None else buffer
+        self.offset = offset
+
+    def __len__(self):
+        return self.rows * self.cols
+
+    def __getitem__(self, cellId):
+        row, col = divmod(cellId, self.cols)
+        return (self.buffer[self.offset + row * self.rowBytes + (col >> 3)] >> (col & 7)) & 1
+
+    def __setitem__(self, cellId, wall):
+        """Sets (wall truthy) or clears the bit of a cell; a read-only mmap is first copied into a bytearray"""
+        if not isinstance(self.buffer, bytearray):
+            self.buffer = bytearray(self.buffer[self.offset:self.offset + self.rows * self.rowBytes])
+            self.offset = 0
+        row, col = divmod(cellId, self.cols)
+        position = self.offset + row * self.rowBytes + (col >> 3)
+        if wall:
+            self.buffer[position] |= 1 << (col & 7)
+        else:
+            self.buffer[position] &= ~(1 << (col & 7)) & 0xFF
+
+    def setRow(self, row, digits):
+        """
+        Packs one row given as a string of b'1' (wall) and b'0' characters
+        :param row:
+        :param digits: bytes of length cols
+        :return:
+        """
+        start = self.offset + row * self.rowBytes
+        self.buffer[start:start + self.rowBytes] = int(digits[::-1], 2).to_bytes(self.rowBytes, 'little')
+
+    def unpack(self):
+        """Return the mask as a bytearray with one byte (0 or 1) per cell"""
+        walls = bytearray(self.rows * self.cols)
+        for row in range(self.rows):
+            start = self.offset + row * self.rowBytes
+            bits = int.from_bytes(self.buffer[start:start + self.rowBytes], 'little')
+            digits = format(bits, '0%db' % (self.rowBytes * 8))[::-1][:self.cols]
+            walls[row * self.cols:(row + 1) * self.cols] = digits.encode().translate(DIGIT_BYTES)
+        return walls
+
 
 class Maze:
-    # Initializes the Maze object by reading the maze from a file
+    # Initializes the Maze object by reading the maze from a file, text or binary
     def __init__(self, filename):
         self.__filename = filename
         self.__wallChar = '%'
@@ -24,32 +121,150 @@ class Maze:
         self.__objectiveChar = '.'
         self.__start = None
         self.__objective = []
+        self.__neighborOffsets = None
+        self.__neighborIds = None
+        self.__changes = []
+        self.__digest = None
 
-        with open(filename) as f:
-            lines = f.readlines()
-
-        lines = list(filter(lambda x: not re.match(r'^\s*$', x), lines))
-        lines = [list(line.strip('\n')) for line in lines]
+        with open(filename, 'rb') as f:
+            if f.read(len(MAGIC)) == MAGIC:
+                self.__mapBinary(f)
+            else:
+                f.seek(0)
+                self.__streamText(f)
 
-        self.rows = len(lines)
-        self.cols = len(lines[0])
-        self.mazeRaw = lines
+        if self.rows * self.cols <= UNPACK_LIMIT:
+            self.walls = self.packedWalls.unpack()
+        else:
+            self.walls = self.packedWalls
 
-        if (len(self.mazeRaw) != self.rows) or (len(self.mazeRaw[0]) != self.cols):
+    # Reads a text maze a row at a time, skipping blank lines, into the packed mask
+    def __streamText(self, f):
+        start_byte = ord(self.__startChar)
+        objective_byte = ord(self.__objectiveChar)
+        rows = []
+        self.cols = None
+        for line in f:
+            line = line.rstrip(b'\r\n')
+            if not line.strip():
+                continue
+            if self.cols is None:
+                self.cols = len(line)
+            if len(line) != self.cols:
+                print("Maze dimensions incorrect")
+                raise SystemExit
+            row = len(rows)
+            column = line.find(start_byte)
+            while column != -1:
+                self.__start = (row, column)
+                column = line.find(start_byte, column + 1)
+            column = line.find(objective_byte)
+            while column != -1:
+                self.__objective.append((row, column))
+                column = line.find(objective_byte, column + 1)
+            rows.append(int(line.translate(WALL_DIGITS)[::-1], 2).to_bytes((self.cols + 7) // 8, 'little'))
+        if self.cols is None:
             print("Maze dimensions incorrect")
             raise SystemExit
-            return
+        self.rows = len(rows)
+        self.packedWalls = PackedWalls(self.rows, self.cols, bytearray(b''.join(rows)))
+
+    # Memory-maps a file written by saveBinary; only the header and objectives are read now
+    def __mapBinary(self, f):
+        self.rows, self.cols, start_row, start_col, num_objectives = HEADER.unpack(f.read(HEADER.size))
+        if start_row >= 0:
+            self.__start = (start_row, start_col)
+        points = f.read(POINT.size * num_objectives)
+        self.__objective = [POINT.unpack_from(points, POINT.size * i) for i in range(num_objectives)]
+        offset = len(MAGIC) + HEADER.size + POINT.size * num_objectives
+        self.__mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.packedWalls = PackedWalls(self.rows, self.cols, self.__mapped, offset)
+
+    # Writes the maze in the binary format, which Maze() memory-maps when it is given that file
+    def saveBinary(self, filename):
+        packed = self.packedWalls
+        start = self.__start if self.__start is not None else (-1, -1)
+        with open(filename, 'wb') as f:
+            f.write(MAGIC)
+            f.write(HEADER.pack(self.rows, self.cols, start[0], start[1], len(self.__objective)))
+            for objective in self.__objective:
+                f.write(POINT.pack(objective[0], objective[1]))
+            f.write(packed.buffer[packed.offset:packed.offset + self.rows * packed.rowBytes])
+
+    # Returns the name of the file the maze was read from
+    def getFilename(self):
+        return self.__filename
+
+    # Returns the SHA-256 hex digest of the maze file, to key caches of work done on its walls by;
+    # None once setWall has changed the maze, as the file no longer describes it
+    def getDigest(self):
+        if self.__changes:
+            return None
+        if self.__digest is None:
+            digest = hashlib.sha256()
+            with open(self.__filename, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            self.__digest = digest.hexdigest()
+        return self.__digest
+
+    # Builds the CSR neighbour arrays, in the same order getNeighbors returns them
+    def __buildAdjacency(self):
+        rows, cols, walls = self.rows, self.cols, self.walls
+        offsets = array('i', [0])
+        ids = array('i')
+        for row in range(rows):
+            base = row * cols
+            for col in range(cols):
+                cell = base + col
+                if row + 1 < rows and not walls[cell + cols]:
+                    ids.append(cell + cols)
+                if row > 0 and not walls[cell - cols]:
+                    ids.append(cell - cols)
+                if col + 1 < cols and not walls[cell + 1]:
+                    ids.append(cell + 1)
+                if col > 0 and not walls[cell - 1]:
+                    ids.append(cell - 1)
+                offsets.append(len(ids))
+        self.__neighborOffsets = offsets
+        self.__neighborIds = ids
 
-        for row in range(len(self.mazeRaw)):
-            for col in range(len(self.mazeRaw[0])):
-                if self.mazeRaw[row][col] == self.__startChar:
-                    self.__start = (row, col)
-                elif self.mazeRaw[row][col] == self.__objectiveChar:
-                    self.__objective.append((row, col))
+    @property
+    def neighborOffsets(self):
+        if self.__neighborOffsets is None:
+            self.__buildAdjacency()
+        return self.__neighborOffsets
+
+    @property
+    def neighborIds(self):
+        if self.__neighborIds is None:
+            self.__buildAdjacency()
+        return self.__neighborIds
+
+    # Makes the given position a wall (or opens it) and logs the change; returns False if it already was one
+    def setWall(self, row, col, wall=True):
+        cell = row * self.cols + col
+        if self.walls[cell] == bool(wall):
+            return False
+        self.packedWalls[cell] = wall
+        if self.walls is not self.packedWalls:
+            self.walls[cell] = 1 if wall else 0
+        self.__neighborOffsets = None
+        self.__neighborIds = None
+        self.__changes.append((row, col))
+        return True
+
+    # Returns the number of wall changes made so far, to pass to getChangesSince later
+    def getVersion(self):
+        return len(self.__changes)
+
+    # Returns the (row, column) of every wall change made after the given version, oldest first
+    def getChangesSince(self, version):
+        return self.__changes[version:]
 
     # Returns True if the given position is the location of a wall
     def isWall(self, row, col):
-        return self.mazeRaw[row][col] == self.__wallChar
+        return self.walls[row * self.cols + col] == 1
 
     # Rturns True if the given position is the location of an objective
     def isObjective(self, row, col):
@@ -75,18 +290,41 @@ class Maze:
 
     # Check if the agent can move into a specific row and column
     def isValidMove(self, row, col):
-        return row >= 0 and row < self.rows and col >= 0 and col < self.cols and not self.isWall(row, col)
-        
+        return row >= 0 and row < self.rows and col >= 0 and col < self.cols and not self.walls[row * self.cols + col]
+
+    # Returns a rows x cols NumPy bool array that is True on every open cell, for the vectorised searches
+    def openMask(self):
+        import numpy as np
+        packed = self.packedWalls
+        buffer = np.frombuffer(packed.buffer, dtype=np.uint8, count=self.rows * packed.rowBytes, offset=packed.offset)
+        bits = np.unpackbits(buffer.reshape(self.rows, packed.rowBytes), axis=1, bitorder='little')
+        return bits[:, :self.cols] == 0
+
+    # Returns the flat id of the given position
+    def getCellId(self, row, col):
+        return row * self.cols + col
+
+    # Returns the (row, column) tuple of the given flat id
+    def getPosition(self, cellId):
+        return divmod(cellId, self.cols)
+
+    # Returns the flat ids of the open cells next to the given flat id
+    def getNeighborIds(self, cellId):
+        return self.neighborIds[self.neighborOffsets[cellId]:self.neighborOffsets[cellId + 1]]
+
     # Returns list of neighboing squares that can be moved to from the given row,col
     def getNeighbors(self, row, col):
-        possibleNeighbors = [
-            (row + 1, col),
-            (row - 1, col),
-            (row, col + 1),
-            (row, col - 1)
-        ]
+        rows, cols, walls = self.rows, self.cols, self.walls
+        if row < 0 or row >= rows or col < 0 or col >= cols:
+            return []
+        cell = row * cols + col
         neighbors = []
-        for r, c in possibleNeighbors:
-            if self.isValidMove(r,c):
-                neighbors.append((r,c))
-        return neighbors
\ No newline at end of file
+        if row + 1 < rows and not walls[cell + cols]:
+            neighbors.append((row + 1, col))
+        if row > 0 and not walls[cell - cols]:
+            neighbors.append((row - 1, col))
+        if col + 1 < cols and not walls[cell + 1]:
+            neighbors.append((row, col + 1))
+        if col > 0 and not walls[cell - 1]:
+            neighbors.append((row, col - 1))
+        return neighbors
@@ -11,17 +11,29 @@
 This file contains the main application that is run for this MP. It
 initializes the pygame context, and handles the interface between the
 game and the search algorithm.
+pygame is only imported once something is drawn, so --headless runs (and
+batch.py, which imports nothing from here) work without it. A solution saved
+with --save is rendered off-screen by render.py, without pygame or a window.
 """
 
-import pygame
 import sys
 import argparse
 import time
 
-from pygame.locals import *
-from agent import Agent
 from maze import Maze
-from search import search
+from search import search, frontierStats
+
+pygame = None
+
+
+def loadPygame():
+    """Imports pygame into this module on first use and returns it"""
+    global pygame
+    if pygame is None:
+        import pygame as module
+        pygame = module
+    return pygame
+
 
 class Application:
     def __init__(self, human=True, scale=20, fps=30):
@@ -46,22 +58,45 @@ class Application:
         self.blockSizeY = int(self.windowHeight / self.gridDim[0])
 
         if self.__human:
+            from agent import Agent
             self.agentRadius = min(self.blockSizeX, self.blockSizeY) / 4
             self.agent = Agent(self.maze.getStart(), self.maze, self.blockSizeX, self.blockSizeY)
 
+    # Runs the search and prints the results, without drawing anything
+    def solve(self, searchMethod):
+        path, statesExplored = search(self.maze, searchMethod)
+        print("Results")
+        print("Path Length:", len(path))
+        print("States Explored:", statesExplored)
+        print("Stale Pops Avoided:", frontierStats["stale_pops_avoided"])
+        print("Peak Frontier Size:", frontierStats["peak_frontier_size"])
+        return path
+
     # Once the application is initiated, execute is in charge of drawing the game and dealing with the game loop
-    def execute(self, filename, searchMethod, save):
+    # With headless set it only runs the search and prints the results, and with save set (and no human
+    # player) it writes the solution to a PNG file off-screen instead of opening a window
+    def execute(self, filename, searchMethod, save, headless=False):
         self.initialize(filename)
                     
         if self.maze is None:
             print("No maze created")
             raise SystemExit
-            
+
+        if headless:
+            self.solve(searchMethod)
+            return
+
+        if save is not None and not self.__human:
+            from render import savePNG
+            savePNG(self.maze, self.solve(searchMethod), save, self.scale)
+            return
+
         if not self.__human:            
-            path, statesExplored = search(self.maze, searchMethod)            
+            path = self.solve(searchMethod)
         else:
-            path, statesExplored = [], 0
+            path = []
 
+        loadPygame()
         pygame.init()
         self.displaySurface = pygame.display.set_mode((self.windowWidth, self.windowHeight), pygame.HWSURFACE)
         self.displaySurface.fill((255, 255, 255))
@@ -71,9 +106,6 @@ class Application:
         if self.__human:
             self.drawPlayer()
         else:
-            print("Results")
-            print("Path Length:", len(path))
-            print("States Explored:", statesExplored)
             self.drawPath(path)
             
         self.drawMaze()
@@ -92,20 +124,20 @@ class Application:
             keys = pygame.key.get_pressed()            
             clock.tick(self.fps)
 
-            if (keys[K_ESCAPE]):
+            if (keys[pygame.K_ESCAPE]):
                     raise SystemExit
 
             if self.__human:
-                if (keys[K_RIGHT]):
+                if (keys[pygame.K_RIGHT]):
                     self.agent.moveRight()
 
-                if (keys[K_LEFT]):
+                if (keys[pygame.K_LEFT]):
                     self.agent.moveLeft()
 
-                if (keys[K_UP]):
+                if (keys[pygame.K_UP]):
                     self.agent.moveUp()
 
-                if (keys[K_DOWN]):
+                if (keys[pygame.K_DOWN]):
                     self.agent.moveDown()                        
 
                 self.gameLoop()                
@@ -175,7 +207,9 @@ if __name__ == "__main__":
     parser.add_argument('filename',
                         help='path to maze file [REQUIRED]')
     parser.add_argument('--method', dest="search", type=str, default = "bfs", 
-                        choices = ["bfs", "dfs", "greedy", "astar"],
+                        choices = ["bfs", "dfs", "greedy", "astar", "greedy_table", "astar_table", "astar_exact",
+                                   "alt", "idastar", "smastar", "arastar", "junction", "junction_dijkstra", "dstar",
+                                   "hpastar", "astar_mst", "tsp", "jps", "bibfs", "biastar"],
                         help='search method - default bfs')
     parser.add_argument('--scale', dest="scale", type=int, default = 20,
                         help='scale - default: 20')
@@ -184,9 +218,11 @@ if __name__ == "__main__":
     parser.add_argument('--human', default = False, action = "store_true",
                         help='flag for human playable - default False')
     parser.add_argument('--save', dest="save", type=str, default = None, 
-                        help='save output to image file - default not saved')
+                        help='save output to a PNG file, without opening a window - default not saved')
+    parser.add_argument('--headless', default = False, action = "store_true",
+                        help='print the results without opening a window - default False')
     
 
     args = parser.parse_args()
     app = Application(args.human, args.scale, args.fps)
-    app.execute(args.filename, args.search, args.save)
+    app.execute(args.filename, args.search, args.save, args.headless)
@@ -0,0 +1,85 @@
+# mst.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the minimum spanning tree weights used by the multi-objective A* heuristic.
+"""
+
+from collections import OrderedDict
+
+DEFAULT_CAPACITY = 1 << 16
+
+
+def primWeight(matrix, nodes):
+    """
+    Weight of the minimum spanning tree over the given nodes, using Prim's algorithm on a dense matrix
+    :param matrix: square matrix of edge weights, negative meaning no edge
+    :param nodes: list of row indices of matrix
+    :return: MST weight, float('inf') if the nodes are not connected
+    """
+    if len(nodes) <= 1:
+        return 0
+    remaining = list(nodes[1:])
+    best = {node: matrix[nodes[0]][node] for node in remaining}
+    total = 0
+    while remaining:
+        node = None
+        for candidate in remaining:
+            weight = best[candidate]
+            if weight >= 0 and (node is None or weight < best[node]):
+                node = candidate
+        if node is None:
+            return float('inf')
+        total += best[node]
+        remaining.remove(node)
+        for other in remaining:
+            weight = matrix[node][other]
+            if weight >= 0 and (best[other] < 0 or weight < best[other]):
+                best[other] = weight
+    return int(total)
+
+
+class MSTCache:
+    """MST weights over subsets of the objectives, keyed by a bitmask and evicted least recently used first
+
+        Bit j of a mask stands for row j of the matrix the cache was built with.
+
+        Attributes:
+            capacity: the most masks kept at once
+            hits: lookups answered from the cache
+            misses: lookups that had to run Prim's algorithm
+    """
+
+    def __init__(self, matrix, capacity=DEFAULT_CAPACITY):
+        """Return an empty MSTCache over a square distance matrix (a NumPy array or a list of lists)"""
+        self.__matrix = [[int(weight) for weight in row] for row in matrix]
+        self.__weights = OrderedDict()
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.__weights)
+
+    def weight(self, mask):
+        """MST weight over the objectives whose bits are set in mask"""
+        weights = self.__weights
+        if mask in weights:
+            self.hits += 1
+            weights.move_to_end(mask)
+            return weights[mask]
+        self.misses += 1
+        nodes = [j for j in range(len(self.__matrix)) if mask >> j & 1]
+        weight = primWeight(self.__matrix, nodes)
+        weights[mask] = weight
+        if len(weights) > self.capacity:
+            weights.popitem(last=False)
+        return weight
+
+    def stats(self):
+        """Return the counters as a dict"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.__weights), "capacity": self.capacity}
@@ -0,0 +1,200 @@
+# observers.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the observer interface of the search executors and the built-in collectors.
+An observer is attached with attach() and every executor reads the attached one when it starts;
+with none attached each event costs the executor one "is not None" test and nothing else.
+
+Events (SearchObserver methods):
+    on_push(state, priority, frontier_size)  state put on the frontier, or its entry lowered
+    on_pop(state, priority, frontier_size)   state taken off the frontier; frontier_size is what is left
+    on_expand(state, neighbours)             the successors of state were generated
+    on_stale(state)                          a push of state was skipped or folded into an existing entry
+    on_goal(state)                           the executor reached an objective
+    on_phase(name)                           a phase ("precompute", "search", "reconstruct") begins,
+                                             which ends the one before it
+    on_finish()                              the executor returned, ending the current phase
+Priorities are whatever the frontier orders by, and None for the FIFO / LIFO frontiers of BFS and DFS.
+"""
+
+import time
+
+"""
+The observer the executors report to, None when nothing is attached
+"""
+attached = None
+
+
+def attach(observer):
+    """
+    Makes observer receive the events of every search from now on
+    :param observer: a SearchObserver, or None to detach
+    :return: the observer that was attached before
+    """
+    global attached
+    previous = attached
+    attached = observer
+    return previous
+
+
+def detach():
+    """
+    Stops reporting events
+    :return: the observer that was attached
+    """
+    return attach(None)
+
+
+class SearchObserver:
+    """Base class of the observers, in which every event does nothing, so a collector only overrides what it needs"""
+
+    def on_push(self, state, priority, frontier_size):
+        pass
+
+    def on_pop(self, state, priority, frontier_size):
+        pass
+
+    def on_expand(self, state, neighbours):
+        pass
+
+    def on_stale(self, state):
+        pass
+
+    def on_goal(self, state):
+        pass
+
+    def on_phase(self, name):
+        pass
+
+    def on_finish(self):
+        pass
+
+
+class CounterObserver(SearchObserver):
+    """Counts the events
+
+        Attributes:
+            counts: dict from event name ("push", "pop", "expand", "stale", "goal") to how often it fired
+            neighbours: total successors generated over all the expansions
+    """
+
+    def __init__(self):
+        """Return a CounterObserver with every count at 0"""
+        self.counts = {"push": 0, "pop": 0, "expand": 0, "stale": 0, "goal": 0}
+        self.neighbours = 0
+
+    def on_push(self, state, priority, frontier_size):
+        self.counts["push"] += 1
+
+    def on_pop(self, state, priority, frontier_size):
+        self.counts["pop"] += 1
+
+    def on_expand(self, state, neighbours):
+        self.counts["expand"] += 1
+        self.neighbours += len(neighbours)
+
+    def on_stale(self, state):
+        self.counts["stale"] += 1
+
+    def on_goal(self, state):
+        self.counts["goal"] += 1
+
+
+class FrontierHistogram(SearchObserver):
+    """Histogram of the frontier size seen at every pop
+
+        Attributes:
+            bucketSize: width of a bucket; bucket b counts the pops that left b * bucketSize to
+                        (b + 1) * bucketSize - 1 states on the frontier
+            buckets: dict from bucket index to count
+            peak: the largest frontier size seen after a push
+    """
+
+    def __init__(self, bucketSize=16):
+        """Return an empty FrontierHistogram"""
+        self.bucketSize = bucketSize
+        self.buckets = {}
+        self.peak = 0
+
+    def on_push(self, state, priority, frontier_size):
+        if frontier_size > self.peak:
+            self.peak = frontier_size
+
+    def on_pop(self, state, priority, frontier_size):
+        bucket = frontier_size // self.bucketSize
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def rows(self):
+        """Return the histogram as sorted (low, high, count) tuples, high inclusive"""
+        return [(bucket * self.bucketSize, (bucket + 1) * self.bucketSize - 1, self.buckets[bucket])
+                for bucket in sorted(self.buckets)]
+
+
+class PhaseTimer(SearchObserver):
+    """Wall time spent in each phase, summed over every executor call
+
+        Attributes:
+            seconds: dict from phase name to seconds
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """Return a PhaseTimer with no phases timed"""
+        self.clock = clock
+        self.seconds = {}
+        self.__phase = None
+        self.__started = 0.0
+
+    def on_phase(self, name):
+        now = self.clock()
+        self.__close(now)
+        self.__phase = name
+        self.__started = now
+
+    def on_finish(self):
+        self.__close(self.clock())
+        self.__phase = None
+
+    def __close(self, now):
+        if self.__phase is not None:
+            self.seconds[self.__phase] = self.seconds.get(self.__phase, 0.0) + now - self.__started
+
+
+class ObserverGroup(SearchObserver):
+    """Passes every event on to each of a list of observers, so several collectors can be attached at once"""
+
+    def __init__(self, observers):
+        """Return an ObserverGroup over the given observers"""
+        self.observers = list(observers)
+
+    def on_push(self, state, priority, frontier_size):
+        for observer in self.observers:
+            observer.on_push(state, priority, frontier_size)
+
+    def on_pop(self, state, priority, frontier_size):
+        for observer in self.observers:
+            observer.on_pop(state, priority, frontier_size)
+
+    def on_expand(self, state, neighbours):
+        for observer in self.observers:
+            observer.on_expand(state, neighbours)
+
+    def on_stale(self, state):
+        for observer in self.observers:
+            observer.on_stale(state)
+
+    def on_goal(self, state):
+        for observer in self.observers:
+            observer.on_goal(state)
+
+    def on_phase(self, name):
+        for observer in self.observers:
+            observer.on_phase(name)
+
+    def on_finish(self):
+        for observer in self.observers:
+            observer.on_finish()
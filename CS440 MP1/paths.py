@@ -0,0 +1,108 @@
+# paths.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the flat arrays the search executors keep their search trees in, and the paths read off them.
+A parent array holds one int32 per cell of the maze, indexed by flat cell id (row * cols + col), and a cost array
+the g value of each cell the same way, so recording a parent or a cost is one store instead of a dict entry
+keyed by a tuple. A path is only the parent array and the cell ids it runs between until something reads it;
+the cell ids are then walked back once into an int32 array, and the (row, col) tuples made from them only
+when the path is indexed or iterated.
+"""
+
+from array import array
+
+from distances import UNREACHABLE
+
+"""
+Cost of a cell no path has reached yet, the largest int32
+"""
+UNSEEN = 0x7fffffff
+
+
+def parentArray(maze):
+    """:return: int32 array of rows * cols UNREACHABLE (-1) parents"""
+    rows, cols = maze.getDimensions()
+    return array('i', [UNREACHABLE]) * (rows * cols)
+
+
+def costArray(maze):
+    """:return: int32 array of rows * cols UNSEEN costs"""
+    rows, cols = maze.getDimensions()
+    return array('i', [UNSEEN]) * (rows * cols)
+
+
+class PathView:
+    """A path from start to end along a parent array, rebuilt when it is first read.
+    It reads like the list of (row, col) tuples the executors used to return, and compares equal to it
+
+        Attributes:
+            cols: number of columns of the maze, cell id = row * cols + col
+            start: cell id the path begins at
+            end: cell id the path ends at
+    """
+
+    def __init__(self, parents, cols, start, end):
+        """Return the path to end, whose chain of parents must lead back to start"""
+        self.cols = cols
+        self.start = start
+        self.end = end
+        self.__parents = parents
+        self.__ids = None
+        self.__positions = None
+
+    def ids(self):
+        """
+        The cell ids of the path, walked back from end the first time; the parent array is let go of then,
+        so the search may go on changing it
+        :return: int32 array from start to end
+        """
+        if self.__ids is None:
+            parents = self.__parents
+            ids = array('i', [self.end])
+            while ids[-1] != self.start:
+                ids.append(parents[ids[-1]])
+            ids.reverse()
+            self.__ids = ids
+            self.__parents = None
+        return self.__ids
+
+    def cells(self):
+        """:return: the cell ids as a NumPy int32 array sharing memory with ids()"""
+        import numpy as np
+
+        return np.frombuffer(self.ids(), dtype=np.int32)
+
+    def positions(self):
+        """:return: the path as a list of (row, col) tuples, made once"""
+        if self.__positions is None:
+            cols = self.cols
+            self.__positions = [divmod(cell, cols) for cell in self.ids()]
+        return self.__positions
+
+    def __len__(self):
+        return len(self.ids())
+
+    def __getitem__(self, index):
+        if isinstance(index, int) and self.__positions is None:
+            return divmod(self.ids()[index], self.cols)
+        return self.positions()[index]
+
+    def __iter__(self):
+        return iter(self.positions())
+
+    def __eq__(self, other):
+        if isinstance(other, PathView):
+            return self.cols == other.cols and self.ids() == other.ids()
+        if isinstance(other, (list, tuple)):
+            return self.positions() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "PathView(%r)" % self.positions()
@@ -0,0 +1,266 @@
+# portfolio.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains a portfolio solver that races several search methods on one maze in a process pool.
+It returns the first result that is known to be optimal or, failing that, the cheapest result in by the
+deadline, and stops the workers still running. Every race is recorded in a JSON statistics file, per class
+of similar mazes (mazeKey), and the next race on a maze of the same class starts the strategies that won
+most often first, which matters whenever there are fewer workers than strategies.
+Nothing here imports pygame.
+"""
+
+import argparse
+import concurrent.futures
+import json
+import math
+import os
+import sys
+import time
+
+from maze import Maze
+import search_alt
+from tsp import HELD_KARP_LIMIT
+
+"""
+Strategies raced by default, in the order used when there are no statistics for the maze class yet
+"""
+DEFAULT_STRATEGIES = ["astar", "jps", "biastar", "bibfs", "astar_exact", "astar_table", "bfs", "greedy",
+                      "tsp", "astar_mst"]
+
+"""
+Methods whose every leg is a shortest path to the objective it ends at, so they are optimal with one objective
+"""
+LEG_OPTIMAL = {"bfs", "astar", "astar_table", "astar_exact", "alt", "jps", "bibfs", "biastar", "idastar", "smastar"}
+
+"""
+Methods that search the (position, remaining objectives) space with an admissible heuristic, so they are
+optimal with any number of objectives
+"""
+TOUR_OPTIMAL = {"astar_mst"}
+
+"""
+Default statistics file, in the working directory
+"""
+STATS_FILE = "portfolio_stats.json"
+
+
+def isOptimal(method, dots):
+    """
+    Whether a complete result of method is known to be optimal
+    :param method: a key of the search_alt.search dispatch
+    :param dots: number of objectives
+    :return: bool
+    """
+    if method in TOUR_OPTIMAL:
+        return True
+    if dots == 1:
+        return method in LEG_OPTIMAL
+    return method == "tsp" and dots <= HELD_KARP_LIMIT
+
+
+def pathCost(path):
+    """Number of moves along a path; the legs of the multi-objective drivers repeat the cell they meet at"""
+    return sum(1 for a, b in zip(path, path[1:]) if a != b)
+
+
+def mazeKey(maze):
+    """
+    Class of similar mazes the statistics are kept under: the size as a power of two of the cell count,
+    the number of objectives (1, up to HELD_KARP_LIMIT, or more) and the open fraction to the nearest quarter
+    :param maze:
+    :return: str, e.g. "cells=2^14 dots=1 open=0.5"
+    """
+    rows, cols = maze.getDimensions()
+    dots = len(maze.getObjectives())
+    if dots == 1:
+        dots_class = "1"
+    elif dots <= HELD_KARP_LIMIT:
+        dots_class = "2-%d" % HELD_KARP_LIMIT
+    else:
+        dots_class = ">%d" % HELD_KARP_LIMIT
+    open_fraction = round(float(maze.openMask().mean()) * 4) / 4
+    return "cells=2^%d dots=%s open=%g" % (int(math.log2(rows * cols)), dots_class, open_fraction)
+
+
+def loadStats(filename):
+    """
+    :param filename: statistics file, or None
+    :return: dict from maze class to dict from method to {"runs", "wins", "finished", "seconds"};
+             empty if the file does not exist
+    """
+    if filename is None or not os.path.exists(filename):
+        return {}
+    with open(filename) as f:
+        return json.load(f)
+
+
+def saveStats(stats, filename):
+    """Writes the statistics through a temporary file, so a reader never sees a partial file"""
+    temporary = filename + ".tmp"
+    with open(temporary, 'w') as f:
+        json.dump(stats, f, indent=1, sort_keys=True)
+    os.replace(temporary, filename)
+
+
+def rankStrategies(stats, key, methods):
+    """
+    Orders methods by their win rate on the maze class, (wins + 1) / (runs + 2) so untried methods start at 1/2,
+    then by their mean time to finish; methods tie in the order given
+    :param stats: as loadStats returns
+    :param key: maze class
+    :param methods:
+    :return: list of methods
+    """
+    history = stats.get(key, {})
+
+    def rank(method):
+        entry = history.get(method, {})
+        wins, runs = entry.get("wins", 0), entry.get("runs", 0)
+        finished = entry.get("finished", 0)
+        mean_seconds = entry.get("seconds", 0.0) / finished if finished else float("inf")
+        return -(wins + 1) / (runs + 2), mean_seconds
+
+    return sorted(methods, key=rank)
+
+
+def recordRace(stats, key, outcomes, winner):
+    """
+    Adds one race to the statistics, in place
+    :param stats:
+    :param key: maze class
+    :param outcomes: dict from method to its outcome record ("status" and, if it finished, "seconds")
+    :param winner: winning method, or None
+    :return:
+    """
+    history = stats.setdefault(key, {})
+    for method, outcome in outcomes.items():
+        entry = history.setdefault(method, {"runs": 0, "wins": 0, "finished": 0, "seconds": 0.0})
+        entry["runs"] += 1
+        if "seconds" in outcome:
+            entry["finished"] += 1
+            entry["seconds"] += outcome["seconds"]
+        if method == winner:
+            entry["wins"] += 1
+
+
+def runStrategy(filename, method):
+    """
+    Worker: loads the maze and runs one method on it
+    The path is sent back as a list of (row, col) tuples; a PathView would pickle the whole parent array with it
+    :param filename:
+    :param method:
+    :return: path, states_explored, seconds
+    """
+    maze = Maze(filename)
+    start = time.perf_counter()
+    path, states_explored = search_alt.search(maze, method)
+    return list(path), states_explored, time.perf_counter() - start
+
+
+def stopWorkers(executor):
+    """
+    Cancels the strategies that have not started and terminates the worker processes of those that have
+    ProcessPoolExecutor.terminate_workers is used where it exists (Python 3.14); before that the only handle on the
+    workers is the executor's process table, which has to be read before shutdown clears it
+    """
+    terminate = getattr(executor, "terminate_workers", None)
+    if terminate is not None:
+        terminate()
+        return
+    processes = list((executor._processes or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join()
+
+
+def solvePortfolio(filename, methods=None, deadline=60.0, workers=None, statsFile=STATS_FILE):
+    """
+    Races methods on a maze file
+    :param filename: maze file, text or binary
+    :param methods: keys of the search_alt.search dispatch, DEFAULT_STRATEGIES by default
+    :param deadline: seconds to wait for a result known to be optimal before settling for the cheapest one
+    :param workers: worker processes, one per method by default
+    :param statsFile: statistics file to order the methods by and record the race in, None for neither
+    :return: path, record - the record has the maze class, the winner, whether its path is known to be optimal,
+             the path length and cost (moves), states explored, wall seconds, and every method's outcome;
+             path is [] and winner None if no method finished by the deadline
+    """
+    start = time.perf_counter()
+    maze = Maze(filename)
+    objectives = set(maze.getObjectives())
+    key = mazeKey(maze)
+    stats = loadStats(statsFile)
+    methods = rankStrategies(stats, key, list(methods or DEFAULT_STRATEGIES))
+    outcomes = {method: {"status": "cancelled"} for method in methods}
+    best = None
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers or len(methods))
+    try:
+        futures = {executor.submit(runStrategy, filename, method): method for method in methods}
+        pending = set(futures)
+        while pending:
+            remaining = deadline - (time.perf_counter() - start)
+            if remaining <= 0:
+                break
+            done, pending = concurrent.futures.wait(pending, timeout=remaining,
+                                                    return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                method = futures[future]
+                try:
+                    path, states_explored, seconds = future.result()
+                except Exception as error:
+                    outcomes[method] = {"status": "error", "error": "%s: %s" % (type(error).__name__, error)}
+                    continue
+                complete = bool(path) and objectives <= set(path)
+                outcomes[method] = {"status": "finished" if complete else "incomplete", "seconds": round(seconds, 6),
+                                    "path_cost": pathCost(path), "states_explored": states_explored}
+                if complete and (best is None or pathCost(path) < pathCost(best[1]) or
+                                 pathCost(path) == pathCost(best[1]) and isOptimal(method, len(objectives))
+                                 and not isOptimal(best[0], len(objectives))):
+                    # on a tie the result known to be optimal is kept, which also ends the race
+                    best = (method, path, states_explored)
+            if best is not None and isOptimal(best[0], len(objectives)):
+                break
+    finally:
+        stopWorkers(executor)
+    winner = best[0] if best is not None else None
+    if winner is not None:
+        outcomes[winner]["status"] = "won"
+    if statsFile is not None:
+        recordRace(stats, key, outcomes, winner)
+        saveStats(stats, statsFile)
+    path = best[1] if best is not None else []
+    record = {"maze": filename, "key": key, "winner": winner,
+              "optimal": winner is not None and isOptimal(winner, len(objectives)),
+              "path_length": len(path), "path_cost": pathCost(path),
+              "states_explored": best[2] if best is not None else 0,
+              "wall_seconds": round(time.perf_counter() - start, 6), "strategies": outcomes}
+    return path, record
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='CS440 MP1 Portfolio Search')
+
+    parser.add_argument('mazes', nargs='+',
+                        help='maze files [REQUIRED]')
+    parser.add_argument('--methods', dest="methods", nargs='+', default=None,
+                        help='methods to race - default ' + ' '.join(DEFAULT_STRATEGIES))
+    parser.add_argument('--deadline', dest="deadline", type=float, default=60.0,
+                        help='seconds to wait for an optimal result - default 60')
+    parser.add_argument('--workers', dest="workers", type=int, default=None,
+                        help='worker processes - default one per method')
+    parser.add_argument('--stats', dest="stats", default=STATS_FILE,
+                        help='win statistics file - default ' + STATS_FILE)
+
+    args = parser.parse_args()
+    for filename in args.mazes:
+        _, record = solvePortfolio(filename, args.methods, args.deadline, args.workers, args.stats)
+        sys.stdout.write(json.dumps(record) + "\n")
+        sys.stdout.flush()
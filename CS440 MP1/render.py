@@ -0,0 +1,144 @@
+# render.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains an off-screen renderer for solved mazes that never imports pygame or opens a window.
+The picture is the one mp1.py draws (path squares in the red to green gradient of Application.getColor, black
+walls, the blue start square and black objective dots), built as one NumPy image: every cell's colour is worked
+out on the rows x cols grid and blown up to scale x scale pixels in one step, and the start and objective shapes
+are stamped onto their cells as a whole. The image is written as an 8-bit RGB PNG with zlib.
+"""
+
+import struct
+import zlib
+
+"""
+zlib level of the PNG data; maze pictures are long runs of a few colours, which the fastest level packs well
+"""
+COMPRESSION_LEVEL = 1
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+BLUE = (0, 0, 255)
+
+
+def pathColors(length):
+    """
+    The colours Application.getColor gives the cells of a path: green rises by 255 / length a step
+    and red falls as much
+    :param length: number of cells on the path
+    :return: length x 3 uint8 NumPy array
+    """
+    import numpy as np
+
+    green = np.arange(length) * (255 / length)
+    colors = np.zeros((length, 3), dtype=np.uint8)
+    colors[:, 0] = 255 - green
+    colors[:, 1] = green
+    return colors
+
+
+def cellImage(maze, path=()):
+    """
+    The colour of every cell: white, the path gradient on the cells of path (the last time a cell is on it
+    decides, as when the squares are drawn in order) and black on the walls
+    :param maze:
+    :param path: list of (row, col) tuples
+    :return: rows x cols x 3 uint8 NumPy array
+    """
+    import numpy as np
+
+    rows, cols = maze.getDimensions()
+    image = np.full((rows, cols, 3), WHITE, dtype=np.uint8)
+    if len(path):
+        cells = np.array([row * cols + col for row, col in path], dtype=np.int64)
+        # the first occurrence of each cell in the reversed path is its last one on the path
+        reversed_cells, reversed_index = np.unique(cells[::-1], return_index=True)
+        image.reshape(-1, 3)[reversed_cells] = pathColors(len(cells))[len(cells) - 1 - reversed_index]
+    image[~maze.openMask()] = BLACK
+    return image
+
+
+def stamp(view, cells, mask, color):
+    """
+    Colours the pixels of mask in each of the cells of a (rows, scale, cols, scale, 3) view of the image
+    :param view:
+    :param cells: list of (row, col) tuples
+    :param mask: scale x scale bool NumPy array
+    :param color: (red, green, blue)
+    :return:
+    """
+    import numpy as np
+
+    if not cells:
+        return
+    rows = np.array([cell[0] for cell in cells], dtype=np.int64)
+    cols = np.array([cell[1] for cell in cells], dtype=np.int64)
+    blocks = view[rows, :, cols, :, :]
+    blocks[:, mask] = color
+    view[rows, :, cols, :, :] = blocks
+
+
+def renderImage(maze, path=(), scale=20):
+    """
+    The whole picture of maze and path, drawn in the order mp1.py draws it: path, walls, start, objectives
+    :param maze:
+    :param path: list of (row, col) tuples
+    :param scale: pixels per cell side
+    :return: (rows * scale) x (cols * scale) x 3 uint8 NumPy array
+    """
+    import numpy as np
+
+    rows, cols = maze.getDimensions()
+    image = np.broadcast_to(cellImage(maze, path)[:, None, :, None, :], (rows, scale, cols, scale, 3)).copy()
+    pixel = np.arange(scale)
+    # the start square is half a cell wide, a quarter cell in from its sides
+    inner = (pixel >= int(scale / 4)) & (pixel < int(scale / 4 + scale * 0.5))
+    stamp(image, [maze.getStart()], inner[:, None] & inner[None, :], BLUE)
+    # objective dots have a radius of a quarter cell
+    offset = pixel - int(scale / 2)
+    dot = offset[:, None] ** 2 + offset[None, :] ** 2 <= int(scale / 4) ** 2
+    stamp(image, list(maze.getObjectives()), dot, BLACK)
+    return image.reshape(rows * scale, cols * scale, 3)
+
+
+def writePNG(image, filename):
+    """
+    Writes an RGB image as a PNG file
+    :param image: height x width x 3 uint8 NumPy array
+    :param filename:
+    :return:
+    """
+    import numpy as np
+
+    height, width = image.shape[:2]
+    # every scanline starts with filter type 0 (none)
+    scanlines = np.zeros((height, 1 + width * 3), dtype=np.uint8)
+    scanlines[:, 1:] = image.reshape(height, width * 3)
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    with open(filename, 'wb') as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(scanlines.tobytes(), COMPRESSION_LEVEL)))
+        f.write(chunk(b"IEND", b""))
+
+
+def savePNG(maze, path, filename, scale=20):
+    """
+    Renders maze and path and writes them to filename as a PNG
+    :param maze:
+    :param path: list of (row, col) tuples
+    :param filename:
+    :param scale: pixels per cell side
+    :return: the image
+    """
+    image = renderImage(maze, path, scale)
+    writePNG(image, filename)
+    return image
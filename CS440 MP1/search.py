@@ -17,9 +17,14 @@ This file contains search functions.
 # maze is a Maze object based on the maze from the file specified by input filename
 # searchMethod is the search method specified by --method flag (bfs,dfs,greedy,astar)
 # You may need to slight change your previous search functions in MP1 since this is 3-d maze
-import queue as Q
 import sys
 
+from frontier import IndexedHeap
+import observers
+from paths import PathView, costArray, parentArray
+from search_alt import alt, arastar, astar_exact, astar_mst, astar_table, biastar, bibfs, dstar, greedy_table, \
+    hpastar, idastar, jps, junction, junction_dijkstra, smastar, tsp, frontierStats
+
 
 class Node:
     """A node value that encapsulates the node data and its heuristic value
@@ -47,13 +52,38 @@ class Node:
         return self.heuristic_value < other.heuristic_value
 
 
+"""
+frontierStats, imported above, holds the counters of the IndexedHeap frontier summed over every executor call
+since the last resetFrontierStats(). It is the same dict search_alt fills, so mp1.py sees either module's searches
+"""
+
+
 def search(maze, searchMethod):
-    return {
+    methods = {
         "bfs": bfs,
         "dfs": dfs,
         "greedy": greedy,
         "astar": astar,
-    }.get(searchMethod, [])(maze)
+        "greedy_table": greedy_table,
+        "astar_table": astar_table,
+        "astar_exact": astar_exact,
+        "alt": alt,
+        "idastar": idastar,
+        "smastar": smastar,
+        "arastar": arastar,
+        "junction": junction,
+        "junction_dijkstra": junction_dijkstra,
+        "dstar": dstar,
+        "hpastar": hpastar,
+        "astar_mst": astar_mst,
+        "tsp": tsp,
+        "jps": jps,
+        "bibfs": bibfs,
+        "biastar": biastar,
+    }
+    if searchMethod not in methods:
+        raise ValueError("Unknown search method: %s" % searchMethod)
+    return methods[searchMethod](maze)
 
 def bfs(maze):
     # TODO: Write your code here
@@ -76,47 +106,76 @@ def astar_executor(maze, start_state, objectives):
     The astar search works just like Greedy, other than the fact that the hueristic is the sum of a heuristic function
     and the cost to reach the current state
     We tried out different heuristics, most of which are admissible
-    We got the best results from a weighted minimum manhattan distance to the nearest goal and have used that as the default one
     Each Heuristic has been described in the corresponding sections
+    Here the plain minimum manhattan distance is used, which is admissible, so the path is optimal.
+    The cost so far of every state lives in g_score, which makes a push O(log n). g_score and the parents are
+    int32 arrays indexed by cell id (see paths.py), and the path is a PathView over the parents, walked back only
+    when it is read. Any state whose g_score improves is pushed again, even if it was already expanded.
+    The frontier is an IndexedHeap keyed by cell id, so a cheaper path to a state already on it lowers that entry
+    rather than adding a duplicate.
+    Priorities are (f, h), which breaks ties in f towards the state nearer the goal.
     :param maze:
     :param start_state:
     :param objectives:
     :return:
     """
-    frontier = Q.PriorityQueue()
-    start_node = Node(start_state, getAstarHeuristicMinDistanceToAnyObjective(start_state, objectives) + 0)
-    frontier.put(start_node)
-    visited = set()
-    parent_map = {}
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("search")
+    frontier = IndexedHeap()
+    cols = maze.getDimensions()[1]
+    start_key = cellId(maze, start_state)
+    start_heuristic = getAstarHeuristicMinDistanceToAnyObjective(start_state, objectives)
+    frontier.push(start_key, (start_heuristic + 0, start_heuristic), start_state)
+    if observer is not None:
+        observer.on_push(start_state, (start_heuristic, start_heuristic), len(frontier))
+    parents = parentArray(maze)
+    g_score = costArray(maze)
+    g_score[start_key] = 0
     num_states_explored = 0
     flag = False
-    while frontier and frontier.qsize() > 0:
-        print("Frontier Size: " + str(frontier.qsize()))
-        #print("Frontier " + str(frontier))
-        current_node = frontier.get()
-        current_position = current_node.position
-        if current_position in visited:
-            continue
-        visited.add(current_position)
-        print("Exploring " + str(current_position))
+    while frontier:
+        current_key, current_position, priority = frontier.pop()
+        if observer is not None:
+            observer.on_pop(current_position, priority, len(frontier))
         num_states_explored += 1
 
         if current_position in objectives:
-            current_goal = current_position
+            current_goal = current_key
             flag = True
+            if observer is not None:
+                observer.on_goal(current_position)
             break
+        neighbour_cost = g_score[current_key] + 1
         neighbour_nodes = maze.getNeighbors(current_position[0], current_position[1])
-        print("Neighbours:" + str(neighbour_nodes))
+        if observer is not None:
+            observer.on_expand(current_position, neighbour_nodes)
         for each_neighbour in neighbour_nodes:
-            if maze.isValidMove(each_neighbour[0], each_neighbour[1]) and each_neighbour not in visited:
-                print("Adding Neighbour" + str(each_neighbour))
-                parent_map[each_neighbour] = current_position
-                frontier.put(Node(each_neighbour, getAstarHeuristicMinDistanceToAnyObjective(each_neighbour, objectives) +
-                                                  len(backtrace(parent_map, start_state, current_position))))
+            neighbour_key = each_neighbour[0] * cols + each_neighbour[1]
+            if neighbour_cost < g_score[neighbour_key]:
+                g_score[neighbour_key] = neighbour_cost
+                parents[neighbour_key] = current_key
+                neighbour_heuristic = getAstarHeuristicMinDistanceToAnyObjective(each_neighbour, objectives)
+                neighbour_priority = (neighbour_heuristic + neighbour_cost, neighbour_heuristic)
+                frontier.push(neighbour_key, neighbour_priority, each_neighbour)
+                if observer is not None:
+                    observer.on_push(each_neighbour, neighbour_priority, len(frontier))
+            elif neighbour_key in frontier:
+                frontier.noteDuplicate()
+                if observer is not None:
+                    observer.on_stale(each_neighbour)
+    recordFrontierStats(frontier)
     if not flag:
         print("Map is not solvable!")
+        if observer is not None:
+            observer.on_finish()
         return [], 0
-    return backtrace(parent_map, start_state, current_goal), num_states_explored
+    if observer is not None:
+        observer.on_phase("reconstruct")
+    path = PathView(parents, cols, start_key, current_goal)
+    if observer is not None:
+        observer.on_finish()
+    return path, num_states_explored
 
 
 def astar(maze):
@@ -125,6 +184,7 @@ def astar(maze):
     :param maze:
     :return: full_path, total_states_explored
     """
+    resetFrontierStats()
     start_state = maze.getStart()
     objectives = maze.getObjectives()
     return astar_executor(maze, start_state, objectives)
@@ -254,6 +314,35 @@ def aggregatedCostFromObjectiveToAllOthers(current, objectives):
     return sum_distances
 
 
+def cellId(maze, position):
+    """
+    Flat id of a (row, col) position, row * cols + col, used to key the frontier
+    :param maze:
+    :param position:
+    :return: int
+    """
+    return position[0] * maze.getDimensions()[1] + position[1]
+
+
+def resetFrontierStats():
+    """
+    Clears frontierStats before a new search
+    :return:
+    """
+    frontierStats["stale_pops_avoided"] = 0
+    frontierStats["peak_frontier_size"] = 0
+
+
+def recordFrontierStats(frontier):
+    """
+    Adds the counters of a finished executor's frontier to frontierStats
+    :param frontier: IndexedHeap
+    :return:
+    """
+    frontierStats["stale_pops_avoided"] += frontier.stale_pops_avoided
+    frontierStats["peak_frontier_size"] = max(frontierStats["peak_frontier_size"], frontier.peak_size)
+
+
 def backtrace(parent_map, start, end):
     """
     This method is a utility function.
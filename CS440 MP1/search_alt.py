@@ -19,8 +19,23 @@ files and classes when code is run, so be careful to not modify anything else.
 # maze is a Maze object based on the maze from the file specified by input filename
 # searchMethod is the search method specified by --method flag (bfs,dfs,greedy,astar)
 
-import queue as Q
+from collections import deque
+import heapq
 import sys
+import time
+
+from contraction import JunctionGraph
+from dstar import DStarLite
+from distances import ObjectiveDistances, UNREACHABLE
+from frontier import IndexedHeap
+from heuristics import HeuristicTable
+from hierarchy import clusterGraph
+from landmarks import LandmarkBound, loadLandmarks
+from jps import expandSegment, jumpSuccessors
+from mst import MSTCache
+import observers
+from paths import PathView, UNSEEN, costArray, parentArray
+from tsp import tourOrder
 
 
 class Node:
@@ -50,19 +65,67 @@ class Node:
 
 
 def search(maze, searchMethod):
-    return {
+    methods = {
         "bfs": bfs,
         "dfs": dfs,
         "greedy": greedy,
         "astar": astar,
-    }.get(searchMethod)(maze)
+        "greedy_table": greedy_table,
+        "astar_table": astar_table,
+        "astar_exact": astar_exact,
+        "alt": alt,
+        "idastar": idastar,
+        "smastar": smastar,
+        "arastar": arastar,
+        "junction": junction,
+        "junction_dijkstra": junction_dijkstra,
+        "dstar": dstar,
+        "hpastar": hpastar,
+        "astar_mst": astar_mst,
+        "tsp": tsp,
+        "jps": jps,
+        "bibfs": bibfs,
+        "biastar": biastar,
+    }
+    if searchMethod not in methods:
+        raise ValueError("Unknown search method: %s" % searchMethod)
+    return methods[searchMethod](maze)
 
 
 
 """
 This is used to pre-compute and store the graph weights for Dijkstra style heuristic
+It holds an ObjectiveDistances (exact BFS distances between start and objectives) once calculateAllDistances has run
 """
-distanceMap = {}
+objectiveDistances = None
+
+"""
+MST weights over subsets of the objectives, keyed by the remaining-objective bitmask. Built by astar_mst_executor
+"""
+mstCache = None
+
+"""
+Counters of the IndexedHeap frontiers used by the informed searches, summed over every executor call
+since the last resetFrontierStats()
+"""
+frontierStats = {"stale_pops_avoided": 0, "peak_frontier_size": 0}
+
+"""
+Default memory budget of the memory-bounded searches (idastar, smastar), in states held:
+transposition table entries for IDA*, search tree nodes for SMA*
+"""
+MEMORY_BUDGET = 1 << 20
+
+"""
+Weight of the Manhattan heuristic of astar when there are more than two objectives
+"""
+ASTAR_WEIGHT = 2
+
+"""
+Weights of the successive searches of ARA*, and its default time budget in seconds
+"""
+ARA_WEIGHTS = (5.0, 3.0, 2.0, 1.5, 1.25, 1.1, 1.0)
+ARA_TIME_BUDGET = 0.1
 
 ###########################
 #   SEARCH FUNCTIONS      #
@@ -81,54 +144,90 @@ All searches run on 1 or more objectives
 def bfs_executor(maze, start_state, objectives):
     """
     This is the executor for BFS.
-    The idea is to use a FIFO queue to maintain the frontier
-    We use the parent_map to store the parent state of every expanded node
-    We then use a utility backtrace function to get the complete path from start to end
+    The idea is to use a FIFO queue of cell ids to maintain the frontier
+    We use a parent array, indexed by cell id, to store the parent of every discovered cell
+    A cell is marked visited when it is pushed, so it is queued, and expanded, at most once
+    The path from start to end is a PathView over it, which is walked back only when it is read
     :param maze:
     :param start_state:
     :param objectives:
-    :return: path, num_states_explored --> for a sub-goal to sub-goal
+    :return: path, num_states_explored --> for a sub-goal to sub-goal, [] if no objective can be reached
     """
-    frontier = Q.Queue()
-    start_node = Node(start_state)
-    frontier.put(start_node)
-    visited = set()
-    parent_map = {}
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("search")
+    rows, cols = maze.getDimensions()
+    start_key = cellId(maze, start_state)
+    frontier = deque([start_key])
+    if observer is not None:
+        observer.on_push(start_state, None, len(frontier))
+    visited = bytearray(rows * cols)
+    visited[start_key] = 1
+    parents = parentArray(maze)
     num_states_explored = 0
+    current_goal = None
     while frontier:
-        current_node = frontier.get()
-        current = current_node.position
-        visited.add(current)
+        current_key = frontier.popleft()
+        current = divmod(current_key, cols)
+        if observer is not None:
+            observer.on_pop(current, None, len(frontier))
         num_states_explored += 1
         if current in objectives:
-            current_goal = current
+            current_goal = current_key
+            if observer is not None:
+                observer.on_goal(current)
             break
         neighbour_nodes = maze.getNeighbors(current[0], current[1])
+        if observer is not None:
+            observer.on_expand(current, neighbour_nodes)
         for each_neighbour in neighbour_nodes:
-            if maze.isValidMove(each_neighbour[0], each_neighbour[1]) and each_neighbour not in visited:
-                parent_map[each_neighbour] = current
-                frontier.put(Node(each_neighbour))
+            neighbour_key = each_neighbour[0] * cols + each_neighbour[1]
+            if not visited[neighbour_key]:
+                visited[neighbour_key] = 1
+                parents[neighbour_key] = current_key
+                frontier.append(neighbour_key)
+                if observer is not None:
+                    observer.on_push(each_neighbour, None, len(frontier))
+            elif observer is not None:
+                observer.on_stale(each_neighbour)
 
-    return backtrace(parent_map, start_state, current_goal), num_states_explored
+    path = []
+    if current_goal is not None:
+        if observer is not None:
+            observer.on_phase("reconstruct")
+        path = PathView(parents, cols, start_key, current_goal)
+    if observer is not None:
+        observer.on_finish()
+    return path, num_states_explored
 
 
 def bfs(maze):
     """
-    This acts like the driver for BFS and combines the various sub paths returned by bfs_executor
+    This acts like the driver for BFS and combines the various sub paths to the nearest remaining objective
+    With a single objective this is just bfs_executor, which stops as soon as it reaches it.
+    With several, rather than re-running bfs_executor for every objective, one BFS is run from the start and
+    from each objective up front (calculateAllDistances), each stopping once it has found all the others.
+    Each leg then reads the nearest remaining objective off the distance matrix and its path off that
+    objective's BFS tree; the states explored are the cells expanded by those BFS passes
     :param maze:
     :return: full_path, total_states_explored
     """
     start_state = maze.getStart()
     objectives = maze.getObjectives()
+    if len(objectives) == 1:
+        path, states_explored = bfs_executor(maze, start_state, objectives)
+        return path, states_explored
+    calculateAllDistances(maze, start_state, objectives, keepTrees=True)
     full_path = []
-    total_states_explored = 0
     while objectives:
-        path, states_explored = bfs_executor(maze, start_state, objectives)
+        next_objective = objectiveDistances.nearest(start_state, objectives)
+        if next_objective is None:
+            break
+        path = objectiveDistances.path(start_state, next_objective)
         full_path.extend(path)
-        total_states_explored += states_explored
-        objectives.remove(path[-1])
-        start_state = path[-1]
-    return full_path, total_states_explored
+        objectives.remove(next_objective)
+        start_state = next_objective
+    return full_path, objectiveDistances.states_explored
 
 
 # Depth First Search
@@ -138,31 +237,61 @@ def dfs_executor(maze, start_state, objectives):
     """
     The idea here is to use a stack as a LIFO frontier.
     In python we can just use the list and its pop() method to get LIFO behaviour
-    Since the state space does not become extremely large for DFS,
-    we have chosen to maintain the entire source to destination paths in the frontier
+    The frontier holds cell ids only; a push records its cell's parent in a parent array, overwriting the parent of
+    an earlier push of the same cell, so the latest push, which is the one popped first, owns it.
+    The older entries of a cell already expanded are skipped when they come off the stack
     :param maze:
     :param start_state:
     :param objectives:
     :return: path, num_states_explored
     """
-    frontier = [[start_state]]
-    visited = set()
-    path = []
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("search")
+        observer.on_push(start_state, None, 1)
+    rows, cols = maze.getDimensions()
+    start_key = cellId(maze, start_state)
+    frontier = [start_key]
+    visited = bytearray(rows * cols)
+    parents = parentArray(maze)
     num_states_explored = 0
+    current_goal = None
     while frontier:
-        path = frontier.pop()
-        current_node = path[-1]
-        visited.add(current_node)
+        current_key = frontier.pop()
+        current_node = divmod(current_key, cols)
+        if visited[current_key]:
+            if observer is not None:
+                observer.on_stale(current_node)
+            continue
+        if observer is not None:
+            observer.on_pop(current_node, None, len(frontier))
+        visited[current_key] = 1
         num_states_explored += 1
-        if (current_node[0], current_node[1]) in objectives:
+        if current_node in objectives:
+            current_goal = current_key
+            if observer is not None:
+                observer.on_goal(current_node)
             break
         neighbour_nodes = maze.getNeighbors(current_node[0], current_node[1])
+        if observer is not None:
+            observer.on_expand(current_node, neighbour_nodes)
         for each_neighbour in neighbour_nodes:
-            if maze.isValidMove(each_neighbour[0], each_neighbour[1]) and each_neighbour not in visited:
-                new_path = list(path)
-                new_path.append(each_neighbour)
-                frontier.append(new_path)
+            neighbour_key = each_neighbour[0] * cols + each_neighbour[1]
+            if not visited[neighbour_key]:
+                parents[neighbour_key] = current_key
+                frontier.append(neighbour_key)
+                if observer is not None:
+                    observer.on_push(each_neighbour, None, len(frontier))
+            elif observer is not None:
+                observer.on_stale(each_neighbour)
 
+    path = []
+    if current_goal is not None:
+        if observer is not None:
+            observer.on_phase("reconstruct")
+        path = PathView(parents, cols, start_key, current_goal)
+    if observer is not None:
+        observer.on_finish()
     return path, num_states_explored
 
 
@@ -178,8 +307,10 @@ def dfs(maze):
     total_states_explored = 0
     while objectives:
         path, states_explored = dfs_executor(maze, start_state, objectives)
-        full_path.extend(path)
         total_states_explored += states_explored
+        if not path:
+            break
+        full_path.extend(path)
         objectives.remove(path[-1])
         start_state = path[-1]
     return full_path, total_states_explored
@@ -209,118 +340,1322 @@ def getGreedyHeuristic(current_state, objectives):
     return min_heuristic
 
 
-def greedy_executor(maze, start_state, objectives):
+def greedy_executor(maze, start_state, objectives, table=None):
     """
     The executor for greedy search.
     It uses the heuristic getGreedyHeuristic as h(x) to guide the search
+    A state already on the frontier keeps its one heap entry, but its parent is still moved to the state that
+    reached it last, as it was when duplicates went on a PriorityQueue, so the paths found stay the same
     :param maze:
     :param start_state:
     :param objectives:
+    :param table: HeuristicTable over the same objectives, read instead of getGreedyHeuristic when given
     :return:
     """
-    frontier = Q.PriorityQueue()
-    start_node = Node(start_state, getGreedyHeuristic(start_state, objectives))
-    frontier.put(start_node)
-    visited = set()
-    parent_map = {}
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("search")
+    frontier = IndexedHeap()
+    rows, cols = maze.getDimensions()
+    lookup = table.lookup if table is not None else None
+    start_key = cellId(maze, start_state)
+    start_heuristic = lookup[start_key] if lookup is not None else getGreedyHeuristic(start_state, objectives)
+    frontier.push(start_key, start_heuristic, start_state)
+    if observer is not None:
+        observer.on_push(start_state, start_heuristic, len(frontier))
+    visited = bytearray(rows * cols)
+    parents = parentArray(maze)
     num_states_explored = 0
+    flag = False
     while frontier:
-        current_node = frontier.get()
-        current_position = current_node.position
-        visited.add(current_position)
+        current_key, current_position, priority = frontier.pop()
+        if observer is not None:
+            observer.on_pop(current_position, priority, len(frontier))
+        visited[current_key] = 1
         num_states_explored += 1
 
         if current_position in objectives:
-            current_goal = current_position
+            current_goal = current_key
+            flag = True
+            if observer is not None:
+                observer.on_goal(current_position)
             break
         neighbour_nodes = maze.getNeighbors(current_position[0], current_position[1])
+        if observer is not None:
+            observer.on_expand(current_position, neighbour_nodes)
         for each_neighbour in neighbour_nodes:
-            if maze.isValidMove(each_neighbour[0], each_neighbour[1]) and each_neighbour not in visited:
-                parent_map[each_neighbour] = current_position
-                frontier.put(Node(each_neighbour, getGreedyHeuristic(each_neighbour, objectives)))
-    return backtrace(parent_map, start_state, current_goal), num_states_explored
+            neighbour_key = each_neighbour[0] * cols + each_neighbour[1]
+            if not visited[neighbour_key]:
+                parents[neighbour_key] = current_key
+                if lookup is not None:
+                    neighbour_heuristic = lookup[neighbour_key]
+                else:
+                    neighbour_heuristic = getGreedyHeuristic(each_neighbour, objectives)
+                pushed = frontier.push(neighbour_key, neighbour_heuristic, each_neighbour)
+                if observer is not None:
+                    if pushed:
+                        observer.on_push(each_neighbour, neighbour_heuristic, len(frontier))
+                    else:
+                        observer.on_stale(each_neighbour)
+            elif observer is not None:
+                observer.on_stale(each_neighbour)
+    recordFrontierStats(frontier)
+    path = []
+    if flag:
+        if observer is not None:
+            observer.on_phase("reconstruct")
+        path = PathView(parents, cols, start_key, current_goal)
+    if observer is not None:
+        observer.on_finish()
+    return path, num_states_explored
 
 
-def greedy(maze):
+def greedy(maze, table=None):
     """
     The driver for Greedy Search
     :param maze:
+    :param table: optional HeuristicTable over the maze's objectives; each objective reached is consumed from it
     :return: full_path, total_states_explored
     """
+    resetFrontierStats()
     start_state = maze.getStart()
     objectives = maze.getObjectives()
     full_path = []
     total_states_explored = 0
     while objectives:
-        path, states_explored = greedy_executor(maze, start_state, objectives)
-        full_path.extend(path)
+        path, states_explored = greedy_executor(maze, start_state, objectives, table)
         total_states_explored += states_explored
+        if not path:
+            break
+        full_path.extend(path)
         objectives.remove(path[-1])
+        if table is not None:
+            table.consume(path[-1])
         start_state = path[-1]
     return full_path, total_states_explored
 
 
+def greedy_table(maze):
+    """
+    Greedy Search reading the minimum Manhattan distance from a HeuristicTable, one lookup per push
+    It finds the same path, exploring the same states, as greedy
+    :param maze:
+    :return: full_path, total_states_explored
+    """
+    return greedy(maze, HeuristicTable(maze, maze.getObjectives()))
+
+
 # ASTAR SEARCH
 
 # SEARCH
 
-def astar_executor(maze, start_state, objectives):
+def astar_executor(maze, start_state, objectives, table=None):
     """
     The astar search works just like Greedy, other than the fact that the hueristic is the sum of a heuristic function
     and the cost to reach the current state
     We tried out different heuristics, most of which are admissible
     We got the best results from a weighted minimum manhattan distance to the nearest goal and have used that as the default one
     Each Heuristic has been described in the corresponding sections
+    g_score keeps the cost to reach each state, so a push no longer backtraces the whole path.
+    g_score and the parents are int32 arrays indexed by cell id (see paths.py), and the path is a PathView over the
+    parents, walked back only when it is read.
+    Whenever g_score of a state improves it is pushed again: a state still on the frontier has its entry
+    lowered in place (decrease-key), and one that was already expanded is re-opened.
+    Priorities are (f, h) so equal f values are broken towards the state nearer the goal.
+    With one or two objectives the heuristic is admissible and the path is optimal; with more the weight
+    ASTAR_WEIGHT (2) makes it inadmissible, so the leg found is only bounded by twice the optimal cost
+    (arastar trades that bound down against time instead).
+    A Manhattan table is weighted the same way; an exact table is used as it is, which keeps every leg optimal.
     :param maze:
     :param start_state:
     :param objectives:
+    :param table: HeuristicTable over the same objectives, read instead of the Manhattan loop when given
     :return:
     """
-    frontier = Q.PriorityQueue()
-    start_node = Node(start_state, getWeightedAstarHeuristicMinDistanceToAnyObjective(start_state, objectives) + 0)
-    frontier.put(start_node)
-    visited = set()
-    parent_map = {}
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("search")
+    frontier = IndexedHeap()
+    cols = maze.getDimensions()[1]
+    lookup = table.lookup if table is not None else None
+    weight = 1 if table is None or table.exact or len(objectives) <= 2 else ASTAR_WEIGHT
+    start_key = cellId(maze, start_state)
+    if lookup is not None:
+        start_heuristic = weight * lookup[start_key]
+    else:
+        start_heuristic = getWeightedAstarHeuristicMinDistanceToAnyObjective(start_state, objectives)
+    frontier.push(start_key, (start_heuristic + 0, start_heuristic), start_state)
+    if observer is not None:
+        observer.on_push(start_state, (start_heuristic, start_heuristic), len(frontier))
+    parents = parentArray(maze)
+    g_score = costArray(maze)
+    g_score[start_key] = 0
     num_states_explored = 0
+    flag = False
     while frontier:
-        current_node = frontier.get()
-        current_position = current_node.position
-        visited.add(current_position)
+        current_key, current_position, priority = frontier.pop()
+        if observer is not None:
+            observer.on_pop(current_position, priority, len(frontier))
         num_states_explored += 1
 
         if current_position in objectives:
-            current_goal = current_position
+            current_goal = current_key
+            flag = True
+            if observer is not None:
+                observer.on_goal(current_position)
             break
+        neighbour_cost = g_score[current_key] + 1
         neighbour_nodes = maze.getNeighbors(current_position[0], current_position[1])
+        if observer is not None:
+            observer.on_expand(current_position, neighbour_nodes)
         for each_neighbour in neighbour_nodes:
-            if maze.isValidMove(each_neighbour[0], each_neighbour[1]) and each_neighbour not in visited:
-                parent_map[each_neighbour] = current_position
-                frontier.put(Node(each_neighbour, getWeightedAstarHeuristicMinDistanceToAnyObjective(each_neighbour, objectives) +
-                                                  len(backtrace(parent_map, start_state, current_position))))
-    return backtrace(parent_map, start_state, current_goal), num_states_explored
+            neighbour_key = each_neighbour[0] * cols + each_neighbour[1]
+            if neighbour_cost < g_score[neighbour_key]:
+                g_score[neighbour_key] = neighbour_cost
+                parents[neighbour_key] = current_key
+                if lookup is not None:
+                    neighbour_heuristic = weight * lookup[neighbour_key]
+                else:
+                    neighbour_heuristic = getWeightedAstarHeuristicMinDistanceToAnyObjective(each_neighbour, objectives)
+                neighbour_priority = (neighbour_heuristic + neighbour_cost, neighbour_heuristic)
+                frontier.push(neighbour_key, neighbour_priority, each_neighbour)
+                if observer is not None:
+                    observer.on_push(each_neighbour, neighbour_priority, len(frontier))
+            elif neighbour_key in frontier:
+                frontier.noteDuplicate()
+                if observer is not None:
+                    observer.on_stale(each_neighbour)
+    recordFrontierStats(frontier)
+    path = []
+    if flag:
+        if observer is not None:
+            observer.on_phase("reconstruct")
+        path = PathView(parents, cols, start_key, current_goal)
+    if observer is not None:
+        observer.on_finish()
+    return path, num_states_explored
 
 
-def astar(maze):
+def astar(maze, table=None):
     """
     The driver for Astar
     :param maze:
+    :param table: optional HeuristicTable over the maze's objectives; each objective reached is consumed from it
     :return: full_path, total_states_explored
     """
+    resetFrontierStats()
     start_state = maze.getStart()
     objectives = maze.getObjectives()
-    #calculateAllDistances(maze, start_state, objectives)
-    #print("DistanceMap Built!")
     full_path = []
     total_states_explored = 0
     while objectives:
-        path, states_explored = astar_executor(maze, start_state, objectives)
+        path, states_explored = astar_executor(maze, start_state, objectives, table)
+        total_states_explored += states_explored
+        if not path:
+            break
         full_path.extend(path)
+        objectives.remove(path[-1])
+        if table is not None:
+            table.consume(path[-1])
+        start_state = path[-1]
+    return full_path, total_states_explored
+
+
+def astar_table(maze):
+    """
+    Astar reading the minimum Manhattan distance from a HeuristicTable, one lookup per push
+    It finds the same path, exploring the same states, as astar
+    :param maze:
+    :return: full_path, total_states_explored
+    """
+    return astar(maze, HeuristicTable(maze, maze.getObjectives()))
+
+
+def astar_exact(maze):
+    """
+    Astar reading the exact maze distance to the nearest remaining objective from a HeuristicTable
+    The heuristic is perfect, so every leg is a shortest path to the nearest objective and
+    expands little more than the cells on it; building the table costs one wavefront BFS per objective
+    :param maze:
+    :return: full_path, total_states_explored
+    """
+    return astar(maze, HeuristicTable(maze, maze.getObjectives(), exact=True))
+
+
+def alt(maze):
+    """
+    Astar with the landmark (ALT) bound, which is never below the Manhattan distance and much nearer the true
+    distance in mazes that force long detours. The landmark distances are read from next to the maze file, or
+    computed (one wavefront BFS per landmark) and saved there on the first run; with one or two objectives
+    every leg is optimal
+    :param maze:
+    :return: full_path, total_states_explored
+    """
+    return astar(maze, LandmarkBound(loadLandmarks(maze), maze.getObjectives()))
+
+
+
+# MEMORY-BOUNDED SEARCH
+
+
+def idastar_executor(maze, start_state, objectives, budget=None):
+    """
+    Iterative deepening A*: depth first searches bounded by f = g + h, the bound raised after every iteration
+    to the smallest f that went over it, so the first objective reached is at the optimal cost.
+    Memory is the current path plus a transposition table from state to the smallest g it was reached with
+    during the iteration, which prunes re-reaching a state no cheaper. The table stops taking new states at
+    budget entries; a full table only costs re-expansions, the path stays optimal. The states it keeps are the
+    ones reached first, nearest the start, whose subtrees are the largest, but a table much smaller than the
+    maze can still leave an iteration re-expanding a number of paths that grows exponentially on layouts with loops.
+    h is the minimum Manhattan distance to any objective, which is admissible.
+    :param maze:
+    :param start_state:
+    :param objectives:
+    :param budget: entries of the transposition table, MEMORY_BUDGET by default
+    :return: path, num_states_explored, counting every expansion of every iteration
+    """
+    if budget is None:
+        budget = MEMORY_BUDGET
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("search")
+    bound = getGreedyHeuristic(start_state, objectives)
+    num_states_explored = 0
+    path = []
+    while bound < sys.maxsize:
+        num_states_explored += 1
+        if observer is not None:
+            observer.on_push(start_state, bound, 1)
+            observer.on_pop(start_state, bound, 0)
+        if start_state in objectives:
+            path = [start_state]
+            break
+        table = {start_state: 0}
+        path = [start_state]
+        on_path = {start_state}
+        neighbour_iterators = [iter(maze.getNeighbors(start_state[0], start_state[1]))]
+        next_bound = sys.maxsize
+        while neighbour_iterators:
+            each_neighbour = next(neighbour_iterators[-1], None)
+            if each_neighbour is None:
+                on_path.discard(path.pop())
+                neighbour_iterators.pop()
+                continue
+            neighbour_cost = len(path)
+            if each_neighbour in on_path or table.get(each_neighbour, sys.maxsize) <= neighbour_cost:
+                if observer is not None:
+                    observer.on_stale(each_neighbour)
+                continue
+            neighbour_priority = neighbour_cost + getGreedyHeuristic(each_neighbour, objectives)
+            if neighbour_priority > bound:
+                if neighbour_priority < next_bound:
+                    next_bound = neighbour_priority
+                continue
+            if len(table) < budget or each_neighbour in table:
+                table[each_neighbour] = neighbour_cost
+            path.append(each_neighbour)
+            on_path.add(each_neighbour)
+            num_states_explored += 1
+            if observer is not None:
+                observer.on_push(each_neighbour, neighbour_priority, len(path))
+                observer.on_pop(each_neighbour, neighbour_priority, len(path) - 1)
+            if each_neighbour in objectives:
+                break
+            neighbour_nodes = maze.getNeighbors(each_neighbour[0], each_neighbour[1])
+            if observer is not None:
+                observer.on_expand(each_neighbour, neighbour_nodes)
+            neighbour_iterators.append(iter(neighbour_nodes))
+        if path:
+            break
+        bound = next_bound
+    if path and observer is not None:
+        observer.on_goal(path[-1])
+    if observer is not None:
+        observer.on_finish()
+    return path, num_states_explored
+
+
+class MemoryNode:
+    """A node of the SMA* search tree; the same state can be held by several nodes over time
+
+        Attributes:
+            position: a (row -> int, column -> int) tuple
+            parent: the MemoryNode it was generated from, None for the root
+            g: cost from the root
+            f: lower bound on the cost of a path through it; for an expanded node on the open list, the smallest
+               f of its forgotten children
+            forgotten: dict from the position of each child forgotten since it was last expanded to its f,
+                       None before the first expansion
+            children: number of its children held in memory
+            version: bumped whenever it goes on the open list, so older heap entries are skipped
+            open: True while it is on the open list
+    """
+    __slots__ = ("position", "parent", "g", "f", "forgotten", "children", "version", "open")
+
+    def __init__(self, position, parent, g, f):
+        """Return a MemoryNode Object"""
+        self.position = position
+        self.parent = parent
+        self.g = g
+        self.f = f
+        self.forgotten = None
+        self.children = 0
+        self.version = 0
+        self.open = False
+
+
+def smastar_executor(maze, start_state, objectives, budget=None):
+    """
+    Simplified memory-bounded A*: A* over a search tree of at most budget nodes.
+    When the tree goes over budget the leaf with the highest f (the shallowest among equals) is forgotten and
+    its f is backed up into its parent, which goes back on the open list with the smallest f of its forgotten
+    children. Popping it again regenerates just those children, with the f they had, so a forgotten subtree
+    is generated again only when it becomes the best option. A node with nothing left to generate is
+    forgotten with an infinite f.
+    A child is not generated if a node of the same state with no higher g is in memory, which also keeps
+    the tree free of cycles, nor if it is too deep for its path to fit in budget nodes.
+    The open list is two heaps, best first and worst first, from which stale entries are skipped lazily.
+    h is the minimum Manhattan distance to any objective; f never drops below the parent's f.
+    With a budget well below the nodes A* would keep, an f contour no longer fits in memory and the same
+    subtrees are forgotten and generated again many times over.
+    :param maze:
+    :param start_state:
+    :param objectives:
+    :param budget: nodes held in memory, at least 2, MEMORY_BUDGET by default
+    :return: path, num_states_explored; the path is an optimal one if one has at most budget states,
+             and empty if no objective can be reached within budget
+    """
+    if budget is None:
+        budget = MEMORY_BUDGET
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("search")
+    best_heap = []
+    worst_heap = []
+    counter = [0, 0]  # heap entries pushed, nodes on the open list
+    stored = [0]
+    by_state = {}
+
+    def openNode(node):
+        if not node.open:
+            node.open = True
+            counter[1] += 1
+        node.version += 1
+        counter[0] += 1
+        heapq.heappush(best_heap, (node.f, -node.g, counter[0], node.version, node))
+        heapq.heappush(worst_heap, (-node.f, node.g, counter[0], node.version, node))
+        if observer is not None:
+            observer.on_push(node.position, node.f, counter[1])
+
+    def popOpen(heap, leavesOnly):
+        while heap:
+            entry = heapq.heappop(heap)
+            node = entry[4]
+            if node.open and node.version == entry[3] and not (leavesOnly and node.children):
+                node.open = False
+                counter[1] -= 1
+                return node
+        return None
+
+    def forget(node):
+        while node is not None:
+            stored[0] -= 1
+            if by_state.get(node.position) is node:
+                del by_state[node.position]
+            parent = node.parent
+            if parent is None:
+                return
+            parent.children -= 1
+            if node.f < sys.maxsize:
+                parent.forgotten[node.position] = node.f
+            if parent.forgotten:
+                parent.f = min(parent.forgotten.values())
+                openNode(parent)
+                return
+            if parent.children:
+                return
+            parent.f = sys.maxsize
+            if parent.open:
+                parent.open = False
+                counter[1] -= 1
+            node = parent
+
+    root = MemoryNode(start_state, None, 0, getGreedyHeuristic(start_state, objectives))
+    by_state[start_state] = root
+    stored[0] = 1
+    openNode(root)
+    num_states_explored = 0
+    goal = None
+    while True:
+        current = popOpen(best_heap, False)
+        if current is None or current.f >= sys.maxsize:
+            break
+        num_states_explored += 1
+        if observer is not None:
+            observer.on_pop(current.position, current.f, counter[1])
+        if current.position in objectives:
+            goal = current
+            if observer is not None:
+                observer.on_goal(current.position)
+            break
+        neighbour_nodes = maze.getNeighbors(current.position[0], current.position[1])
+        if observer is not None:
+            observer.on_expand(current.position, neighbour_nodes)
+        forgotten = current.forgotten
+        current.forgotten = {}
+        neighbour_cost = current.g + 1
+        for each_neighbour in neighbour_nodes:
+            if forgotten is not None and each_neighbour not in forgotten:
+                continue
+            known = by_state.get(each_neighbour)
+            if known is not None and known.g <= neighbour_cost:
+                if observer is not None:
+                    observer.on_stale(each_neighbour)
+                continue
+            if neighbour_cost >= budget - 1 and each_neighbour not in objectives:
+                continue
+            neighbour_priority = max(current.f, neighbour_cost + getGreedyHeuristic(each_neighbour, objectives))
+            if forgotten is not None:
+                neighbour_priority = max(neighbour_priority, forgotten[each_neighbour])
+            child = MemoryNode(each_neighbour, current, neighbour_cost, neighbour_priority)
+            by_state[each_neighbour] = child
+            current.children += 1
+            stored[0] += 1
+            openNode(child)
+        if current.children == 0:
+            current.f = sys.maxsize
+            forget(current)
+        while stored[0] > budget:
+            forget(popOpen(worst_heap, True))
+        if len(best_heap) > 4 * counter[1] + 64:
+            best_heap = [entry for entry in best_heap if entry[4].open and entry[4].version == entry[3]]
+            worst_heap = [entry for entry in worst_heap if entry[4].open and entry[4].version == entry[3]]
+            heapq.heapify(best_heap)
+            heapq.heapify(worst_heap)
+    path = []
+    if goal is not None:
+        if observer is not None:
+            observer.on_phase("reconstruct")
+        node = goal
+        while node is not None:
+            path.append(node.position)
+            node = node.parent
+        path.reverse()
+    if observer is not None:
+        observer.on_finish()
+    return path, num_states_explored
+
+
+def boundedSearch(maze, executor, budget):
+    """
+    Chains the legs of a memory-bounded executor from the start through every objective
+    :param maze:
+    :param executor: idastar_executor or smastar_executor
+    :param budget: passed on to every leg
+    :return: full_path, total_states_explored
+    """
+    start_state = maze.getStart()
+    objectives = maze.getObjectives()
+    full_path = []
+    total_states_explored = 0
+    while objectives:
+        path, states_explored = executor(maze, start_state, objectives, budget)
+        total_states_explored += states_explored
+        if not path:
+            break
+        full_path.extend(path)
+        objectives.remove(path[-1])
+        start_state = path[-1]
+    return full_path, total_states_explored
+
+
+def idastar(maze, budget=None):
+    """
+    The driver for IDA*, each leg an optimal path to the nearest remaining objective
+    :param maze:
+    :param budget: transposition table entries, MEMORY_BUDGET by default
+    :return: full_path, total_states_explored
+    """
+    return boundedSearch(maze, idastar_executor, budget)
+
+
+def smastar(maze, budget=None):
+    """
+    The driver for SMA*, each leg an optimal path to the nearest remaining objective when it fits in budget
+    :param maze:
+    :param budget: search tree nodes, MEMORY_BUDGET by default
+    :return: full_path, total_states_explored
+    """
+    return boundedSearch(maze, smastar_executor, budget)
+
+
+# ANYTIME SEARCH
+
+
+def anytimeAstar(maze, start_state, objectives, timeBudget=None, weights=None):
+    """
+    Anytime repairing A* (ARA*): weighted A* searches with f = g + w * h for each weight w of a falling schedule,
+    every one starting from the open list, g values and parents the one before left behind rather than from scratch.
+    A state whose g improves after it was expanded in the current search is not re-opened but parked on an
+    inconsistent list, which goes back on the open list when the weight drops; the open list is then re-keyed
+    with the new weight and the closed set cleared.
+    After every search that improved the path or its bound it yields the path to the cheapest objective reached
+    with its suboptimality bound, min(w, cost / smallest g + h on the open and inconsistent lists), which
+    reaches 1 when the path is optimal.
+    The first search always runs to the end, so there is always one path; the later ones stop at the time budget.
+    h is the minimum Manhattan distance to any objective. The g values and parents are int32 arrays indexed by cell
+    id; every path yielded has been walked back already, as the next search goes on changing the parents.
+    :param maze:
+    :param start_state:
+    :param objectives:
+    :param timeBudget: seconds, None for no limit
+    :param weights: falling weights ending with 1, ARA_WEIGHTS by default
+    :return: generator of (path, bound, num_states_explored so far); nothing if no objective can be reached
+    """
+    if weights is None:
+        weights = ARA_WEIGHTS
+    deadline = None if timeBudget is None else time.perf_counter() + timeBudget
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("search")
+    rows, cols = maze.getDimensions()
+    start_key = cellId(maze, start_state)
+    start_heuristic = getGreedyHeuristic(start_state, objectives)
+    heuristic = {start_state: start_heuristic}
+    g_score = costArray(maze)
+    g_score[start_key] = 0
+    parents = parentArray(maze)
+    goal, goal_cost = None, sys.maxsize
+    if start_state in objectives:
+        goal, goal_cost = start_state, 0
+    frontier = IndexedHeap()
+    frontier.push(start_key, (weights[0] * start_heuristic, start_heuristic), start_state)
+    inconsistent = {}
+    num_states_explored = 0
+    last = None
+    try:
+        for iteration, weight in enumerate(weights):
+            if iteration > 0:
+                reopened = [position for _, position, _ in frontier.items()] + list(inconsistent)
+                frontier = IndexedHeap()
+                for position in reopened:
+                    key = position[0] * cols + position[1]
+                    frontier.push(key, (g_score[key] + weight * heuristic[position], heuristic[position]), position)
+                inconsistent = {}
+            closed = bytearray(rows * cols)
+            while frontier and frontier.peek()[2][0] < goal_cost:
+                if deadline is not None and iteration > 0 and time.perf_counter() > deadline:
+                    return
+                current_key, current_position, priority = frontier.pop()
+                if observer is not None:
+                    observer.on_pop(current_position, priority, len(frontier))
+                closed[current_key] = 1
+                num_states_explored += 1
+                neighbour_cost = g_score[current_key] + 1
+                neighbour_nodes = maze.getNeighbors(current_position[0], current_position[1])
+                if observer is not None:
+                    observer.on_expand(current_position, neighbour_nodes)
+                for each_neighbour in neighbour_nodes:
+                    neighbour_key = each_neighbour[0] * cols + each_neighbour[1]
+                    if neighbour_cost >= g_score[neighbour_key]:
+                        if observer is not None:
+                            observer.on_stale(each_neighbour)
+                        continue
+                    g_score[neighbour_key] = neighbour_cost
+                    parents[neighbour_key] = current_key
+                    if each_neighbour in objectives:
+                        # objectives end the leg, so they are never expanded, only their g matters
+                        if neighbour_cost < goal_cost:
+                            goal, goal_cost = each_neighbour, neighbour_cost
+                        continue
+                    if closed[neighbour_key]:
+                        inconsistent[each_neighbour] = True
+                        continue
+                    neighbour_heuristic = heuristic.get(each_neighbour)
+                    if neighbour_heuristic is None:
+                        neighbour_heuristic = heuristic[each_neighbour] = getGreedyHeuristic(each_neighbour, objectives)
+                    neighbour_priority = (neighbour_cost + weight * neighbour_heuristic, neighbour_heuristic)
+                    frontier.push(neighbour_key, neighbour_priority, each_neighbour)
+                    if observer is not None:
+                        observer.on_push(each_neighbour, neighbour_priority, len(frontier))
+            if goal is None:
+                return
+            lower = min([g_score[key] + heuristic[position] for key, position, _ in frontier.items()] +
+                        [g_score[cellId(maze, position)] + heuristic[position] for position in inconsistent] +
+                        [goal_cost])
+            bound = min(weight, goal_cost / lower) if lower > 0 else 1.0
+            if (goal_cost, bound) != last:
+                last = (goal_cost, bound)
+                if observer is not None:
+                    observer.on_goal(goal)
+                path = PathView(parents, cols, start_key, cellId(maze, goal))
+                path.ids()
+                yield path, bound, num_states_explored
+            if bound <= 1.0:
+                return
+    finally:
+        if observer is not None:
+            observer.on_finish()
+
+
+def arastar_executor(maze, start_state, objectives, timeBudget=None):
+    """
+    Runs anytimeAstar until it proves its path optimal or the time budget runs out
+    :param maze:
+    :param start_state:
+    :param objectives:
+    :param timeBudget: seconds, None for no limit
+    :return: the last path found, num_states_explored
+    """
+    path, num_states_explored = [], 0
+    for path, _, num_states_explored in anytimeAstar(maze, start_state, objectives, timeBudget):
+        pass
+    return path, num_states_explored
+
+
+def arastar(maze, timeBudget=None):
+    """
+    The driver for ARA*, which splits the time budget evenly over the legs still to run
+    :param maze:
+    :param timeBudget: seconds for the whole maze, ARA_TIME_BUDGET by default
+    :return: full_path, total_states_explored
+    """
+    if timeBudget is None:
+        timeBudget = ARA_TIME_BUDGET
+    deadline = time.perf_counter() + timeBudget
+    start_state = maze.getStart()
+    objectives = maze.getObjectives()
+    full_path = []
+    total_states_explored = 0
+    while objectives:
+        leg_budget = max(deadline - time.perf_counter(), 0.0) / len(objectives)
+        path, states_explored = arastar_executor(maze, start_state, objectives, leg_budget)
         total_states_explored += states_explored
+        if not path:
+            break
+        full_path.extend(path)
         objectives.remove(path[-1])
         start_state = path[-1]
     return full_path, total_states_explored
 
 
+# CORRIDOR CONTRACTION
+
+
+def junction_executor(maze, start_state, objectives, graph, useHeuristic=True):
+    """
+    A* (Dijkstra without the heuristic) over a JunctionGraph, from a node to the nearest objective.
+    Edges are weighted with their corridor lengths and the Manhattan distance between two nodes is never more
+    than the corridor joining them, so the minimum Manhattan distance to an objective stays admissible
+    and the leg is optimal either way. Only nodes are pushed and expanded; the corridors of the edges
+    on the path are walked back into cells at the end.
+    :param maze:
+    :param start_state: a node of graph
+    :param objectives: nodes of graph
+    :param graph: JunctionGraph of the maze that keeps start_state and the objectives
+    :param useHeuristic: False for Dijkstra
+    :return: path, num_states_explored (nodes expanded)
+    """
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("search")
+    cols = maze.getDimensions()[1]
+    frontier = IndexedHeap()
+    start_heuristic = getGreedyHeuristic(start_state, objectives) if useHeuristic else 0
+    frontier.push(cellId(maze, start_state), (start_heuristic, start_heuristic), start_state)
+    if observer is not None:
+        observer.on_push(start_state, (start_heuristic, start_heuristic), len(frontier))
+    parent_map = {}
+    g_score = {start_state: 0}
+    closed = set()
+    num_states_explored = 0
+    flag = False
+    while frontier:
+        _, current_node, priority = frontier.pop()
+        if observer is not None:
+            observer.on_pop(current_node, priority, len(frontier))
+        closed.add(current_node)
+        num_states_explored += 1
+        if current_node in objectives:
+            current_goal = current_node
+            flag = True
+            if observer is not None:
+                observer.on_goal(current_node)
+            break
+        node_edges = graph.nodeEdges(current_node)
+        if observer is not None:
+            observer.on_expand(current_node, [end for end, _, _ in node_edges])
+        for end, length, step in node_edges:
+            end_cost = g_score[current_node] + length
+            if end in closed or end_cost >= g_score.get(end, sys.maxsize):
+                if observer is not None:
+                    observer.on_stale(end)
+                continue
+            g_score[end] = end_cost
+            parent_map[end] = (current_node, step)
+            end_heuristic = getGreedyHeuristic(end, objectives) if useHeuristic else 0
+            end_priority = (end_cost + end_heuristic, end_heuristic)
+            frontier.push(end[0] * cols + end[1], end_priority, end)
+            if observer is not None:
+                observer.on_push(end, end_priority, len(frontier))
+    recordFrontierStats(frontier)
+    path = []
+    if flag:
+        if observer is not None:
+            observer.on_phase("reconstruct")
+        path = [current_goal]
+        node = current_goal
+        while node != start_state:
+            previous, step = parent_map[node]
+            corridor = graph.expandEdge(previous, step, node)
+            path.extend(reversed(corridor[:-1]))
+            node = previous
+        path.reverse()
+    if observer is not None:
+        observer.on_finish()
+    return path, num_states_explored
+
+
+def junction(maze, useHeuristic=True):
+    """
+    The driver for the junction graph search: one junction_executor leg per objective over a JunctionGraph
+    that keeps the start and every objective as nodes. The graph is shared by the legs, so a corridor is walked
+    at most once per direction however many legs cross it; the walking is not counted as states explored
+    :param maze:
+    :param useHeuristic: False for Dijkstra
+    :return: full_path, total_states_explored
+    """
+    resetFrontierStats()
+    start_state = maze.getStart()
+    objectives = maze.getObjectives()
+    graph = JunctionGraph(maze, [start_state] + objectives)
+    full_path = []
+    total_states_explored = 0
+    while objectives:
+        path, states_explored = junction_executor(maze, start_state, objectives, graph, useHeuristic)
+        total_states_explored += states_explored
+        if not path:
+            break
+        full_path.extend(path)
+        objectives.remove(path[-1])
+        start_state = path[-1]
+    return full_path, total_states_explored
+
+
+def junction_dijkstra(maze):
+    """
+    The driver for Dijkstra over the junction graph
+    :param maze:
+    :return: full_path, total_states_explored
+    """
+    return junction(maze, False)
+
+
+def dstar(maze):
+    """
+    The driver for D* Lite: one DStarLite plans every leg. After a leg the maze's start is moved to the objective
+    it reached and that objective is taken off, so the next leg repairs the distances the previous one left
+    instead of searching again. The maze's start and objectives are put back at the end
+    :param maze:
+    :return: full_path, total_states_explored
+    """
+    resetFrontierStats()
+    start_state = maze.getStart()
+    objectives = maze.getObjectives()
+    remaining = list(objectives)
+    engine = DStarLite(maze)
+    full_path = []
+    total_states_explored = 0
+    try:
+        while remaining:
+            path, states_explored = engine.replan()
+            total_states_explored += states_explored
+            if not path:
+                break
+            full_path.extend(path)
+            remaining.remove(path[-1])
+            maze.setStart(path[-1])
+            maze.setObjectives(list(remaining))
+    finally:
+        maze.setStart(start_state)
+        maze.setObjectives(objectives)
+    recordFrontierStats(engine.queue)
+    return full_path, total_states_explored
+
+
+def hpastar(maze):
+    """
+    The driver for HPA*: one ClusterGraph.findPath leg per objective, over the abstract graph clusterGraph()
+    builds or loads from its cache. Each leg ends at the objective nearest to the start as far as the abstract
+    graph can tell, and its path is near-optimal rather than shortest
+    :param maze:
+    :return: full_path, total_states_explored
+    """
+    resetFrontierStats()
+    graph = clusterGraph(maze)
+    start_state = maze.getStart()
+    objectives = maze.getObjectives()
+    full_path = []
+    total_states_explored = 0
+    while objectives:
+        path, states_explored = graph.findPath(start_state, objectives)
+        total_states_explored += states_explored
+        if not path:
+            break
+        full_path.extend(path)
+        objectives.remove(path[-1])
+        start_state = path[-1]
+    return full_path, total_states_explored
+
+
+# BIDIRECTIONAL SEARCH
+
+
+def bibfs_executor(maze, start_state, goal):
+    """
+    Bidirectional BFS between start_state and a single goal
+    One BFS grows from each end, a whole level at a time, always on the side with the smaller frontier.
+    The first level that touches the other side's discovered cells is finished before stopping and the
+    cheapest meeting of that level is kept, so the path is as short as the one-sided BFS finds
+    :param maze:
+    :param start_state:
+    :param goal:
+    :return: path, num_states_explored (cells expanded by both sides)
+    """
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("search")
+    if start_state == goal:
+        if observer is not None:
+            observer.on_goal(goal)
+            observer.on_finish()
+        return [start_state], 1
+    cols = maze.getDimensions()[1]
+    start_key, goal_key = cellId(maze, start_state), cellId(maze, goal)
+    parents = (parentArray(maze), parentArray(maze))
+    depths = (costArray(maze), costArray(maze))
+    depths[0][start_key] = 0
+    depths[1][goal_key] = 0
+    frontiers = ([start_key], [goal_key])
+    num_states_explored = 0
+    meeting = None
+    while frontiers[0] and frontiers[1] and meeting is None:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parent_map, depth, other_depth = parents[side], depths[side], depths[1 - side]
+        best_cost = sys.maxsize
+        next_frontier = []
+        for index, current_key in enumerate(frontiers[side]):
+            current = divmod(current_key, cols)
+            if observer is not None:
+                observer.on_pop(current, None, len(frontiers[side]) - index - 1 + len(next_frontier))
+            num_states_explored += 1
+            neighbour_nodes = maze.getNeighbors(current[0], current[1])
+            if observer is not None:
+                observer.on_expand(current, neighbour_nodes)
+            for each_neighbour in neighbour_nodes:
+                neighbour_key = each_neighbour[0] * cols + each_neighbour[1]
+                if other_depth[neighbour_key] != UNSEEN:
+                    cost = depth[current_key] + 1 + other_depth[neighbour_key]
+                    if cost < best_cost:
+                        best_cost = cost
+                        meeting = (current_key, neighbour_key) if side == 0 else (neighbour_key, current_key)
+                if depth[neighbour_key] == UNSEEN:
+                    depth[neighbour_key] = depth[current_key] + 1
+                    parent_map[neighbour_key] = current_key
+                    next_frontier.append(neighbour_key)
+                    if observer is not None:
+                        observer.on_push(each_neighbour, None, len(frontiers[side]) - index - 1 + len(next_frontier))
+                elif observer is not None:
+                    observer.on_stale(each_neighbour)
+        frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+    path = []
+    if meeting is not None:
+        if observer is not None:
+            observer.on_goal(goal)
+            observer.on_phase("reconstruct")
+        path = joinHalves(parents, meeting, cols)
+    if observer is not None:
+        observer.on_finish()
+    return path, num_states_explored
+
+
+def biastar_executor(maze, start_state, goal):
+    """
+    Bidirectional (front-to-end) A* between start_state and a single goal
+    The forward search is guided by the Manhattan distance to goal and the backward one by the Manhattan
+    distance to start_state; each step expands the side with the smaller frontier.
+    Whenever a relaxed state has a g value on the other side, start -> state -> goal is a path and the best
+    such cost is kept as best_cost. With a consistent heuristic every shorter path would still have a state
+    with f < best_cost on both frontiers, so the search stops as soon as either frontier's smallest f
+    reaches best_cost
+    :param maze:
+    :param start_state:
+    :param goal:
+    :return: path, num_states_explored (expansions of both sides)
+    """
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("search")
+    cols = maze.getDimensions()[1]
+    ends = (goal, start_state)
+    frontiers = (IndexedHeap(), IndexedHeap())
+    g_scores = (costArray(maze), costArray(maze))
+    parents = (parentArray(maze), parentArray(maze))
+    for side, state in enumerate((start_state, goal)):
+        heuristic = getAstarHeuristicMinDistanceToAnyObjective(state, [ends[side]])
+        g_scores[side][cellId(maze, state)] = 0
+        frontiers[side].push(cellId(maze, state), (heuristic, heuristic), state)
+        if observer is not None:
+            observer.on_push(state, (heuristic, heuristic), len(frontiers[side]))
+    best_cost = 0 if start_state == goal else sys.maxsize
+    meeting = (cellId(maze, start_state), cellId(maze, start_state))
+    num_states_explored = 0
+    while frontiers[0] and frontiers[1]:
+        if max(frontiers[0].peek()[2][0], frontiers[1].peek()[2][0]) >= best_cost:
+            break
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        frontier, g_score, parent_map, other_g = frontiers[side], g_scores[side], parents[side], g_scores[1 - side]
+        current_key, current, priority = frontier.pop()
+        if observer is not None:
+            observer.on_pop(current, priority, len(frontier))
+        num_states_explored += 1
+        neighbour_cost = g_score[current_key] + 1
+        neighbour_nodes = maze.getNeighbors(current[0], current[1])
+        if observer is not None:
+            observer.on_expand(current, neighbour_nodes)
+        for each_neighbour in neighbour_nodes:
+            neighbour_key = each_neighbour[0] * cols + each_neighbour[1]
+            if neighbour_cost < g_score[neighbour_key]:
+                g_score[neighbour_key] = neighbour_cost
+                parent_map[neighbour_key] = current_key
+                neighbour_heuristic = getAstarHeuristicMinDistanceToAnyObjective(each_neighbour, [ends[side]])
+                neighbour_priority = (neighbour_heuristic + neighbour_cost, neighbour_heuristic)
+                frontier.push(neighbour_key, neighbour_priority, each_neighbour)
+                if observer is not None:
+                    observer.on_push(each_neighbour, neighbour_priority, len(frontier))
+                if other_g[neighbour_key] != UNSEEN and neighbour_cost + other_g[neighbour_key] < best_cost:
+                    best_cost = neighbour_cost + other_g[neighbour_key]
+                    meeting = (neighbour_key, neighbour_key)
+            elif neighbour_key in frontier:
+                frontier.noteDuplicate()
+                if observer is not None:
+                    observer.on_stale(each_neighbour)
+    recordFrontierStats(frontiers[0])
+    recordFrontierStats(frontiers[1])
+    path = []
+    if best_cost != sys.maxsize:
+        if observer is not None:
+            observer.on_goal(goal)
+            observer.on_phase("reconstruct")
+        path = joinHalves(parents, meeting, cols)
+    if observer is not None:
+        observer.on_finish()
+    return path, num_states_explored
+
+
+def joinHalves(parents, meeting, cols):
+    """
+    Joins the two halves of a bidirectional search
+    :param parents: (forward parent array, backward parent array), UNREACHABLE at each root
+    :param meeting: (last cell id of the forward half, first cell id of the backward half), the same cell
+                    when both halves end on it
+    :param cols: number of columns of the maze
+    :return: list of states from the forward root to the backward root
+    """
+    cells = [meeting[0]]
+    while parents[0][cells[-1]] != UNREACHABLE:
+        cells.append(parents[0][cells[-1]])
+    cells.reverse()
+    cell = meeting[1] if meeting[1] != meeting[0] else parents[1][meeting[1]]
+    while cell != UNREACHABLE:
+        cells.append(cell)
+        cell = parents[1][cell]
+    return [divmod(cell, cols) for cell in cells]
+
+
+def bidirectional(maze, executor):
+    """
+    Chains a bidirectional executor over the objectives, each leg going to the remaining objective
+    nearest by Manhattan distance, since a bidirectional search needs one goal to grow from
+    :param maze:
+    :param executor: bibfs_executor or biastar_executor
+    :return: full_path, total_states_explored
+    """
+    resetFrontierStats()
+    start_state = maze.getStart()
+    objectives = maze.getObjectives()
+    full_path = []
+    total_states_explored = 0
+    while objectives:
+        goal = min(objectives, key=lambda objective: getAstarHeuristicMinDistanceToAnyObjective(start_state, [objective]))
+        path, states_explored = executor(maze, start_state, goal)
+        total_states_explored += states_explored
+        if not path:
+            break
+        full_path.extend(path)
+        objectives.remove(goal)
+        start_state = goal
+    return full_path, total_states_explored
+
+
+def bibfs(maze):
+    """
+    The driver for bidirectional BFS
+    :param maze:
+    :return: full_path, total_states_explored
+    """
+    return bidirectional(maze, bibfs_executor)
+
+
+def biastar(maze):
+    """
+    The driver for bidirectional A*
+    :param maze:
+    :return: full_path, total_states_explored
+    """
+    return bidirectional(maze, biastar_executor)
+
+
+# JUMP POINT SEARCH
+
+
+def jps_executor(maze, start_state, objectives):
+    """
+    A* over jump points (see jps.py) instead of cells, for grid Mazes
+    The step from one jump point to the next is a straight line, so its cost is the Manhattan distance
+    between them and the unweighted minimum Manhattan heuristic stays consistent: the leg found is as
+    short as the one BFS finds, while only the jump points are pushed and expanded.
+    :param maze:
+    :param start_state:
+    :param objectives:
+    :return: path, num_states_explored (jump points expanded)
+    """
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("search")
+    goals = set(objectives)
+    cols = maze.getDimensions()[1]
+    start_key = cellId(maze, start_state)
+    frontier = IndexedHeap()
+    start_heuristic = getAstarHeuristicMinDistanceToAnyObjective(start_state, objectives)
+    frontier.push(start_key, (start_heuristic, start_heuristic), (start_state, None))
+    if observer is not None:
+        observer.on_push(start_state, (start_heuristic, start_heuristic), len(frontier))
+    parents = parentArray(maze)
+    g_score = costArray(maze)
+    g_score[start_key] = 0
+    num_states_explored = 0
+    flag = False
+    while frontier:
+        current_key, (current_position, direction), priority = frontier.pop()
+        if observer is not None:
+            observer.on_pop(current_position, priority, len(frontier))
+        num_states_explored += 1
+
+        if current_position in goals:
+            current_goal = current_key
+            flag = True
+            if observer is not None:
+                observer.on_goal(current_position)
+            break
+        successors = jumpSuccessors(maze, current_position, direction, goals)
+        if observer is not None:
+            observer.on_expand(current_position, [jump_point for jump_point, _ in successors])
+        for jump_point, move in successors:
+            jump_key = jump_point[0] * cols + jump_point[1]
+            jump_cost = g_score[current_key] + abs(jump_point[0] - current_position[0]) + \
+                        abs(jump_point[1] - current_position[1])
+            if jump_cost < g_score[jump_key]:
+                g_score[jump_key] = jump_cost
+                parents[jump_key] = current_key
+                jump_heuristic = getAstarHeuristicMinDistanceToAnyObjective(jump_point, objectives)
+                jump_priority = (jump_heuristic + jump_cost, jump_heuristic)
+                frontier.push(jump_key, jump_priority, (jump_point, move))
+                if observer is not None:
+                    observer.on_push(jump_point, jump_priority, len(frontier))
+            elif jump_key in frontier:
+                frontier.noteDuplicate()
+                if observer is not None:
+                    observer.on_stale(jump_point)
+    recordFrontierStats(frontier)
+    path = []
+    if flag:
+        if observer is not None:
+            observer.on_phase("reconstruct")
+        jump_points = PathView(parents, cols, start_key, current_goal).positions()
+        path = [start_state]
+        for a, b in zip(jump_points, jump_points[1:]):
+            path.extend(expandSegment(a, b))
+    if observer is not None:
+        observer.on_finish()
+    return path, num_states_explored
+
+
+def jps(maze):
+    """
+    The driver for Jump Point Search, chaining legs to the nearest remaining objective like astar
+    :param maze:
+    :return: full_path, total_states_explored
+    """
+    resetFrontierStats()
+    start_state = maze.getStart()
+    objectives = maze.getObjectives()
+    full_path = []
+    total_states_explored = 0
+    while objectives:
+        path, states_explored = jps_executor(maze, start_state, objectives)
+        total_states_explored += states_explored
+        if not path:
+            break
+        full_path.extend(path)
+        objectives.remove(path[-1])
+        start_state = path[-1]
+    return full_path, total_states_explored
+
+
+
+# MULTI-OBJECTIVE ASTAR SEARCH
+
+
+def astar_mst_executor(maze, start_state, objectives):
+    """
+    A* over the product state space (cell, remaining-objective bitmask), which finds one optimal path
+    through all objectives instead of chaining optimal legs.
+    Bit j of the mask is set while objectives[j] has not been visited; the goal is any state with mask 0.
+    The heuristic is getAstarHeuristicMSTPreComputed. It is admissible but not consistent: it can drop by more
+    than one in a step, when the nearest remaining objective is visited and the MST is taken over a smaller set.
+    A closed state whose g_score improves is therefore re-opened, which is what keeps the path optimal.
+    The objective distance matrix and mstCache are built before the search starts.
+    :param maze:
+    :param start_state:
+    :param objectives:
+    :return: path, num_states_explored (A* expansions, not counting the BFS passes of the precompute)
+    """
+    global mstCache
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("precompute")
+    distances = calculateAllDistances(maze, start_state, objectives)
+    mstCache = MSTCache([[distances.distance(a, b) for b in objectives] for a in objectives])
+    objective_bits = {}
+    for j, each_objective in enumerate(objectives):
+        objective_bits[each_objective] = 1 << j
+    num_cells = maze.getDimensions()[0] * maze.getDimensions()[1]
+    start_mask = ((1 << len(objectives)) - 1) & ~objective_bits.get(start_state, 0)
+    start = (start_state, start_mask)
+
+    if observer is not None:
+        observer.on_phase("search")
+    frontier = IndexedHeap()
+    start_heuristic = getAstarHeuristicMSTPreComputed(start_state, start_mask, objectives)
+    frontier.push(start_mask * num_cells + cellId(maze, start_state), (start_heuristic, start_heuristic), start)
+    if observer is not None:
+        observer.on_push(start, (start_heuristic, start_heuristic), len(frontier))
+    parent_map = {}
+    g_score = {start: 0}
+    num_states_explored = 0
+    flag = False
+    while frontier:
+        _, current, priority = frontier.pop()
+        if observer is not None:
+            observer.on_pop(current, priority, len(frontier))
+        num_states_explored += 1
+        current_position, current_mask = current
+
+        if current_mask == 0:
+            current_goal = current
+            flag = True
+            if observer is not None:
+                observer.on_goal(current)
+            break
+        neighbour_cost = g_score[current] + 1
+        neighbour_nodes = maze.getNeighbors(current_position[0], current_position[1])
+        if observer is not None:
+            observer.on_expand(current, neighbour_nodes)
+        for each_neighbour in neighbour_nodes:
+            neighbour_mask = current_mask & ~objective_bits.get(each_neighbour, 0)
+            neighbour = (each_neighbour, neighbour_mask)
+            neighbour_key = neighbour_mask * num_cells + cellId(maze, each_neighbour)
+            if neighbour_cost < g_score.get(neighbour, sys.maxsize):
+                neighbour_heuristic = getAstarHeuristicMSTPreComputed(each_neighbour, neighbour_mask, objectives)
+                if neighbour_heuristic >= sys.maxsize:
+                    continue
+                g_score[neighbour] = neighbour_cost
+                parent_map[neighbour] = current
+                neighbour_priority = (neighbour_heuristic + neighbour_cost, neighbour_heuristic)
+                frontier.push(neighbour_key, neighbour_priority, neighbour)
+                if observer is not None:
+                    observer.on_push(neighbour, neighbour_priority, len(frontier))
+            elif neighbour_key in frontier:
+                frontier.noteDuplicate()
+                if observer is not None:
+                    observer.on_stale(neighbour)
+    recordFrontierStats(frontier)
+    path = []
+    if flag:
+        if observer is not None:
+            observer.on_phase("reconstruct")
+        path = [state[0] for state in backtrace(parent_map, start, current_goal)]
+    if observer is not None:
+        observer.on_finish()
+    return path, num_states_explored
+
+
+def astar_mst(maze):
+    """
+    The driver for multi-objective A* with the MST heuristic
+    mstCache.stats() has the cache hit and miss counts once it returns
+    :param maze:
+    :return: full_path, total_states_explored
+    """
+    resetFrontierStats()
+    return astar_mst_executor(maze, maze.getStart(), maze.getObjectives())
+
+
+def tsp_executor(maze, start_state, objectives):
+    """
+    Treats the objectives as a travelling salesman problem on the exact maze distances.
+    tsp.tourOrder picks the visiting order (Held-Karp up to tsp.HELD_KARP_LIMIT objectives, local search above),
+    then the shortest path of every leg is read off the BFS trees and the legs are stitched together
+    :param maze:
+    :param start_state:
+    :param objectives:
+    :return: path, num_states_explored (the BFS passes - the ordering itself expands no cells); the path is []
+             when some objective is unreachable
+    """
+    observer = observers.attached
+    distances = calculateAllDistances(maze, start_state, objectives, keepTrees=True)
+    if UNREACHABLE in distances.matrix[0]:
+        # an objective that cannot be reached leaves no tour at all; the ordering would only drop it
+        if observer is not None:
+            observer.on_finish()
+        return [], distances.states_explored
+    if observer is not None:
+        observer.on_phase("search")
+    order = tourOrder(distances.matrix)
+    if observer is not None:
+        observer.on_phase("reconstruct")
+    full_path = [start_state]
+    for a, b in zip(order, order[1:]):
+        leg = distances.path(distances.points[a], distances.points[b])
+        if not leg:
+            break
+        full_path.extend(leg[1:])
+        if observer is not None:
+            observer.on_goal(leg[-1])
+    if observer is not None:
+        observer.on_finish()
+    return full_path, distances.states_explored
+
+
+def tsp(maze):
+    """
+    The driver for the tsp search method
+    :param maze:
+    :return: full_path, total_states_explored
+    """
+    return tsp_executor(maze, maze.getStart(), maze.getObjectives())
+
 
 # HEURISTICS
 
@@ -341,13 +1676,14 @@ def getAstarHeuristicMinDistanceToAnyObjective(current_state, objectives):
     return min_heuristic
 
 
-def getWeightedAstarHeuristicMinDistanceToAnyObjective(current_state, objectives):
+def getWeightedAstarHeuristicMinDistanceToAnyObjective(current_state, objectives, weight=None):
     """
        This is a wighted Manhattan Distance heuristic
        We return the minimum manhattan distance to the nearest goal and multiply it by a constant factor
-       Another implementation could have been where we vary the constant weight to see what gives the best result
+       when there are more than two objectives; anytimeAstar (arastar) varies the weight instead
        :param current_state:
        :param objectives:
+       :param weight: ASTAR_WEIGHT by default
        :return: heuritic value
        """
     min_heuristic = sys.maxsize
@@ -356,7 +1692,7 @@ def getWeightedAstarHeuristicMinDistanceToAnyObjective(current_state, objectives
         if manhattan_objective < min_heuristic:
             min_heuristic = manhattan_objective
     if len(objectives) > 2:
-        return 2 * min_heuristic
+        return (ASTAR_WEIGHT if weight is None else weight) * min_heuristic
     else:
         return min_heuristic
 
@@ -398,7 +1734,8 @@ def getAstarHeuristicSumOfMinimumConnectedGoals(current_state, objectives):
 def getAstarHeuristicSumOfMinimumConnectedGoalsPreComputed(current_state, objectives):
     """
         This is used in association with the next method (aggregatedCostFromObjectiveToAllOthers)
-        The logic is that we precompute the manhattan distance from a each objective to every other objective
+        The logic is that we precompute the maze distance from a each objective to every other objective
+        (calculateAllDistances); without that, only the manhattan distance to the nearest goal is returned
         Then we calculate the heuristic value as
         h(x) = cost from current to nearest goal, dijkstra cost from that to all other goals
         This was our most promising effort, but sadly we are getting a suboptimal result with this heuristic
@@ -406,19 +1743,46 @@ def getAstarHeuristicSumOfMinimumConnectedGoalsPreComputed(current_state, object
         :param objectives:
         :return: heuristic value
         """
+    if not objectives:
+        return 0
     min_heuristic = sys.maxsize
     for each_objective in objectives:
         manhattan_objective = abs(current_state[0] - each_objective[0]) + abs(current_state[1] - each_objective[1])
         if manhattan_objective < min_heuristic:
             min_heuristic = manhattan_objective
             min_objective = each_objective
+    if objectiveDistances is None:
+        return min_heuristic
     return min_heuristic + aggregatedCostFromObjectiveToAllOthers(min_objective, objectives)
 
 
+def getAstarHeuristicMSTPreComputed(current_state, mask, objectives):
+    """
+    The admissible version of the idea above, for the (cell, bitmask) states of astar_mst_executor
+    h(x) = manhattan distance from current to the nearest remaining goal + weight of the MST over the remaining goals
+    Every tour through the remaining goals has to reach one of them and then span the rest, so this never
+    overestimates. The MST is over the exact maze distances in objectiveDistances, and comes from mstCache,
+    which memoises it per mask because the same set of remaining goals shows up at a huge number of cells
+    :param current_state:
+    :param mask: bit j set while objectives[j] is still to be visited
+    :param objectives:
+    :return: heuristic value, sys.maxsize if the remaining goals are not connected to each other
+    """
+    if mask == 0:
+        return 0
+    min_heuristic = sys.maxsize
+    for j, each_objective in enumerate(objectives):
+        if mask >> j & 1:
+            manhattan_objective = abs(current_state[0] - each_objective[0]) + abs(current_state[1] - each_objective[1])
+            if manhattan_objective < min_heuristic:
+                min_heuristic = manhattan_objective
+    return min(min_heuristic + mstCache.weight(mask), sys.maxsize)
+
+
 def aggregatedCostFromObjectiveToAllOthers(current, objectives):
     """
     Calculates the Dijkstra single source all paths distance between each goal state
-    We make use of the pre computed distance matrix
+    We make use of the pre computed distance matrix in objectiveDistances
     :param current:
     :param objectives:
     :return:
@@ -435,7 +1799,10 @@ def aggregatedCostFromObjectiveToAllOthers(current, objectives):
         for neighbour, cost in dijkstraMap.items():
             if neighbour == current_vertex:
                 continue
-            alternative_route = dijkstraMap[current_vertex] + distanceMap[current_vertex, neighbour]
+            edge = objectiveDistances.distance(current_vertex, neighbour)
+            if edge == UNREACHABLE:
+                continue
+            alternative_route = dijkstraMap[current_vertex] + edge
             if alternative_route < dijkstraMap[neighbour]:
                 dijkstraMap[neighbour] = alternative_route
         new_objectives.remove(current_vertex)
@@ -467,24 +1834,51 @@ def backtrace(parent_map, start, end):
     return path
 
 
-def calculateAllDistances(maze, start, objectives):
+def cellId(maze, position):
+    """
+    Flat id of a (row, col) position, row * cols + col, used to key the frontier
+    :param maze:
+    :param position:
+    :return: int
+    """
+    return position[0] * maze.getDimensions()[1] + position[1]
+
+
+def resetFrontierStats():
     """
-    This is a utility function that populates distanceMap
-    It finds the manhattan distance from the current goal to all other goals
+    Clears frontierStats, called by the drivers before the first executor runs
+    :return:
+    """
+    frontierStats["stale_pops_avoided"] = 0
+    frontierStats["peak_frontier_size"] = 0
+
+
+def recordFrontierStats(frontier):
+    """
+    Adds the counters of a finished executor's frontier to frontierStats
+    :param frontier: IndexedHeap
+    :return:
+    """
+    frontierStats["stale_pops_avoided"] += frontier.stale_pops_avoided
+    frontierStats["peak_frontier_size"] = max(frontierStats["peak_frontier_size"], frontier.peak_size)
+
+
+def calculateAllDistances(maze, start, objectives, keepTrees=False):
+    """
+    This is a utility function that populates objectiveDistances
+    It runs one BFS from the start and from each objective, and stores the exact maze distance
+    between every pair of them in a NumPy matrix
     :param maze:
     :param start:
     :param objectives:
-    :return:
+    :param keepTrees: also keep the BFS trees, needed to read paths between the points
+    :return: the ObjectiveDistances
     """
-    for objective in objectives:
-        manhattan_distance = abs(start[0] - objective[0]) + abs(start[1] - objective[1])
-        distanceMap[(start, objective)] = manhattan_distance
-    for objective1 in objectives:
-        for objective2 in objectives:
-            if objective1 == objective2:
-                continue
-            if (objective2, objective1) in distanceMap.keys():
-                distanceMap[(objective1, objective2)] = distanceMap[(objective2, objective1)]
-            else:
-                manhattan_distance = abs(objective1[0] - objective2[0]) + abs(objective1[1] - objective2[1])
-                distanceMap[objective1,objective2] = manhattan_distance
+    global objectiveDistances
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("precompute")
+    objectiveDistances = ObjectiveDistances(maze, [start] + list(objectives), keepTrees)
+    if observer is not None:
+        observer.on_finish()
+    return objectiveDistances
@@ -0,0 +1,50 @@
+# test_batch.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the headless batch runner and the headless mode of mp1.py.
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+
+import batch
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_batch_emits_one_json_line_per_pair():
+    out = io.StringIO()
+    filenames = batch.expandMazeFiles([os.path.join(HERE, "medium*.txt"), os.path.join(HERE, "mediumMaze.txt")])
+    assert [os.path.basename(filename) for filename in filenames] == ["mediumMaze.txt", "mediumSearch.txt"]
+    failures = batch.runBatch(filenames, ["astar", "jps"], out)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert failures == 0
+    assert [(os.path.basename(r["maze"]), r["method"]) for r in records] == [
+        ("mediumMaze.txt", "astar"), ("mediumMaze.txt", "jps"), ("mediumSearch.txt", "astar"), ("mediumSearch.txt", "jps")]
+    assert records[0]["path_length"] == 107 and records[0]["states_explored"] == 482
+    assert all(r["wall_seconds"] > 0 and r["peak_memory_bytes"] > 0 for r in records)
+
+
+def test_batch_reports_errors_and_untraced_runs():
+    record = batch.runOne(os.path.join(HERE, "tinySearch.txt"), "no_such_method")
+    assert "error" in record and "path_length" not in record
+    record = batch.runOne(os.path.join(HERE, "tinySearch.txt"), "astar", traceMemory=False)
+    assert record["peak_memory_bytes"] is None and record["path_length"] == 49
+
+
+def test_headless_runs_never_import_pygame():
+    code = ("import sys, mp1, batch; "
+            "batch.runOne('tinySearch.txt', 'astar'); "
+            "mp1.Application(False).execute('tinySearch.txt', 'astar_mst', None, headless=True); "
+            "assert 'pygame' not in sys.modules")
+    result = subprocess.run([sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert "Path Length: 37" in result.stdout
@@ -0,0 +1,86 @@
+# test_contraction.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the corridor contraction and the junction graph searches.
+"""
+
+import os
+
+import pytest
+
+from contraction import JunctionGraph
+from distances import bfsTree
+from generate import generateMaze, writeMaze
+from maze import Maze
+import search_alt
+from test_search import writeRandomMaze
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.mark.parametrize("filename", ["mediumMaze.txt", "bigMaze.txt", "openMaze.txt", "mediumSearch.txt"])
+def test_edges_are_symmetric_corridors(filename):
+    maze = Maze(os.path.join(HERE, filename))
+    graph = JunctionGraph(maze, [maze.getStart()] + maze.getObjectives()).build()
+    open_cells = sum(maze.isValidMove(row, col) for row in range(maze.rows) for col in range(maze.cols))
+    assert len(graph) + graph.corridorCells == open_cells
+    for node, node_edges in graph.edges.items():
+        assert graph.isNode(node)
+        for end, length, step in node_edges:
+            corridor = graph.expandEdge(node, step, end)
+            assert len(corridor) == length + 1 and corridor[0] == node and corridor[-1] == end
+            assert not any(graph.isNode(cell) for cell in corridor[1:-1])
+            for a, b in zip(corridor, corridor[1:]):
+                assert b in maze.getNeighbors(a[0], a[1])
+            assert any(back == node and back_length == length for back, back_length, _ in graph.edges[end])
+
+
+@pytest.mark.parametrize("method", ["junction", "junction_dijkstra"])
+@pytest.mark.parametrize("filename", ["mediumMaze.txt", "bigMaze.txt", "openMaze.txt"])
+def test_junction_path_length_matches_bfs(method, filename):
+    maze = Maze(os.path.join(HERE, filename))
+    objective = maze.getObjectives()[0]
+    distance = bfsTree(maze, maze.getStart())[0][maze.getCellId(objective[0], objective[1])]
+    path, _ = search_alt.search(maze, method)
+    assert len(path) == distance + 1 and path[0] == maze.getStart() and path[-1] == objective
+    for a, b in zip(path, path[1:]):
+        assert b in maze.getNeighbors(a[0], a[1])
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_junction_optimal_on_random_grids(seed):
+    maze = writeRandomMaze(4 + seed % 17, 4 + seed * 7 % 19, (0, 0.1, 0.2, 0.3, 0.4)[seed % 5], seed)
+    start, objective = maze.getStart(), maze.getObjectives()[0]
+    distance = bfsTree(maze, start)[0][maze.getCellId(objective[0], objective[1])]
+    graph = JunctionGraph(maze, [start, objective])
+    for useHeuristic in (True, False):
+        path, _ = search_alt.junction_executor(maze, start, [objective], graph, useHeuristic)
+        if distance == -1:
+            assert path == []
+        else:
+            assert len(path) == distance + 1 and path[0] == start and path[-1] == objective
+            for a, b in zip(path, path[1:]):
+                assert b in maze.getNeighbors(a[0], a[1])
+
+
+def test_corridor_mazes_expand_far_fewer_states(tmp_path):
+    filename = str(tmp_path / "perfect.txt")
+    writeMaze(generateMaze("perfect", 201, 201, seed=4), filename)
+    maze = Maze(filename)
+    astar_path, astar_states = search_alt.astar(maze)
+    path, states_explored = search_alt.search(maze, "junction")
+    assert len(path) == len(astar_path)
+    assert states_explored * 5 < astar_states
+
+
+def test_junction_visits_every_objective():
+    maze = Maze(os.path.join(HERE, "mediumSearch.txt"))
+    path, _ = search_alt.search(maze, "junction")
+    assert set(maze.getObjectives()) <= set(path)
+    for a, b in zip(path, path[1:]):
+        assert a == b or b in maze.getNeighbors(a[0], a[1])
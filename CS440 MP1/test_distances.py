@@ -0,0 +1,69 @@
+# test_distances.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the BFS objective distance matrix.
+"""
+
+import os
+
+import pytest
+
+from maze import Maze
+from distances import ObjectiveDistances, bfsTree
+import search_alt
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_matrix_matches_bfs_executor():
+    maze = Maze(os.path.join(HERE, "tinySearch.txt"))
+    points = [maze.getStart()] + maze.getObjectives()
+    distances = ObjectiveDistances(maze, points, keepTrees=True)
+    assert (distances.matrix == distances.matrix.T).all()
+    for a in points[:4]:
+        for b in points:
+            path, _ = search_alt.bfs_executor(maze, a, [b])
+            assert distances.distance(a, b) == len(path) - 1
+            assert len(distances.path(a, b)) == len(path)
+            assert distances.path(a, b)[0] == a and distances.path(a, b)[-1] == b
+
+
+@pytest.mark.parametrize("filename, expected_length", [("tinySearch.txt", 49), ("smallSearch.txt", 163),
+                                                       ("mediumSearch.txt", 248)])
+def test_bfs_driver_matches_chained_bfs_executor(filename, expected_length):
+    # lengths produced by chaining bfs_executor from objective to objective
+    maze = Maze(os.path.join(HERE, filename))
+    path, states_explored = search_alt.bfs(maze)
+    assert len(path) == expected_length
+    assert set(maze.getObjectives()) <= set(path)
+    assert all(abs(a[0] - b[0]) + abs(a[1] - b[1]) <= 1 for a, b in zip(path, path[1:]))
+    rows, cols = maze.getDimensions()
+    assert 0 < states_explored <= (len(maze.getObjectives()) + 1) * rows * cols
+
+
+def test_bfs_stops_once_every_point_is_found():
+    maze = Maze(os.path.join(HERE, "tinySearch.txt"))
+    points = [maze.getStart()] + maze.getObjectives()
+    point_ids = [maze.getCellId(point[0], point[1]) for point in points]
+    _, _, full_flood, _ = bfsTree(maze, points[0])
+    _, _, early_exit, discovered = bfsTree(maze, points[0], point_ids)
+    assert len(discovered) == len(points)
+    assert early_exit <= full_flood
+
+
+def test_single_objective_bfs_uses_early_exit_executor():
+    maze = Maze(os.path.join(HERE, "mediumMaze.txt"))
+    path, states_explored = search_alt.bfs(maze)
+    # each cell is expanded at most once, where duplicate pushes used to be expanded again (817 states)
+    assert (len(path), states_explored) == (107, 633)
+
+
+def test_precomputed_heuristic_without_matrix_or_objectives(monkeypatch):
+    monkeypatch.setattr(search_alt, "objectiveDistances", None)
+    assert search_alt.getAstarHeuristicSumOfMinimumConnectedGoalsPreComputed((1, 1), [(1, 4), (3, 1)]) == 2
+    assert search_alt.getAstarHeuristicSumOfMinimumConnectedGoalsPreComputed((1, 1), []) == 0
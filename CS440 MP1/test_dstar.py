@@ -0,0 +1,85 @@
+# test_dstar.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for D* Lite replanning after the maze changes.
+"""
+
+import os
+import random
+
+import pytest
+
+from distances import bfsTree
+from dstar import DStarLite
+from maze import Maze
+import search_alt
+from test_search import writeRandomMaze
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def shortestLeg(maze):
+    start = maze.getStart()
+    if not maze.isValidMove(start[0], start[1]):
+        return None
+    distances = bfsTree(maze, start)[0]
+    reachable = [distances[maze.getCellId(row, col)] for row, col in maze.getObjectives()
+                 if distances[maze.getCellId(row, col)] >= 0]
+    return min(reachable, default=None)
+
+
+@pytest.mark.parametrize("seed", range(150))
+def test_replans_match_bfs_under_random_changes(seed):
+    rng = random.Random(seed)
+    maze = writeRandomMaze(4 + seed % 15, 4 + seed * 7 % 17, (0, 0.1, 0.2, 0.3)[seed % 4], seed)
+    engine = DStarLite(maze)
+    for _ in range(12):
+        path, _ = engine.replan()
+        distance = shortestLeg(maze)
+        if distance is None:
+            assert path == []
+        else:
+            assert len(path) == distance + 1 and path[0] == maze.getStart() and path[-1] in maze.getObjectives()
+            for a, b in zip(path, path[1:]):
+                assert b in maze.getNeighbors(a[0], a[1])
+        change = rng.random()
+        if change < 0.6:
+            for _ in range(rng.randint(1, 3)):
+                row, col = rng.randrange(1, maze.rows - 1), rng.randrange(1, maze.cols - 1)
+                if (row, col) != maze.getStart():
+                    maze.setWall(row, col, not maze.isWall(row, col))
+        elif change < 0.8 and len(path) > 1:
+            maze.setStart(path[min(len(path) - 1, rng.randint(1, 3))])
+        else:
+            free = [(row, col) for row in range(maze.rows) for col in range(maze.cols) if maze.isValidMove(row, col)]
+            maze.setObjectives(rng.sample(free, min(len(free), rng.randint(1, 3))))
+
+
+def test_far_change_costs_little():
+    maze = Maze(os.path.join(HERE, "openMaze.txt"))
+    engine = DStarLite(maze)
+    path, first = engine.replan()
+    assert engine.replan() == (path, 0)
+    # the bottom row of openMaze is far from the start, the dot and the cells searched between them
+    far = next((maze.rows - 2, col) for col in range(maze.cols - 2, 0, -1) if maze.isValidMove(maze.rows - 2, col))
+    maze.setWall(far[0], far[1])
+    again, repaired = engine.replan()
+    assert again == path and repaired < first // 10
+    maze.setStart(path[5])
+    assert engine.replan() == (path[5:], 0)
+
+
+@pytest.mark.parametrize("filename", ["tinySearch.txt", "smallSearch.txt", "mediumMaze.txt"])
+def test_dstar_driver_visits_every_objective(filename):
+    maze = Maze(os.path.join(HERE, filename))
+    start, objectives = maze.getStart(), maze.getObjectives()
+    path, states_explored = search_alt.search(maze, "dstar")
+    assert path[0] == start and set(objectives) <= set(path) and states_explored > 0
+    assert maze.getStart() == start and maze.getObjectives() == objectives
+    if len(objectives) == 1:
+        assert len(path) == len(search_alt.search(maze, "bfs")[0])
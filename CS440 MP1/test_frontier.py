@@ -0,0 +1,82 @@
+# test_frontier.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the IndexedHeap frontier.
+"""
+
+import random
+
+from frontier import IndexedHeap
+
+
+def test_pops_in_priority_order_then_push_order():
+    heap = IndexedHeap()
+    for key, priority in [(1, 5), (2, 3), (3, 5), (4, 1)]:
+        heap.push(key, priority, key * 10)
+    assert [heap.pop() for _ in range(4)] == [(4, 40, 1), (2, 20, 3), (1, 10, 5), (3, 30, 5)]
+    assert len(heap) == 0
+
+
+def test_decrease_key_keeps_one_entry_per_key():
+    heap = IndexedHeap()
+    assert heap.push(7, 9, "old")
+    assert not heap.push(7, 9, "same")
+    assert heap.push(7, 2, "new")
+    heap.push(8, 4)
+    assert len(heap) == 2
+    assert heap.priority(7) == 2
+    assert heap.pop() == (7, "new", 2)
+    assert heap.stale_pops_avoided == 2
+    assert heap.peak_size == 2
+
+
+def test_matches_sorted_order_under_random_updates():
+    rng = random.Random(440)
+    heap = IndexedHeap()
+    best = {}
+    for _ in range(2000):
+        key = rng.randrange(200)
+        priority = rng.randrange(1000)
+        heap.push(key, priority)
+        best[key] = min(priority, best.get(key, priority))
+    popped = [heap.pop() for _ in range(len(heap))]
+    assert [priority for _, _, priority in popped] == sorted(best.values())
+    assert {key: priority for key, _, priority in popped} == best
+
+
+def test_peek_leaves_the_top_entry():
+    heap = IndexedHeap()
+    heap.push(1, 4, "a")
+    heap.push(2, 1, "b")
+    assert heap.peek() == (2, "b", 1)
+    assert len(heap) == 2
+    assert heap.pop() == (2, "b", 1)
+
+
+def test_items_lists_every_entry_once():
+    heap = IndexedHeap()
+    heap.push(1, 4, "a")
+    heap.push(2, 1, "b")
+    heap.push(1, 3, "c")
+    assert sorted(heap.items()) == [(1, "c", 3), (2, "b", 1)]
+
+
+def test_remove_keeps_heap_order():
+    rng = random.Random(19)
+    heap = IndexedHeap()
+    live = {}
+    for _ in range(3000):
+        key = rng.randrange(100)
+        if key in heap and rng.random() < 0.5:
+            assert heap.remove(key) == (None, live.pop(key))
+        else:
+            priority = rng.randrange(1000)
+            heap.push(key, priority)
+            live[key] = min(priority, live.get(key, priority))
+    popped = [heap.pop() for _ in range(len(heap))]
+    assert [priority for _, _, priority in popped] == sorted(live.values())
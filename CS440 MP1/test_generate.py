@@ -0,0 +1,66 @@
+# test_generate.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the maze generator and the benchmark suite built on it.
+"""
+
+import io
+import os
+
+import pytest
+
+from distances import bfsTree
+from generate import generateMaze, writeMaze
+from maze import Maze
+import benchmark
+
+
+def loadGenerated(tmp_path, layout, rows, cols, seed=0, dots=1):
+    filename = str(tmp_path / ("%s.txt" % layout))
+    writeMaze(generateMaze(layout, rows, cols, seed, dots), filename)
+    return Maze(filename), filename
+
+
+def openCells(maze):
+    return [cell for cell in range(maze.rows * maze.cols) if not maze.walls[cell]]
+
+
+@pytest.mark.parametrize("layout", ["perfect", "braided", "rooms"])
+@pytest.mark.parametrize("rows, cols", [(10, 10), (31, 57), (60, 41)])
+def test_every_open_cell_is_reachable(tmp_path, layout, rows, cols):
+    maze, _ = loadGenerated(tmp_path, layout, rows, cols, seed=rows, dots=5)
+    assert maze.getDimensions() == (rows, cols)
+    assert len(maze.getObjectives()) == 5 and maze.getStart() not in maze.getObjectives()
+    distance = bfsTree(maze, maze.getStart())[0]
+    assert all(distance[cell] >= 0 for cell in openCells(maze))
+
+
+def countEdges(maze):
+    return sum(len(maze.getNeighborIds(cell)) for cell in openCells(maze)) // 2
+
+
+def test_perfect_maze_is_a_tree_and_braiding_adds_loops(tmp_path):
+    perfect, _ = loadGenerated(tmp_path, "perfect", 41, 41)
+    assert countEdges(perfect) == len(openCells(perfect)) - 1
+    braided, _ = loadGenerated(tmp_path, "braided", 41, 41)
+    assert countEdges(braided) > len(openCells(braided)) - 1
+
+
+def test_same_seed_same_maze():
+    assert generateMaze("braided", 25, 25, 7, 3) == generateMaze("braided", 25, 25, 7, 3)
+    assert generateMaze("braided", 25, 25, 7, 3) != generateMaze("braided", 25, 25, 8, 3)
+
+
+def test_suite_records_every_run():
+    out = io.StringIO()
+    records = benchmark.runSuite([15], ["astar", "jps"], out, mazes=[("perfect", 1), ("rooms", 3)])
+    assert [(r["layout"], r["method"]) for r in records] == [("perfect", "astar"), ("perfect", "jps"),
+                                                             ("rooms", "astar"), ("rooms", "jps")]
+    assert all(r["path_length"] > 0 and r["nodes_per_second"] > 0 and r["peak_memory_bytes"] > 0 for r in records)
+    assert records[0]["path_length"] == records[1]["path_length"]
+    assert len(out.getvalue().splitlines()) == 4
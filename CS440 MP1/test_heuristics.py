@@ -0,0 +1,88 @@
+# test_heuristics.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the per-cell heuristic table and the table modes of greedy and A*.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from distances import bfsTree
+from heuristics import HeuristicTable, NO_PATH
+from maze import Maze
+import search_alt
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FILES = ["tinySearch.txt", "smallSearch.txt", "mediumSearch.txt", "mediumMaze.txt", "bigMaze.txt"]
+
+
+def bruteForce(maze, objectives, exact):
+    rows, cols = maze.getDimensions()
+    if exact:
+        fields = [np.array(bfsTree(maze, objective)[0], dtype=np.int64) for objective in objectives]
+        fields = [np.where(field < 0, NO_PATH, field) for field in fields]
+    else:
+        row, col = np.divmod(np.arange(rows * cols), cols)
+        fields = [np.abs(row - objective[0]) + np.abs(col - objective[1]) for objective in objectives]
+    return np.min(fields, axis=0) if fields else np.full(rows * cols, NO_PATH)
+
+
+@pytest.mark.parametrize("exact", [False, True])
+@pytest.mark.parametrize("filename", ["tinySearch.txt", "smallSearch.txt"])
+def test_consume_matches_brute_force(filename, exact):
+    maze = Maze(os.path.join(HERE, filename))
+    objectives = maze.getObjectives()
+    table = HeuristicTable(maze, objectives, exact)
+    remaining = list(objectives)
+    while True:
+        assert np.array_equal(table.values, bruteForce(maze, remaining, exact))
+        if not remaining:
+            break
+        objective = remaining.pop(len(remaining) // 2)
+        table.consume(objective)
+    assert table.consume(objectives[0]) == 0
+
+
+def test_lookup_reads_plain_ints():
+    maze = Maze(os.path.join(HERE, "tinySearch.txt"))
+    table = HeuristicTable(maze, maze.getObjectives())
+    start = maze.getStart()
+    value = table.lookup[maze.getCellId(start[0], start[1])]
+    assert type(value) is int
+    assert value == table.value(start) == search_alt.getGreedyHeuristic(start, maze.getObjectives())
+
+
+@pytest.mark.parametrize("method, table_method", [("greedy", "greedy_table"), ("astar", "astar_table")])
+@pytest.mark.parametrize("filename", FILES)
+def test_table_mode_matches_loop(filename, method, table_method):
+    maze = Maze(os.path.join(HERE, filename))
+    assert search_alt.search(maze, table_method) == search_alt.search(maze, method)
+
+
+@pytest.mark.parametrize("filename", FILES)
+def test_exact_table_legs_are_shortest(filename):
+    maze = Maze(os.path.join(HERE, filename))
+    start, objectives = maze.getStart(), maze.getObjectives()
+    table = HeuristicTable(maze, objectives, exact=True)
+    while objectives:
+        distances = bfsTree(maze, start)[0]
+        path, _ = search_alt.astar_executor(maze, start, objectives, table)
+        # each leg is a shortest path to the nearest remaining objective
+        assert len(path) - 1 == min(distances[maze.getCellId(row, col)] for row, col in objectives)
+        objectives.remove(path[-1])
+        table.consume(path[-1])
+        start = path[-1]
+
+
+def test_exact_table_explores_fewer_states():
+    maze = Maze(os.path.join(HERE, "mediumSearch.txt"))
+    path, states_explored = search_alt.search(maze, "astar_exact")
+    assert set(maze.getObjectives()) <= set(path)
+    assert states_explored < search_alt.search(maze, "astar")[1]
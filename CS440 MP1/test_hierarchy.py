@@ -0,0 +1,100 @@
+# test_hierarchy.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the HPA* cluster graph, its cache and the hpastar driver.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from distances import bfsTree
+import hierarchy
+from hierarchy import ClusterGraph, clusterGraph
+from maze import Maze
+import search_alt
+from test_search import writeRandomMaze
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_paths_are_valid_and_never_missed(seed):
+    maze = writeRandomMaze(5 + seed % 40, 5 + seed * 7 % 43, (0, 0.1, 0.2, 0.3, 0.4)[seed % 5], seed)
+    graph = ClusterGraph(maze, 2 + seed % 6).build()
+    start, objective = maze.getStart(), maze.getObjectives()[0]
+    distance = bfsTree(maze, start)[0][maze.getCellId(objective[0], objective[1])]
+    path, _ = graph.findPath(start, [objective])
+    if distance < 0:
+        assert path == []
+        return
+    assert path[0] == start and path[-1] == objective and len(path) - 1 >= distance
+    for a, b in zip(path, path[1:]):
+        assert b in maze.getNeighbors(a[0], a[1])
+
+
+def clusterDistances(maze, graph, source):
+    distances = {source: 0}
+    frontier = [source]
+    while frontier:
+        cell = frontier.pop(0)
+        for neighbor in maze.getNeighbors(cell[0], cell[1]):
+            if neighbor not in distances and graph.clusterOf(neighbor) == graph.clusterOf(source):
+                distances[neighbor] = distances[cell] + 1
+                frontier.append(neighbor)
+    return distances
+
+
+@pytest.mark.parametrize("filename", ["mediumMaze.txt", "bigMaze.txt", "openMaze.txt"])
+def test_edges_are_entrances_and_cluster_distances(filename):
+    maze = Maze(os.path.join(HERE, filename))
+    graph = ClusterGraph(maze, 8).build()
+    cols = maze.getDimensions()[1]
+    for node in range(len(graph)):
+        cell = divmod(int(graph.nodes[node]), cols)
+        distances = clusterDistances(maze, graph, cell)
+        cluster = graph.clusterOf(cell)
+        members = graph.clusterNodes[graph.clusterOffsets[cluster]:graph.clusterOffsets[cluster + 1]]
+        inside = {divmod(int(graph.nodes[other]), cols) for other in members}
+        expected = {other: distances[other] for other in inside if other in distances and other != cell}
+        edges = {}
+        for index in range(graph.offsets[node], graph.offsets[node + 1]):
+            target = divmod(int(graph.nodes[graph.targets[index]]), cols)
+            if graph.clusterOf(target) != graph.clusterOf(cell):
+                assert graph.costs[index] == 1 and target in maze.getNeighbors(cell[0], cell[1])
+            else:
+                edges[target] = int(graph.costs[index])
+        assert edges == expected
+
+
+def test_cache_is_keyed_by_file_and_reused(tmp_path, monkeypatch):
+    maze = Maze(os.path.join(HERE, "bigMaze.txt"))
+    cache = str(tmp_path / "cache")
+    built = clusterGraph(maze, cacheDir=cache)
+    assert os.listdir(cache) == [maze.getDigest() + "-%d.npz" % hierarchy.CLUSTER_SIZE]
+    monkeypatch.setattr(ClusterGraph, "build", lambda self: pytest.fail("cached graph was built again"))
+    loaded = clusterGraph(Maze(os.path.join(HERE, "bigMaze.txt")), cacheDir=cache)
+    for name in ("nodes", "offsets", "targets", "costs", "clusterOffsets", "clusterNodes"):
+        assert np.array_equal(getattr(loaded, name), getattr(built, name))
+    start, objectives = maze.getStart(), maze.getObjectives()
+    assert loaded.findPath(start, objectives) == built.findPath(start, objectives)
+    maze.setWall(1, 1, not maze.isWall(1, 1))
+    assert maze.getDigest() is None and hierarchy.cachePath(maze, cacheDir=cache) is None
+
+
+@pytest.mark.parametrize("filename", ["tinySearch.txt", "mediumSearch.txt", "mediumMaze.txt", "bigMaze.txt"])
+def test_hpastar_driver_visits_every_objective(tmp_path, monkeypatch, filename):
+    monkeypatch.chdir(tmp_path)
+    maze = Maze(os.path.join(HERE, filename))
+    path, states_explored = search_alt.search(maze, "hpastar")
+    assert path[0] == maze.getStart() and set(maze.getObjectives()) <= set(path)
+    assert os.path.isdir(hierarchy.CACHE_DIR)
+    if len(maze.getObjectives()) == 1:
+        shortest = len(search_alt.search(maze, "bfs")[0])
+        assert shortest <= len(path) <= shortest * 1.05
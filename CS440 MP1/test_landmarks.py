@@ -0,0 +1,88 @@
+# test_landmarks.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the landmark (ALT) heuristic and its saved distances.
+"""
+
+import os
+import shutil
+
+import pytest
+
+from distances import bfsTree
+import landmarks
+from landmarks import LandmarkBound, Landmarks, loadLandmarks
+from maze import Maze
+import search_alt
+from test_search import writeRandomMaze
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def copyMaze(tmp_path, filename):
+    copy = str(tmp_path / filename)
+    shutil.copy(os.path.join(HERE, filename), copy)
+    return copy
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_bound_is_admissible_and_consistent(seed):
+    maze = writeRandomMaze(4 + seed % 23, 4 + seed * 7 % 29, (0, 0.1, 0.2, 0.3, 0.4)[seed % 5], seed)
+    objective = maze.getObjectives()[0]
+    bound = LandmarkBound(Landmarks(maze, 1 + seed % 6).build(), [objective])
+    distances = bfsTree(maze, objective)[0]
+    for row in range(maze.rows):
+        for col in range(maze.cols):
+            if not maze.isValidMove(row, col):
+                continue
+            value = bound.value((row, col))
+            if distances[maze.getCellId(row, col)] >= 0:
+                assert value <= distances[maze.getCellId(row, col)]
+            for neighbor in maze.getNeighbors(row, col):
+                assert abs(value - bound.value(neighbor)) <= 1
+
+
+def test_every_component_gets_a_landmark(tmp_path):
+    filename = str(tmp_path / "split.txt")
+    with open(filename, 'w') as f:
+        f.write("%%%%%%%%%\n%P  %  .%\n%   %   %\n%%%%%%%%%\n")
+    maze = Maze(filename)
+    built = Landmarks(maze, 2).build()
+    assert {maze.getPosition(cell)[1] < 4 for cell in built.cells} == {True, False}
+    assert (built.distances >= 0).sum(axis=0).min() == 0 and (built.distances >= 0).any(axis=0).sum() == 12
+
+
+@pytest.mark.parametrize("filename", ["mediumMaze.txt", "bigMaze.txt", "openMaze.txt"])
+def test_alt_is_optimal_and_explores_less(tmp_path, filename):
+    maze = Maze(copyMaze(tmp_path, filename))
+    path, states_explored = search_alt.search(maze, "alt")
+    objective = maze.getObjectives()[0]
+    assert len(path) - 1 == bfsTree(maze, maze.getStart())[0][maze.getCellId(objective[0], objective[1])]
+    assert states_explored < search_alt.search(maze, "astar")[1] / 2
+
+
+def test_alt_visits_every_objective(tmp_path):
+    maze = Maze(copyMaze(tmp_path, "mediumSearch.txt"))
+    path, _ = search_alt.search(maze, "alt")
+    assert path[0] == maze.getStart() and set(maze.getObjectives()) <= set(path)
+
+
+def test_distances_are_saved_next_to_the_maze(tmp_path, monkeypatch):
+    filename = copyMaze(tmp_path, "bigMaze.txt")
+    built = loadLandmarks(Maze(filename))
+    assert os.path.exists(filename + landmarks.LANDMARK_SUFFIX)
+    assert built.distances.dtype.name == "int32" and built.distances.shape[0] == landmarks.LANDMARK_COUNT
+    original_build = Landmarks.build
+    monkeypatch.setattr(Landmarks, "build", lambda self: pytest.fail("saved landmarks were built again"))
+    loaded = loadLandmarks(Maze(filename))
+    assert loaded.cells == built.cells and (loaded.distances == built.distances).all()
+    with open(filename, 'a') as f:
+        f.write("\n")
+    monkeypatch.setattr(Landmarks, "build", original_build)
+    assert Maze(filename).getDigest() != Maze(os.path.join(HERE, "bigMaze.txt")).getDigest()
+    assert loadLandmarks(Maze(filename)).cells == built.cells
@@ -0,0 +1,103 @@
+# test_maze.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the compact representation kept by Maze and its binary format.
+"""
+
+import mmap
+import os
+
+import pytest
+
+import maze as maze_module
+from generate import generateMaze, writeMaze
+from maze import Maze
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def readGrid(filename):
+    with open(filename) as f:
+        return [line.rstrip('\n') for line in f if line.strip()]
+
+
+@pytest.mark.parametrize("filename", ["tinySearch.txt", "mediumMaze.txt", "openMaze.txt"])
+def test_csr_neighbours_match_grid(filename):
+    maze = Maze(os.path.join(HERE, filename))
+    grid = readGrid(os.path.join(HERE, filename))
+    rows, cols = maze.getDimensions()
+    for row in range(rows):
+        for col in range(cols):
+            expected = [(r, c) for r, c in [(row + 1, col), (row - 1, col), (row, col + 1), (row, col - 1)]
+                        if 0 <= r < rows and 0 <= c < cols and grid[r][c] != '%']
+            assert maze.getNeighbors(row, col) == expected
+            cell = maze.getCellId(row, col)
+            assert maze.getPosition(cell) == (row, col)
+            assert [maze.getPosition(n) for n in maze.getNeighborIds(cell)] == expected
+            assert maze.isWall(row, col) == (grid[row][col] == '%')
+
+
+@pytest.mark.parametrize("filename", ["tinySearch.txt", "mediumSearch.txt", "bigMaze.txt"])
+def test_start_and_objectives_read_while_streaming(filename):
+    grid = readGrid(os.path.join(HERE, filename))
+    maze = Maze(os.path.join(HERE, filename))
+    assert maze.getDimensions() == (len(grid), len(grid[0]))
+    assert grid[maze.getStart()[0]][maze.getStart()[1]] == 'P'
+    assert maze.getObjectives() == [(r, c) for r, line in enumerate(grid) for c, char in enumerate(line) if char == '.']
+
+
+@pytest.mark.parametrize("cols", [7, 8, 9, 33])
+def test_binary_maze_maps_the_same_maze(tmp_path, cols):
+    text = str(tmp_path / "maze.txt")
+    binary = str(tmp_path / "maze.bin")
+    writeMaze(generateMaze("braided", 23, cols, cols, 4), text)
+    original = Maze(text)
+    original.saveBinary(binary)
+    mapped = Maze(binary)
+    assert isinstance(mapped.packedWalls.buffer, mmap.mmap)
+    assert mapped.getDimensions() == original.getDimensions()
+    assert mapped.getStart() == original.getStart() and mapped.getObjectives() == original.getObjectives()
+    assert [mapped.walls[cell] for cell in range(23 * cols)] == list(original.walls)
+    for row in range(23):
+        for col in range(cols):
+            assert mapped.getNeighbors(row, col) == original.getNeighbors(row, col)
+
+
+def test_large_mazes_stay_packed(tmp_path, monkeypatch):
+    filename = str(tmp_path / "maze.txt")
+    writeMaze(generateMaze("rooms", 40, 50, 1, 2), filename)
+    unpacked = Maze(filename)
+    monkeypatch.setattr(maze_module, "UNPACK_LIMIT", 100)
+    packed = Maze(filename)
+    assert isinstance(unpacked.walls, bytearray) and isinstance(packed.walls, maze_module.PackedWalls)
+    assert [packed.walls[cell] for cell in range(40 * 50)] == list(unpacked.walls)
+    assert packed.packedWalls.rowBytes * 40 == len(packed.packedWalls.buffer)
+
+
+@pytest.mark.parametrize("storage", ["bytearray", "packed", "mapped"])
+def test_set_wall_updates_every_view(tmp_path, monkeypatch, storage):
+    filename = str(tmp_path / "maze.txt")
+    writeMaze(generateMaze("braided", 21, 19, 3, 2), filename)
+    if storage == "mapped":
+        Maze(filename).saveBinary(str(tmp_path / "maze.bin"))
+        filename = str(tmp_path / "maze.bin")
+    if storage == "packed":
+        monkeypatch.setattr(maze_module, "UNPACK_LIMIT", 100)
+    maze = Maze(filename)
+    offsets = maze.neighborOffsets
+    version = maze.getVersion()
+    opened = next((row, col) for row in range(1, 20) for col in range(1, 18) if maze.isWall(row, col))
+    closed = next((row, col) for row in range(1, 20) for col in range(1, 18) if not maze.isWall(row, col))
+    assert maze.setWall(opened[0], opened[1], False) and maze.setWall(closed[0], closed[1])
+    assert not maze.setWall(closed[0], closed[1])
+    assert maze.getChangesSince(version) == [opened, closed] and maze.getVersion() == version + 2
+    assert not maze.isWall(opened[0], opened[1]) and maze.isWall(closed[0], closed[1])
+    assert maze.openMask()[opened] and not maze.openMask()[closed]
+    assert maze.neighborOffsets is not offsets
+    expected = [maze.getCellId(row, col) for row, col in maze.getNeighbors(opened[0], opened[1])]
+    assert list(maze.getNeighborIds(maze.getCellId(opened[0], opened[1]))) == expected
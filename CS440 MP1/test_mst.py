@@ -0,0 +1,78 @@
+# test_mst.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the MST heuristic cache and the multi-objective A* built on it.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from maze import Maze
+from distances import ObjectiveDistances
+from mst import MSTCache, primWeight
+import search_alt
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def optimalTourLength(maze):
+    """Brute-force optimum: Held-Karp over every subset of objectives, on exact maze distances, in cells"""
+    objectives = maze.getObjectives()
+    distances = ObjectiveDistances(maze, [maze.getStart()] + objectives)
+    matrix = distances.matrix.astype(np.int64)
+    k = len(objectives)
+    infinity = np.iinfo(np.int64).max // 4
+    best = np.full((1 << k, k), infinity, dtype=np.int64)
+    for j in range(k):
+        best[1 << j, j] = matrix[0, j + 1]
+    edges = matrix[1:, 1:]
+    for mask in range(1, 1 << k):
+        row = best[mask]
+        if row.min() >= infinity:
+            continue
+        candidates = (row[:, None] + edges).min(axis=0)
+        for j in range(k):
+            if not mask >> j & 1:
+                extended = mask | 1 << j
+                if candidates[j] < best[extended, j]:
+                    best[extended, j] = candidates[j]
+    return int(best[(1 << k) - 1].min()) + 1
+
+
+@pytest.mark.parametrize("filename, chained_length", [("tinySearch.txt", 49), ("smallSearch.txt", 163)])
+def test_astar_mst_matches_brute_force_optimum(filename, chained_length):
+    maze = Maze(os.path.join(HERE, filename))
+    path, states_explored = search_alt.search(maze, "astar_mst")
+    assert len(path) == optimalTourLength(maze)
+    assert len(path) < chained_length
+    assert set(maze.getObjectives()) <= set(path)
+    assert all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 for a, b in zip(path, path[1:]))
+    stats = search_alt.mstCache.stats()
+    assert stats["hits"] > 0 and stats["misses"] > 0
+
+
+def test_mst_cache_evicts_least_recently_used():
+    matrix = [[0, 1, 4], [1, 0, 2], [4, 2, 0]]
+    cache = MSTCache(matrix, capacity=2)
+    assert cache.weight(0b011) == 1
+    assert cache.weight(0b110) == 2
+    assert cache.weight(0b011) == 1           # hit, and now the most recently used
+    assert cache.weight(0b111) == 3           # evicts 0b110
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+    cache.weight(0b011)
+    cache.weight(0b110)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_prim_weight_on_disconnected_matrix():
+    matrix = [[0, 3, -1], [3, 0, -1], [-1, -1, 0]]
+    assert primWeight(matrix, [0, 1]) == 3
+    assert primWeight(matrix, [0, 1, 2]) == float('inf')
+    assert primWeight(matrix, [2]) == 0
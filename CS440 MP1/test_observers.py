@@ -0,0 +1,107 @@
+# test_observers.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the search observer hooks and the built-in collectors.
+"""
+
+import os
+
+import pytest
+
+from maze import Maze
+import observers
+import search
+import search_alt
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture
+def collectors():
+    counter = observers.CounterObserver()
+    histogram = observers.FrontierHistogram(bucketSize=8)
+    timer = observers.PhaseTimer()
+    previous = observers.attach(observers.ObserverGroup([counter, histogram, timer]))
+    yield counter, histogram, timer
+    observers.attach(previous)
+
+
+@pytest.mark.parametrize("method", ["bfs", "dfs", "greedy", "astar", "jps", "bibfs", "biastar", "astar_mst"])
+def test_every_pop_is_an_expansion(collectors, method):
+    counter, histogram, timer = collectors
+    maze = Maze(os.path.join(HERE, "mediumMaze.txt"))
+    path, states_explored = search_alt.search(maze, method)
+    assert counter.counts["pop"] == states_explored
+    assert counter.counts["goal"] == 1
+    assert counter.counts["expand"] in (states_explored, states_explored - 1)
+    assert counter.counts["push"] >= counter.counts["expand"]
+    assert sum(count for _, _, count in histogram.rows()) == counter.counts["pop"]
+    assert histogram.peak > 0
+    assert timer.seconds["search"] > 0
+    assert "reconstruct" in timer.seconds
+
+
+def test_search_py_astar_reports_instead_of_printing(collectors, capsys):
+    counter, _, timer = collectors
+    maze = Maze(os.path.join(HERE, "bigMaze.txt"))
+    path, states_explored = search.astar(maze)
+    assert capsys.readouterr().out == ""
+    assert counter.counts["pop"] == states_explored
+    # stale_pops_avoided also counts the decrease-key pushes, which are reported as pushes
+    assert 0 < counter.counts["stale"] <= search.frontierStats["stale_pops_avoided"]
+    assert set(timer.seconds) == {"search", "reconstruct"}
+
+
+def test_precompute_phase_is_timed(collectors):
+    counter, _, timer = collectors
+    maze = Maze(os.path.join(HERE, "tinySearch.txt"))
+    path, _ = search_alt.tsp(maze)
+    assert counter.counts["goal"] == len(maze.getObjectives())
+    assert set(timer.seconds) == {"precompute", "search", "reconstruct"}
+
+
+def test_astar_mst_opens_precompute_before_the_distances(monkeypatch):
+    events = []
+
+    class PhaseLog(observers.SearchObserver):
+        def on_phase(self, name):
+            events.append(name)
+
+    calculate = search_alt.calculateAllDistances
+
+    def logged(*args, **kwargs):
+        events.append("distances")
+        return calculate(*args, **kwargs)
+
+    monkeypatch.setattr(search_alt, "calculateAllDistances", logged)
+    previous = observers.attach(PhaseLog())
+    try:
+        search_alt.astar_mst(Maze(os.path.join(HERE, "tinySearch.txt")))
+    finally:
+        observers.attach(previous)
+    assert events[:2] == ["precompute", "distances"] and events.index("search") > 1
+
+
+def test_phase_timer_splits_time_between_phases():
+    ticks = iter([0.0, 1.0, 3.5, 4.0, 10.0, 10.25])
+    timer = observers.PhaseTimer(clock=lambda: next(ticks))
+    timer.on_phase("search")
+    timer.on_phase("reconstruct")
+    timer.on_finish()
+    timer.on_phase("search")
+    timer.on_finish()
+    timer.on_finish()
+    assert timer.seconds == {"search": 1.0 + 6.0, "reconstruct": 2.5}
+
+
+def test_nothing_is_reported_once_detached():
+    counter = observers.CounterObserver()
+    observers.attach(counter)
+    assert observers.detach() is counter
+    search_alt.astar(Maze(os.path.join(HERE, "tinySearch.txt")))
+    assert counter.counts == {"push": 0, "pop": 0, "expand": 0, "stale": 0, "goal": 0}
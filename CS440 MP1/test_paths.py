@@ -0,0 +1,97 @@
+# test_paths.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the parent arrays and lazy paths of the search executors.
+"""
+
+import os
+import pickle
+
+import pytest
+
+from distances import bfsTree
+from maze import Maze
+from paths import PathView, parentArray
+import search
+import search_alt
+from test_search import writeRandomMaze
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_view_reads_like_the_list_it_replaces():
+    parents = parentArray(Maze(os.path.join(HERE, "tinySearch.txt")))
+    cols = 10
+    for cell, parent in [(12, 11), (13, 12), (23, 13)]:
+        parents[cell] = parent
+    path = PathView(parents, cols, 11, 23)
+    assert path == [(1, 1), (1, 2), (1, 3), (2, 3)]
+    assert len(path) == 4 and path[0] == (1, 1) and path[-1] == (2, 3) and path[1:3] == [(1, 2), (1, 3)]
+    assert path != [(1, 1)] and list(reversed(path))[0] == (2, 3)
+    cells = path.cells()
+    assert cells.dtype.name == "int32" and list(cells) == [11, 12, 13, 23]
+    path.ids()[0] = 12
+    assert cells[0] == 12
+    assert pickle.loads(pickle.dumps(path)) == path
+
+
+def test_view_is_fixed_once_read():
+    parents = parentArray(Maze(os.path.join(HERE, "tinySearch.txt")))
+    parents[12] = 11
+    path = PathView(parents, 10, 11, 12)
+    assert path.ids().tolist() == [11, 12]
+    parents[12] = 2
+    assert path == [(1, 1), (1, 2)]
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_dfs_paths_are_walks_and_expand_each_cell_once(seed):
+    maze = writeRandomMaze(4 + seed % 17, 4 + seed * 5 % 19, (0, 0.15, 0.3)[seed % 3], seed)
+    start, objective = maze.getStart(), maze.getObjectives()[0]
+    path, states_explored = search_alt.dfs_executor(maze, start, [objective])
+    distances = bfsTree(maze, start)[0]
+    if distances[maze.getCellId(objective[0], objective[1])] < 0:
+        assert path == []
+        return
+    assert path[0] == start and path[-1] == objective and len(set(path)) == len(path)
+    assert all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 for a, b in zip(path, path[1:]))
+    assert states_explored <= sum(1 for distance in distances if distance >= 0)
+
+
+@pytest.mark.parametrize("filename", ["bigMaze.txt", "openMaze.txt"])
+def test_bfs_expands_each_cell_once(filename):
+    maze = Maze(os.path.join(HERE, filename))
+    path, states_explored = search_alt.bfs(maze)
+    distances = bfsTree(maze, maze.getStart())[0]
+    objective = maze.getObjectives()[0]
+    assert len(path) == distances[maze.getCellId(objective[0], objective[1])] + 1
+    assert states_explored <= sum(1 for distance in distances if distance >= 0)
+
+
+def test_anytime_paths_survive_later_searches():
+    maze = Maze(os.path.join(HERE, "bigMaze.txt"))
+    start, objectives = maze.getStart(), maze.getObjectives()
+    yielded = [(path, list(path)) for path, _, _ in search_alt.anytimeAstar(maze, start, objectives)]
+    assert len(yielded) > 1
+    assert all(path == snapshot for path, snapshot in yielded)
+
+
+def test_dfs_driver_stops_on_an_unreachable_objective(tmp_path):
+    filename = str(tmp_path / "walled.txt")
+    with open(filename, 'w') as f:
+        f.write("%%%%%%\n%P %.%\n%%%%%%\n")
+    path, states_explored = search_alt.dfs(Maze(filename))
+    assert path == [] and states_explored == 2
+
+
+def test_search_py_astar_returns_a_view(capsys):
+    maze = Maze(os.path.join(HERE, "bigMaze.txt"))
+    path, _ = search.astar(maze)
+    assert isinstance(path, PathView)
+    assert len(path) == len(search_alt.bfs(maze)[0]) and path[0] == maze.getStart()
+    assert all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 for a, b in zip(path, path[1:]))
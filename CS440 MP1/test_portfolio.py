@@ -0,0 +1,86 @@
+# test_portfolio.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the process-pool portfolio solver.
+"""
+
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from maze import Maze
+import portfolio
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_first_optimal_result_wins_and_is_recorded(tmp_path):
+    stats_file = str(tmp_path / "stats.json")
+    filename = os.path.join(HERE, "mediumMaze.txt")
+    path, record = portfolio.solvePortfolio(filename, ["astar", "bfs"], deadline=60, statsFile=stats_file)
+    assert record["winner"] in ("astar", "bfs") and record["optimal"]
+    assert record["path_cost"] == 106 and len(path) == 107
+    assert record["strategies"][record["winner"]]["status"] == "won"
+    with open(stats_file) as f:
+        stats = json.load(f)
+    history = stats[record["key"]]
+    assert sorted(history) == ["astar", "bfs"]
+    assert sum(entry["wins"] for entry in history.values()) == 1
+    assert all(entry["runs"] == 1 for entry in history.values())
+    assert not multiprocessing.active_children()
+
+
+def test_deadline_settles_for_the_best_finished_result():
+    # IDA* takes over a second on bigMaze, greedy a few milliseconds
+    filename = os.path.join(HERE, "bigMaze.txt")
+    path, record = portfolio.solvePortfolio(filename, ["idastar", "greedy"], deadline=0.5, statsFile=None)
+    assert record["winner"] == "greedy" and not record["optimal"]
+    assert record["strategies"]["idastar"]["status"] == "cancelled"
+    assert set(Maze(filename).getObjectives()) <= set(path)
+    assert not multiprocessing.active_children()
+
+
+def test_optimal_result_tying_an_earlier_one_ends_the_race(tmp_path):
+    # greedy walks straight across an open room, so it finds an optimal path first but cannot vouch for it
+    filename = str(tmp_path / "room.txt")
+    rows = ["%" * 40] + ["%" + " " * 38 + "%" for _ in range(38)] + ["%" * 40]
+    rows[20] = "%P" + " " * 36 + ".%"
+    with open(filename, 'w') as f:
+        f.write("\n".join(rows) + "\n")
+    path, record = portfolio.solvePortfolio(filename, ["greedy", "astar", "bfs"], deadline=30, workers=1,
+                                            statsFile=None)
+    assert record["strategies"]["greedy"]["path_cost"] == record["path_cost"] == 37
+    assert record["winner"] in ("astar", "bfs") and record["optimal"]
+    assert record["wall_seconds"] < 10
+    assert not multiprocessing.active_children()
+
+
+def test_workers_send_back_plain_paths():
+    path, states_explored, _ = portfolio.runStrategy(os.path.join(HERE, "bigMaze.txt"), "astar")
+    assert type(path) is list and len(path) == 175 and states_explored > 0
+
+
+def test_ranking_follows_win_rate_then_time():
+    stats = {"k": {"bfs": {"runs": 4, "wins": 3, "finished": 4, "seconds": 4.0},
+                   "astar": {"runs": 4, "wins": 3, "finished": 4, "seconds": 1.0},
+                   "jps": {"runs": 4, "wins": 0, "finished": 2, "seconds": 0.1}}}
+    assert portfolio.rankStrategies(stats, "k", ["jps", "bfs", "astar", "greedy"]) == ["astar", "bfs", "greedy", "jps"]
+    assert portfolio.rankStrategies(stats, "other", ["jps", "bfs"]) == ["jps", "bfs"]
+    portfolio.recordRace(stats, "k", {"jps": {"status": "won", "seconds": 0.2}, "bfs": {"status": "cancelled"}}, "jps")
+    assert stats["k"]["jps"] == {"runs": 5, "wins": 1, "finished": 3, "seconds": pytest.approx(0.3)}
+    assert stats["k"]["bfs"]["runs"] == 5 and stats["k"]["bfs"]["finished"] == 4
+
+
+def test_optimality_and_cost_rules():
+    assert portfolio.isOptimal("jps", 1) and not portfolio.isOptimal("greedy", 1)
+    assert portfolio.isOptimal("tsp", 4) and not portfolio.isOptimal("astar", 4)
+    assert portfolio.isOptimal("astar_mst", 1) and portfolio.isOptimal("astar_mst", 4 * portfolio.HELD_KARP_LIMIT)
+    assert portfolio.pathCost([(1, 1), (1, 2), (1, 2), (1, 3)]) == 2
+    assert portfolio.mazeKey(Maze(os.path.join(HERE, "tinySearch.txt"))).startswith("cells=2^")
@@ -0,0 +1,91 @@
+# test_render.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the off-screen PNG renderer.
+"""
+
+import os
+import struct
+import subprocess
+import sys
+import time
+import zlib
+
+import numpy as np
+
+from generate import generateMaze, writeMaze
+from maze import Maze
+from mp1 import Application
+import render
+import search_alt
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def readPNG(filename):
+    """Decodes the 8-bit RGB, unfiltered PNGs writePNG writes"""
+    with open(filename, 'rb') as f:
+        data = f.read()
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    chunks, offset = {}, 8
+    while offset < len(data):
+        length, kind = struct.unpack(">I4s", data[offset:offset + 8])
+        body = data[offset + 8:offset + 8 + length]
+        assert struct.unpack(">I", data[offset + 8 + length:offset + 12 + length])[0] == zlib.crc32(kind + body)
+        chunks[kind] = body
+        offset += 12 + length
+    width, height = struct.unpack(">II", chunks[b"IHDR"][:8])
+    scanlines = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8).reshape(height, 1 + width * 3)
+    assert (scanlines[:, 0] == 0).all()
+    return scanlines[:, 1:].reshape(height, width, 3)
+
+
+def test_picture_matches_the_drawn_one(tmp_path):
+    maze = Maze(os.path.join(HERE, "tinySearch.txt"))
+    path, _ = search_alt.search(maze, "astar")
+    filename = str(tmp_path / "tiny.png")
+    image = render.savePNG(maze, path, filename, scale=8)
+    assert (readPNG(filename) == image).all()
+    rows, cols = maze.getDimensions()
+    assert image.shape == (rows * 8, cols * 8, 3)
+    colors = Application(False).getColor
+    cells = image[::8, ::8]
+    last = {cell: index for index, cell in enumerate(path)}
+    for row in range(rows):
+        for col in range(cols):
+            if maze.isWall(row, col):
+                assert tuple(cells[row, col]) == render.BLACK
+            elif (row, col) in last:
+                assert tuple(cells[row, col]) == tuple(int(c) for c in colors(len(path), last[(row, col)]))
+            else:
+                assert tuple(cells[row, col]) == render.WHITE
+    start = maze.getStart()
+    assert tuple(image[start[0] * 8 + 4, start[1] * 8 + 4]) == render.BLUE
+    for objective in maze.getObjectives():
+        assert tuple(image[objective[0] * 8 + 4, objective[1] * 8 + 4]) == render.BLACK
+        assert tuple(image[objective[0] * 8, objective[1] * 8]) != render.BLACK
+
+
+def test_large_maze_renders_quickly(tmp_path):
+    filename = str(tmp_path / "large.txt")
+    writeMaze(generateMaze("braided", 2001, 2001, seed=5), filename)
+    maze = Maze(filename)
+    start = time.perf_counter()
+    render.savePNG(maze, [(1, col) for col in range(1, 2000)], str(tmp_path / "large.png"), scale=1)
+    assert time.perf_counter() - start < 5
+    assert readPNG(str(tmp_path / "large.png")).shape == (2001, 2001, 3)
+
+
+def test_saving_never_imports_pygame(tmp_path):
+    filename = str(tmp_path / "medium.png")
+    code = ("import sys, mp1; "
+            "mp1.Application(False).execute('mediumMaze.txt', 'astar', %r); "
+            "assert 'pygame' not in sys.modules" % filename)
+    result = subprocess.run([sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert readPNG(filename).shape[:2] == tuple(20 * n for n in Maze(os.path.join(HERE, "mediumMaze.txt")).getDimensions())
@@ -0,0 +1,301 @@
+# test_search.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Regression checks for the search functions in search.py and search_alt.py.
+Run with python -m pytest from this directory.
+"""
+
+import os
+import random
+import tempfile
+
+import pytest
+
+import benchmark
+from distances import bfsTree
+from maze import Maze
+import search
+import search_alt
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def writeRandomMaze(rows, cols, density, seed):
+    """A bordered grid with random walls, a start and one objective, loaded as a Maze"""
+    rng = random.Random(seed)
+    grid = [['%' if row in (0, rows - 1) or col in (0, cols - 1) or rng.random() < density else ' '
+             for col in range(cols)] for row in range(rows)]
+    free = [(row, col) for row in range(rows) for col in range(cols) if grid[row][col] == ' ']
+    start, objective = rng.sample(free, 2)
+    grid[start[0]][start[1]] = 'P'
+    grid[objective[0]][objective[1]] = '.'
+    fd, filename = tempfile.mkstemp(suffix='.txt')
+    os.close(fd)
+    try:
+        with open(filename, 'w') as f:
+            f.write('\n'.join(''.join(row) for row in grid) + '\n')
+        return Maze(filename)
+    finally:
+        os.remove(filename)
+
+
+class GraphMaze:
+    """A stand-in for Maze over an explicit adjacency list, used to build cases a grid cannot"""
+
+    def __init__(self, adjacency):
+        self.adjacency = adjacency
+
+    def getDimensions(self):
+        return (max(row for row, _ in self.adjacency) + 1, max(col for _, col in self.adjacency) + 1)
+
+    def getNeighbors(self, row, col):
+        return list(self.adjacency[(row, col)])
+
+    def isValidMove(self, row, col):
+        return (row, col) in self.adjacency
+
+
+@pytest.mark.parametrize("filename", ["mediumMaze.txt", "bigMaze.txt"])
+def test_astar_path_length_matches_bfs(filename, capsys):
+    maze = Maze(os.path.join(HERE, filename))
+    bfs_path, _ = search_alt.bfs(maze)
+    alt_path, _ = search_alt.astar(maze)
+    path, _ = search.astar(maze)
+    capsys.readouterr()
+    assert len(alt_path) == len(bfs_path)
+    assert len(path) == len(bfs_path)
+    assert path[0] == maze.getStart() and path[-1] in maze.getObjectives()
+
+
+def test_astar_reopens_state_when_cheaper_parent_found(monkeypatch):
+    # S reaches C through B, D (cost 3) before A is expanded, because h(A) is large.
+    # A then offers C at cost 2, so C and the chain after it must be re-opened.
+    S, A, B, C, D, E1, E2, E3, G = [(0, i) for i in range(9)]
+    adjacency = {S: [A, B], A: [C], B: [D], D: [C], C: [E1], E1: [E2], E2: [E3], E3: [G], G: []}
+    heuristic = {A: 5, E3: 1}
+    monkeypatch.setattr(search_alt, "getWeightedAstarHeuristicMinDistanceToAnyObjective",
+                        lambda state, objectives: heuristic.get(state, 0))
+
+    path, states_explored = search_alt.astar_executor(GraphMaze(adjacency), S, [G])
+
+    assert path == [S, A, C, E1, E2, E3, G]
+    # C, E1 and E2 are expanded a second time after being re-opened
+    assert states_explored == 12
+
+
+def test_astar_unsolvable_returns_empty_path():
+    S, A, G = (0, 0), (0, 1), (0, 2)
+    maze = GraphMaze({S: [A], A: [S], G: []})
+    path, states_explored = search_alt.astar_executor(maze, S, [G])
+    assert path == []
+    assert states_explored == 2
+
+
+@pytest.mark.parametrize("module", [search, search_alt])
+def test_unknown_method_is_rejected(module):
+    maze = Maze(os.path.join(HERE, "tinySearch.txt"))
+    with pytest.raises(ValueError, match="Unknown search method"):
+        module.search(maze, "nosuchmethod")
+
+
+@pytest.mark.parametrize("method", benchmark.ALL_METHODS)
+def test_default_module_dispatches_every_method(method, monkeypatch):
+    monkeypatch.setattr(search, method, lambda maze: ([], method))
+    assert search.search(None, method) == ([], method)
+
+
+def test_dstar_runs_through_the_default_module(capsys):
+    maze = Maze(os.path.join(HERE, "mediumMaze.txt"))
+    path, _ = search.search(maze, "dstar")
+    assert len(path) == len(search.search(maze, "astar")[0])
+
+
+def test_frontier_stats_count_folded_pushes(capsys):
+    maze = Maze(os.path.join(HERE, "mediumMaze.txt"))
+    search.astar(maze)
+    capsys.readouterr()
+    assert search.frontierStats["stale_pops_avoided"] > 0
+    assert search.frontierStats["peak_frontier_size"] > 0
+
+
+@pytest.mark.parametrize("filename, expected_length", [("tinySearch.txt", 49), ("smallSearch.txt", 173),
+                                                       ("mediumMaze.txt", 123), ("bigMaze.txt", 277),
+                                                       ("mediumSearch.txt", 260)])
+def test_greedy_path_lengths_unchanged(filename, expected_length):
+    # lengths produced by the queue.PriorityQueue version of greedy_executor
+    maze = Maze(os.path.join(HERE, filename))
+    path, _ = search_alt.greedy(maze)
+    assert len(path) == expected_length
+    assert set(maze.getObjectives()) <= set(path)
+
+
+@pytest.mark.parametrize("filename", ["mediumMaze.txt", "bigMaze.txt", "openMaze.txt"])
+def test_jps_path_length_matches_astar_with_fewer_states(filename):
+    maze = Maze(os.path.join(HERE, filename))
+    astar_path, astar_states = search_alt.astar(maze)
+    path, states_explored = search.search(maze, "jps")
+    assert len(path) == len(astar_path)
+    assert states_explored < astar_states
+    for a, b in zip(path, path[1:]):
+        assert b in maze.getNeighbors(a[0], a[1])
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_jps_optimal_on_random_grids(seed):
+    maze = writeRandomMaze(4 + seed % 17, 4 + seed * 7 % 19, (0, 0.1, 0.2, 0.3, 0.4)[seed % 5], seed)
+    start, objective = maze.getStart(), maze.getObjectives()[0]
+    distance = bfsTree(maze, start)[0][maze.getCellId(objective[0], objective[1])]
+    path, _ = search_alt.jps_executor(maze, start, [objective])
+    if distance == -1:
+        assert path == []
+    else:
+        assert len(path) == distance + 1 and path[0] == start and path[-1] == objective
+        for a, b in zip(path, path[1:]):
+            assert b in maze.getNeighbors(a[0], a[1])
+
+
+@pytest.mark.parametrize("method", ["bibfs", "biastar"])
+@pytest.mark.parametrize("filename", ["mediumMaze.txt", "bigMaze.txt", "openMaze.txt"])
+def test_bidirectional_path_length_matches_bfs(method, filename):
+    maze = Maze(os.path.join(HERE, filename))
+    objective = maze.getObjectives()[0]
+    distance = bfsTree(maze, maze.getStart())[0][maze.getCellId(objective[0], objective[1])]
+    path, states_explored = search.search(maze, method)
+    assert len(path) == distance + 1
+    assert path[0] == maze.getStart() and path[-1] == maze.getObjectives()[0]
+    assert states_explored > 0
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_bidirectional_optimal_on_random_grids(seed):
+    maze = writeRandomMaze(4 + seed % 17, 4 + seed * 7 % 19, (0, 0.1, 0.2, 0.3, 0.4)[seed % 5], seed)
+    start, objective = maze.getStart(), maze.getObjectives()[0]
+    distance = bfsTree(maze, start)[0][maze.getCellId(objective[0], objective[1])]
+    for executor in (search_alt.bibfs_executor, search_alt.biastar_executor):
+        path, _ = executor(maze, start, objective)
+        if distance == -1:
+            assert path == []
+        else:
+            assert len(path) == distance + 1 and path[0] == start and path[-1] == objective
+            for a, b in zip(path, path[1:]):
+                assert b in maze.getNeighbors(a[0], a[1])
+
+
+def test_bidirectional_stops_on_unsolvable_and_trivial_legs():
+    S, A, G = (0, 0), (0, 1), (0, 2)
+    maze = GraphMaze({S: [A], A: [S], G: []})
+    assert search_alt.bibfs_executor(maze, S, G)[0] == []
+    assert search_alt.biastar_executor(maze, S, G)[0] == []
+    assert search_alt.bibfs_executor(maze, S, S)[0] == [S]
+    assert search_alt.biastar_executor(maze, S, S)[0] == [S]
+
+
+# a small transposition table is only tried on mediumMaze, the larger mazes have loops it re-expands exponentially
+@pytest.mark.parametrize("method, budget, filename", [
+    (method, budget, filename) for filename in ["mediumMaze.txt", "bigMaze.txt", "openMaze.txt"]
+    for method, budget in [("idastar", None), ("smastar", 1000)]] + [("idastar", 300, "mediumMaze.txt")])
+def test_memory_bounded_path_length_matches_bfs(method, budget, filename):
+    maze = Maze(os.path.join(HERE, filename))
+    objective = maze.getObjectives()[0]
+    distance = bfsTree(maze, maze.getStart())[0][maze.getCellId(objective[0], objective[1])]
+    path, states_explored = getattr(search_alt, method)(maze, budget)
+    assert len(path) == distance + 1
+    assert path[0] == maze.getStart() and path[-1] == objective
+    for a, b in zip(path, path[1:]):
+        assert b in maze.getNeighbors(a[0], a[1])
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_memory_bounded_optimal_on_random_grids(seed):
+    maze = writeRandomMaze(4 + seed % 17, 4 + seed * 7 % 19, (0, 0.1, 0.2, 0.3, 0.4)[seed % 5], seed)
+    start, objective = maze.getStart(), maze.getObjectives()[0]
+    distance = bfsTree(maze, start)[0][maze.getCellId(objective[0], objective[1])]
+    runs = [(search_alt.idastar_executor, None)]
+    # SMA* with room for exactly the optimal path, a little more, and plenty
+    runs += [(search_alt.smastar_executor, budget) for budget in (max(distance + 1, 2), distance + 3, None)]
+    for executor, budget in runs:
+        path, _ = executor(maze, start, [objective], budget)
+        if distance == -1:
+            assert path == []
+        else:
+            assert len(path) == distance + 1 and path[0] == start and path[-1] == objective
+            for a, b in zip(path, path[1:]):
+                assert b in maze.getNeighbors(a[0], a[1])
+
+
+def test_smastar_gives_up_when_the_path_does_not_fit():
+    maze = writeRandomMaze(9, 9, 0.2, 5)
+    start, objective = maze.getStart(), maze.getObjectives()[0]
+    distance = bfsTree(maze, start)[0][maze.getCellId(objective[0], objective[1])]
+    assert distance > 2
+    assert search_alt.smastar_executor(maze, start, [objective], distance)[0] == []
+    assert len(search_alt.smastar_executor(maze, start, [objective], distance + 1)[0]) == distance + 1
+
+
+def test_memory_bounded_stop_on_unsolvable_and_trivial_legs():
+    S, A, G = (0, 0), (0, 1), (0, 2)
+    maze = GraphMaze({S: [A], A: [S], G: []})
+    for executor in (search_alt.idastar_executor, search_alt.smastar_executor):
+        assert executor(maze, S, [G], 10)[0] == []
+        assert executor(maze, S, [S], 10)[0] == [S]
+    maze = Maze(os.path.join(HERE, "mediumSearch.txt"))
+    path, _ = search_alt.search(maze, "smastar")
+    assert set(maze.getObjectives()) <= set(path)
+
+
+def checkAnytimeSolutions(maze, start, objective, distance, timeBudget=None):
+    solutions = list(search_alt.anytimeAstar(maze, start, [objective], timeBudget))
+    costs = [len(path) - 1 for path, _, _ in solutions]
+    bounds = [bound for _, bound, _ in solutions]
+    assert costs == sorted(costs, reverse=True) and bounds == sorted(bounds, reverse=True)
+    for (path, bound, _), cost in zip(solutions, costs):
+        assert 1.0 <= bound <= search_alt.ARA_WEIGHTS[0]
+        assert cost <= bound * distance + 1e-9
+        assert path[0] == start and path[-1] == objective
+        for a, b in zip(path, path[1:]):
+            assert b in maze.getNeighbors(a[0], a[1])
+    return solutions
+
+
+@pytest.mark.parametrize("filename", ["mediumMaze.txt", "bigMaze.txt", "openMaze.txt"])
+def test_anytime_astar_improves_to_optimal(filename):
+    maze = Maze(os.path.join(HERE, filename))
+    objective = maze.getObjectives()[0]
+    distance = bfsTree(maze, maze.getStart())[0][maze.getCellId(objective[0], objective[1])]
+    solutions = checkAnytimeSolutions(maze, maze.getStart(), objective, distance)
+    assert len(solutions) > 1
+    assert solutions[-1][1] == 1.0 and len(solutions[-1][0]) == distance + 1
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_anytime_astar_bounds_on_random_grids(seed):
+    maze = writeRandomMaze(4 + seed % 17, 4 + seed * 7 % 19, (0, 0.1, 0.2, 0.3, 0.4)[seed % 5], seed)
+    start, objective = maze.getStart(), maze.getObjectives()[0]
+    distance = bfsTree(maze, start)[0][maze.getCellId(objective[0], objective[1])]
+    if distance == -1:
+        assert list(search_alt.anytimeAstar(maze, start, [objective])) == []
+    else:
+        assert len(checkAnytimeSolutions(maze, start, objective, distance)[-1][0]) == distance + 1
+
+
+def test_anytime_astar_stops_at_the_time_budget():
+    maze = Maze(os.path.join(HERE, "bigMaze.txt"))
+    objective = maze.getObjectives()[0]
+    distance = bfsTree(maze, maze.getStart())[0][maze.getCellId(objective[0], objective[1])]
+    # the first, most weighted search always finishes; nothing after it fits in no time at all
+    solutions = checkAnytimeSolutions(maze, maze.getStart(), objective, distance, timeBudget=0)
+    assert len(solutions) == 1 and solutions[0][1] > 1.0
+    path, states_explored = search_alt.search(maze, "arastar")
+    assert path[-1] == objective and states_explored > 0
+
+
+def test_astar_weight_is_a_parameter():
+    objectives = [(1, 1), (5, 5), (9, 9)]
+    assert search_alt.getWeightedAstarHeuristicMinDistanceToAnyObjective((1, 3), objectives) == 4
+    assert search_alt.getWeightedAstarHeuristicMinDistanceToAnyObjective((1, 3), objectives, 3) == 6
+    assert search_alt.getWeightedAstarHeuristicMinDistanceToAnyObjective((1, 3), objectives[:2], 3) == 2
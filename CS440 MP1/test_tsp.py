@@ -0,0 +1,94 @@
+# test_tsp.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the tour ordering in tsp.py and the tsp search method built on it.
+"""
+
+import itertools
+import os
+import random
+
+import pytest
+
+from maze import Maze
+import search
+import search_alt
+import tsp
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def randomMatrix(size, seed):
+    rng = random.Random(seed)
+    points = [(rng.randint(0, 30), rng.randint(0, 30)) for _ in range(size)]
+    return [[abs(a[0] - b[0]) + abs(a[1] - b[1]) for b in points] for a in points]
+
+
+def bruteForceCost(weights):
+    return min(tsp.tourCost(weights, [0] + list(rest)) for rest in itertools.permutations(range(1, len(weights))))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_held_karp_matches_brute_force(seed):
+    matrix = randomMatrix(8, seed)
+    order = tsp.heldKarpOrder(matrix)
+    assert order[0] == 0 and sorted(order) == list(range(8))
+    assert tsp.tourCost(matrix, order) == bruteForceCost(matrix)
+
+
+def test_held_karp_avoids_unreachable_edges():
+    matrix = [[0, 1, 5, -1], [1, 0, -1, 2], [5, -1, 0, 2], [-1, 2, 2, 0]]
+    assert tsp.heldKarpOrder(matrix) == [0, 1, 3, 2]
+
+
+def test_local_search_untangles_points_on_a_line():
+    # nearest neighbour from the middle zig-zags; 2-opt / Or-opt must walk one side and then the other
+    positions = [15] + [p for p in range(31) if p != 15]
+    matrix = [[abs(a - b) for b in positions] for a in positions]
+    order = tsp.localSearchOrder(matrix)
+    assert sorted(order) == list(range(31)) and order[0] == 0
+    assert tsp.tourCost(matrix, order) == 45
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_local_search_close_to_optimal(seed):
+    matrix = randomMatrix(9, seed)
+    order = tsp.localSearchOrder(matrix)
+    cost = tsp.tourCost(matrix, order)
+    assert cost <= tsp.tourCost(matrix, tsp.nearestNeighbourOrder(matrix))
+    assert cost <= 1.15 * bruteForceCost(matrix)
+    # a local optimum: another round finds nothing
+    assert not tsp.twoOpt(matrix, order) and not tsp.orOpt(matrix, order)
+
+
+@pytest.mark.parametrize("filename, expected_length", [("tinySearch.txt", 37), ("smallSearch.txt", 137)])
+def test_tsp_path_is_optimal_and_walkable(filename, expected_length):
+    # the lengths astar_mst (and the Held-Karp brute force in test_mst.py) give
+    maze = Maze(os.path.join(HERE, filename))
+    path, states_explored = search.search(maze, "tsp")
+    assert len(path) == expected_length
+    assert path[0] == maze.getStart() and set(maze.getObjectives()) <= set(path)
+    for a, b in zip(path, path[1:]):
+        assert b in maze.getNeighbors(a[0], a[1])
+    assert states_explored > 0
+
+
+def test_tsp_uses_local_search_above_the_limit(monkeypatch):
+    maze = Maze(os.path.join(HERE, "smallSearch.txt"))
+    monkeypatch.setattr(tsp, "HELD_KARP_LIMIT", 2)
+    path, _ = search_alt.tsp(maze)
+    assert set(maze.getObjectives()) <= set(path)
+    assert len(path) <= 1.1 * 137
+
+
+def test_tsp_unreachable_objective_gives_no_path(tmp_path):
+    filename = str(tmp_path / "walled.txt")
+    with open(filename, 'w') as f:
+        f.write("%%%%%%%\n%P. %.%\n%%%%%%%\n")
+    path, states_explored = search_alt.tsp(Maze(filename))
+    assert path == [] and states_explored > 0
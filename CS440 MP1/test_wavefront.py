@@ -0,0 +1,71 @@
+# test_wavefront.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks for the NumPy wavefront BFS and the mask view of Maze.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from distances import bfsTree
+from generate import generateMaze, writeMaze
+from maze import Maze
+import wavefront
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def bfsGrid(maze, source):
+    return np.array(bfsTree(maze, source)[0], dtype=np.int32).reshape(maze.getDimensions())
+
+
+@pytest.mark.parametrize("denseFraction", [0.0, wavefront.DENSE_FRACTION, 2.0])
+@pytest.mark.parametrize("filename", ["mediumMaze.txt", "bigMaze.txt", "openMaze.txt", "mediumSearch.txt"])
+def test_matches_python_bfs(monkeypatch, filename, denseFraction):
+    # 0 advances every wavefront as a mask, 2 every one as an id array
+    monkeypatch.setattr(wavefront, "DENSE_FRACTION", denseFraction)
+    maze = Maze(os.path.join(HERE, filename))
+    distance = wavefront.distanceGrid(maze, [maze.getStart()])
+    assert distance.dtype == np.int32
+    assert np.array_equal(distance, bfsGrid(maze, maze.getStart()))
+
+
+@pytest.mark.parametrize("layout", ["perfect", "braided", "rooms"])
+def test_multi_source_is_the_minimum(tmp_path, layout):
+    filename = str(tmp_path / "maze.txt")
+    writeMaze(generateMaze(layout, 45, 61, 5, 4), filename)
+    maze = Maze(filename)
+    sources = [maze.getStart()] + maze.getObjectives()
+    distance = wavefront.distanceGrid(maze, sources)
+    expected = np.min([np.where(grid < 0, np.iinfo(np.int32).max, grid)
+                       for grid in (bfsGrid(maze, source) for source in sources)], axis=0)
+    expected[expected == np.iinfo(np.int32).max] = -1
+    assert np.array_equal(distance, expected)
+
+
+def test_open_mask_of_packed_and_mapped_mazes(tmp_path):
+    maze = Maze(os.path.join(HERE, "bigMaze.txt"))
+    mask = maze.openMask()
+    assert mask.shape == maze.getDimensions()
+    assert all(mask[row, col] == (not maze.isWall(row, col))
+               for row in range(maze.rows) for col in range(maze.cols))
+    binary = str(tmp_path / "big.bin")
+    maze.saveBinary(binary)
+    assert np.array_equal(Maze(binary).openMask(), mask)
+
+
+def test_dead_cells_are_the_unreachable_open_cells(tmp_path):
+    filename = str(tmp_path / "maze.txt")
+    with open(filename, "w") as f:
+        f.write("%%%%%%%\n%P  % %\n%%%%%%%\n%.    %\n%%%%%%%\n")
+    maze = Maze(filename)
+    dead = wavefront.deadCells(maze, maze.getStart())
+    assert sorted(zip(*np.nonzero(dead))) == [(1, 5), (3, 1), (3, 2), (3, 3), (3, 4), (3, 5)]
+    assert wavefront.distanceGrid(maze, [(0, 0)]).max() == -1
@@ -0,0 +1,199 @@
+# tsp.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the tour ordering used by the tsp search method.
+Given the maze distances between the start (index 0) and the objectives, it finds the
+order in which to visit the objectives: exactly with the Held-Karp bitmask DP for up to
+HELD_KARP_LIMIT objectives, and with 2-opt / Or-opt local search above that.
+The tour is open - it starts at index 0 and does not return.
+"""
+
+HELD_KARP_LIMIT = 20
+
+"""
+Stand-in for a missing edge (UNREACHABLE in the distance matrix). Twice this still fits in an int32
+"""
+NO_EDGE = 1 << 29
+
+
+def edgeWeights(matrix):
+    """
+    Copies a distance matrix into lists of ints, with NO_EDGE where there is no path
+    :param matrix: square NumPy array or list of lists, negative meaning no path
+    :return: list of lists
+    """
+    return [[int(weight) if weight >= 0 else NO_EDGE for weight in row] for row in matrix]
+
+
+def tourCost(weights, order):
+    """
+    Length of the open tour visiting the indices in order
+    :param weights: list of lists from edgeWeights
+    :param order: list of indices
+    :return: total weight
+    """
+    return sum(weights[a][b] for a, b in zip(order, order[1:]))
+
+
+def heldKarpOrder(matrix):
+    """
+    Exact open tour from index 0 through every other index, by DP over subsets.
+    best[mask, j] is the shortest path from 0 that visits exactly the objectives in mask and ends at j.
+    Masks are handled a popcount layer at a time and every layer is a handful of NumPy operations,
+    so 20 objectives (about 10^6 masks) take seconds and about 100 MB
+    :param matrix: (k + 1) x (k + 1) distance matrix, index 0 is the start
+    :return: list of indices starting with 0
+    """
+    import numpy as np
+
+    k = len(matrix) - 1
+    if k <= 0:
+        return [0]
+    weights = np.minimum(np.where(np.asarray(matrix) < 0, NO_EDGE, matrix), NO_EDGE).astype(np.int32)
+    edges = weights[1:, 1:]
+    best = np.full((1 << k, k), NO_EDGE, dtype=np.int32)
+    parent = np.full((1 << k, k), -1, dtype=np.int8)
+    for j in range(k):
+        best[1 << j, j] = weights[0, j + 1]
+
+    masks = np.arange(1 << k, dtype=np.int64)
+    popcount = np.zeros(1 << k, dtype=np.int8)
+    for bit in range(k):
+        popcount += ((masks >> bit) & 1).astype(np.int8)
+
+    for size in range(1, k):
+        layer = masks[popcount == size]
+        layer_best = best[layer]
+        for j in range(k):
+            lacking = ((layer >> j) & 1) == 0
+            sources = layer[lacking]
+            candidates = np.minimum(layer_best[lacking] + edges[:, j], NO_EDGE)
+            previous = candidates.argmin(axis=1)
+            values = candidates[np.arange(len(sources)), previous]
+            targets = sources | (1 << j)
+            better = values < best[targets, j]
+            best[targets[better], j] = values[better]
+            parent[targets[better], j] = previous[better]
+
+    mask = (1 << k) - 1
+    j = int(best[mask].argmin())
+    order = []
+    while j >= 0:
+        order.append(j + 1)
+        previous = int(parent[mask, j])
+        mask ^= 1 << j
+        j = previous
+    order.append(0)
+    order.reverse()
+    return order
+
+
+def nearestNeighbourOrder(weights):
+    """
+    Greedy open tour from index 0, always moving to the closest unvisited index
+    :param weights: list of lists from edgeWeights
+    :return: list of indices starting with 0
+    """
+    order = [0]
+    remaining = set(range(1, len(weights)))
+    while remaining:
+        current = order[-1]
+        closest = min(remaining, key=lambda index: (weights[current][index], index))
+        order.append(closest)
+        remaining.remove(closest)
+    return order
+
+
+def twoOpt(weights, order):
+    """
+    Reverses segments of the open tour while that makes it shorter. order[0] stays in place
+    :param weights: list of lists from edgeWeights
+    :param order: list of indices, changed in place
+    :return: True if anything changed
+    """
+    changed = False
+    improved = True
+    last = len(order) - 1
+    while improved:
+        improved = False
+        for i in range(1, last):
+            a, b = order[i - 1], order[i]
+            for j in range(i + 1, last + 1):
+                c = order[j]
+                delta = weights[a][c] - weights[a][b]
+                if j < last:
+                    e = order[j + 1]
+                    delta += weights[b][e] - weights[c][e]
+                if delta < 0:
+                    order[i:j + 1] = reversed(order[i:j + 1])
+                    b = order[i]
+                    improved = changed = True
+    return changed
+
+
+def orOpt(weights, order, maxSegment=3):
+    """
+    Moves segments of up to maxSegment consecutive indices to a cheaper place in the open tour
+    :param weights: list of lists from edgeWeights
+    :param order: list of indices, changed in place
+    :param maxSegment:
+    :return: True if anything changed
+    """
+    changed = False
+    improved = True
+    while improved:
+        improved = False
+        for length in range(1, maxSegment + 1):
+            for i in range(1, len(order) - length + 1):
+                segment = order[i:i + length]
+                before = order[i - 1]
+                after = order[i + length] if i + length < len(order) else None
+                removed_gain = weights[before][segment[0]]
+                if after is not None:
+                    removed_gain += weights[segment[-1]][after] - weights[before][after]
+                rest = order[:i] + order[i + length:]
+                best_delta, best_position = 0, None
+                for t in range(len(rest)):
+                    u = rest[t]
+                    v = rest[t + 1] if t + 1 < len(rest) else None
+                    added = weights[u][segment[0]]
+                    if v is not None:
+                        added += weights[segment[-1]][v] - weights[u][v]
+                    if added - removed_gain < best_delta:
+                        best_delta, best_position = added - removed_gain, t + 1
+                if best_position is not None:
+                    order[:] = rest[:best_position] + segment + rest[best_position:]
+                    improved = changed = True
+                    break
+            if improved:
+                break
+    return changed
+
+
+def localSearchOrder(matrix):
+    """
+    Near-optimal open tour from index 0: nearest neighbour, then 2-opt and Or-opt until neither helps
+    :param matrix: square distance matrix, index 0 is the start
+    :return: list of indices starting with 0
+    """
+    weights = edgeWeights(matrix)
+    order = nearestNeighbourOrder(weights)
+    while twoOpt(weights, order) | orOpt(weights, order):
+        pass
+    return order
+
+
+def tourOrder(matrix):
+    """
+    Visiting order of the objectives: exact up to HELD_KARP_LIMIT objectives, local search above
+    :param matrix: (k + 1) x (k + 1) distance matrix, index 0 is the start
+    :return: list of indices starting with 0
+    """
+    if len(matrix) - 1 <= HELD_KARP_LIMIT:
+        return heldKarpOrder(matrix)
+    return localSearchOrder(matrix)
@@ -0,0 +1,78 @@
+# wavefront.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains a NumPy BFS that grows a whole wavefront per step, for exact distance fields
+over the full grid from one or more sources.
+The grid is Maze.openMask() padded with a ring of walls, so no step needs a bounds check.
+A wide wavefront (open rooms) is advanced as a boolean mask shifted one cell in each direction;
+a narrow one (corridors, where a wavefront is a handful of cells for thousands of steps) is kept
+as an array of flat ids and advanced by adding the four neighbour offsets, which costs in
+proportion to its size instead of the size of the grid.
+"""
+
+from distances import UNREACHABLE
+
+"""
+The wavefront is advanced as a mask while it holds more than this fraction of the cells
+"""
+DENSE_FRACTION = 1 / 64
+
+
+def distanceGrid(maze, sources):
+    """
+    Exact maze distance from the nearest of the sources to every cell
+    :param maze: Maze (anything with openMask())
+    :param sources: list of (row, col) tuples
+    :return: rows x cols int32 NumPy array, UNREACHABLE (-1) for walls and cells no source reaches
+    """
+    import numpy as np
+
+    open_mask = maze.openMask()
+    rows, cols = open_mask.shape
+    width = cols + 2
+    padded = np.zeros((rows + 2, width), dtype=bool)
+    padded[1:-1, 1:-1] = open_mask
+    is_open = padded.ravel()
+    distance = np.full(padded.size, UNREACHABLE, dtype=np.int32)
+    offsets = np.array([width, -width, 1, -1])
+
+    frontier = np.unique(np.array([(row + 1) * width + col + 1 for row, col in sources], dtype=np.int64))
+    frontier = frontier[is_open[frontier]]
+    distance[frontier] = 0
+    dense_size = padded.size * DENSE_FRACTION
+    depth = 0
+    while frontier.size:
+        depth += 1
+        if frontier.size > dense_size:
+            wave = np.zeros(padded.shape, dtype=bool)
+            wave.ravel()[frontier] = True
+            grown = np.zeros(padded.shape, dtype=bool)
+            grown[1:, :] |= wave[:-1, :]
+            grown[:-1, :] |= wave[1:, :]
+            grown[:, 1:] |= wave[:, :-1]
+            grown[:, :-1] |= wave[:, 1:]
+            grown = grown.ravel()
+            grown &= is_open
+            grown &= distance == UNREACHABLE
+            frontier = np.flatnonzero(grown)
+        else:
+            neighbours = (frontier[:, None] + offsets).ravel()
+            neighbours = neighbours[is_open[neighbours] & (distance[neighbours] == UNREACHABLE)]
+            frontier = np.unique(neighbours)
+        distance[frontier] = depth
+    return distance.reshape(padded.shape)[1:-1, 1:-1].copy()
+
+
+def deadCells(maze, start):
+    """
+    Open cells that cannot be reached from start, which no search from there needs to look at
+    :param maze:
+    :param start: (row, col)
+    :return: rows x cols bool NumPy array
+    """
+    return maze.openMask() & (distanceGrid(maze, [start]) == UNREACHABLE)
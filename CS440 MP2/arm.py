@@ -72,6 +72,11 @@ class Arm:
         """
         return self.__armLimit
 
+    def getArmLinkLengths(self):
+        """This function returns the lengths of all arm links
+        """
+        return [armLink.getLength() for armLink in self.__armLinks]
+
     def getNumArmLinks(self):
         """This function returns the number of arm links of this arm
         """
@@ -67,6 +67,69 @@ def doesArmTouchObstacles(armPos, obstacles):
     return False
 
 
+
+def computeCoordinates(startX, startY, length, angles):
+    """The vectorized computeCoordinate: the end coordinates of one arm link for a whole grid of angles
+
+        Args:
+            startX (ndarray): x-coordinates of the base of the arm link
+            startY (ndarray): y-coordinates of the base of the arm link
+            length (int): length of the arm link
+            angles (ndarray): degrees of the arm link from x-axis to couter-clockwise
+
+        Return:
+            (x-coordinates, y-coordinates) of the end of the arm link, ndarrays of the broadcast shape
+    """
+    radians = np.radians(angles)
+    return startX + length * np.cos(radians), startY - length * np.sin(radians)
+
+
+def doLinksTouchObstacles(startX, startY, endX, endY, obstacles):
+    """The vectorized test of doesArmTouchObstacles for one arm link over a whole grid of positions.
+        The coordinates only need to broadcast together, so a link that depends on fewer joints than the grid
+        is tested once per distinct position; the obstacles are taken one at a time, which keeps the
+        temporaries the size of the grid however many there are
+
+        Args:
+            startX, startY (ndarray): start coordinates of the arm link
+            endX, endY (ndarray): end coordinates of the arm link
+            obstacles (list): x-, y- coordinate and radius of obstacles [(x, y, r)]
+
+        Return:
+            bool ndarray of the broadcast shape of the coordinates, True where the link touches an obstacle
+    """
+    p1x, p1y = np.asarray(startX, dtype=float), np.asarray(startY, dtype=float)
+    vx, vy = endX - p1x, endY - p1y
+    a = vx * vx + vy * vy
+    touch = np.zeros(np.broadcast(p1x, p1y, vx, vy).shape, dtype=bool)
+    for each_obstacle in obstacles:
+        qx, qy, r = float(each_obstacle[0]), float(each_obstacle[1]), each_obstacle[2]
+        b = 2 * (vx * (p1x - qx) + vy * (p1y - qy))
+        c = (p1x * p1x + p1y * p1y) + (qx * qx + qy * qy) - 2 * (p1x * qx + p1y * qy) - r ** 2
+        disc = b ** 2 - 4 * a * c
+        with np.errstate(invalid='ignore'):
+            sqrt_disc = np.sqrt(disc)
+            t1 = (-b + sqrt_disc) / (2 * a)
+            t2 = (-b - sqrt_disc) / (2 * a)
+        touch |= (disc >= 0) & (((0 <= t1) & (t1 <= 1)) | ((0 <= t2) & (t2 <= 1)))
+    return touch
+
+
+def doEndsTouchGoals(endX, endY, goals):
+    """The vectorized doesArmTouchGoals over a whole grid of arm tick positions
+
+        Args:
+            endX, endY (ndarray): the arm tick coordinates
+            goals (list): x-, y- coordinate and radius of goals [(x, y, r)]
+
+        Return:
+            bool ndarray of the shape of the coordinates, True where the tick touches a goal
+    """
+    touch = np.zeros(np.shape(endX), dtype=bool)
+    for goal in goals:
+        touch |= np.sqrt((endX - goal[0]) ** 2 + (endY - goal[1]) ** 2) <= goal[2]
+    return touch
+
 def doesArmTouchGoals(armEnd, goals):
     """Determine whether the given arm links touch goals
         This is straightforward distance formula
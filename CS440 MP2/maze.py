@@ -13,16 +13,20 @@ a representation of the maze that is exposed through a simple interface.
 """
 
 import copy
+import numpy as np
 from const import *
 from util import *
 
 class Maze:
     def __init__(self, input_map, offsets, granularity):
         """Initializes the Maze object by reading the maze from a file
+            The map is kept as an n-D NumPy uint8 array holding the byte of every cell's character,
+            one axis per joint, so a 3-link arm's grid takes one byte per (alpha, beta, gamma) cell
 
             Args:
                 input_map (list): 2D array. Alpha is row and beta is column
-                offsets (list): min value of alpha and beta
+                                  or an n-D uint8 ndarray of character bytes, one axis per joint
+                offsets (list): min value of every joint angle
                 granularity (int): unit of increasing and decreasing the joint angle
         """                
         self.__start = None
@@ -30,16 +34,18 @@ class Maze:
 
         self.offsets = offsets
         self.granularity = granularity
-    
-        self.__dimensions = [len(input_map), len(input_map[0])]        
-        self.__map = input_map
 
-        for x in range(self.__dimensions[ALPHA]):
-            for y in range(self.__dimensions[BETA]):                
-                if self.__map[x][y] == START_CHAR:                    
-                    self.__start = idxToAngle((x, y), self.offsets, granularity)
-                elif self.__map[x][y] == OBJECTIVE_CHAR:
-                    self.__objective.append(idxToAngle((x, y), self.offsets, granularity))
+        if isinstance(input_map, np.ndarray):
+            self.__map = input_map.astype(np.uint8, copy=False)
+        else:
+            rows = [''.join(row) for row in input_map]
+            self.__map = np.frombuffer(''.join(rows).encode('ascii'), dtype=np.uint8).reshape(len(rows), -1)
+        self.__dimensions = list(self.__map.shape)
+
+        for index in np.argwhere(self.__map == ord(START_CHAR)):
+            self.__start = idxToAngle(index, self.offsets, granularity)
+        for index in np.argwhere(self.__map == ord(OBJECTIVE_CHAR)):
+            self.__objective.append(idxToAngle(index, self.offsets, granularity))
 
         if not self.__start:
             print("Maze has no start")            
@@ -49,29 +55,28 @@ class Maze:
             print("Maze has no objectives")
             raise SystemExit
 
-    def getChar(self, alpha, beta):
-        # Get character for the given alpha and beta position
-        x, y = angleToIdx((alpha, beta), self.offsets, self.granularity)
-        return self.__map[x][y]
+    def getChar(self, *angles):
+        # Get character for the given joint angles (alpha, beta, ...)
+        return chr(self.__map[angleToIdx(angles, self.offsets, self.granularity)])
     
-    def isWall(self, alpha, beta):
+    def isWall(self, *angles):
         # Returns True if the given position is the location of a wall
-        return self.getChar(alpha, beta) == WALL_CHAR
+        return self.getChar(*angles) == WALL_CHAR
     
-    def isObjective(self, alpha, beta):
+    def isObjective(self, *angles):
         # Rturns True if the given position is the location of an objective
-        return self.getChar(alpha, beta) == OBJECTIVE_CHAR
+        return self.getChar(*angles) == OBJECTIVE_CHAR
     
     def getStart(self):
-        # Returns the start position as a tuple of (beta, column)
+        # Returns the start position as a tuple of joint angles
         return self.__start
 
     def setStart(self, start):
-        # Set the start position as a tuple of (beta, column)
+        # Set the start position as a tuple of joint angles
         self.__start = start
     
     def getDimensions(self):
-        # Returns the dimensions of the maze as a (row, column) tuple
+        # Returns the dimensions of the maze, the number of cells along each joint
         return self.__dimensions
     
     def getObjectives(self):
@@ -81,37 +86,39 @@ class Maze:
     def setObjectives(self, objectives):
         # Set the list of objective positions of the maze
         self.__objective = objectives
+
+    def getMap(self):
+        # Returns the n-D uint8 array of character bytes
+        return self.__map
     
-    def isValidMove(self, alpha, beta):
-        # Check if the agent can move into a specific beta and column
-        x, y = angleToIdx((alpha, beta), self.offsets, self.granularity)
-        return x >= 0 and x < self.getDimensions()[ALPHA] and \
-               y >= 0 and y < self.getDimensions()[BETA] and \
-               not self.isWall(alpha, beta)
+    def isValidMove(self, *angles):
+        # Check if the agent can move into the given joint angles
+        index = angleToIdx(angles, self.offsets, self.granularity)
+        for i in range(len(index)):
+            if index[i] < 0 or index[i] >= self.__dimensions[i]:
+                return False
+        return self.__map[index] != ord(WALL_CHAR)
             
-    def getNeighbors(self, alpha, beta):
-        # Returns list of neighboing squares that can be moved to from the given beta,gamma
-        possibleNeighbors = [
-            (alpha + self.granularity, beta),
-            (alpha - self.granularity, beta),
-            (alpha, beta + self.granularity),
-            (alpha, beta - self.granularity)            
-        ]
+    def getNeighbors(self, *angles):
+        # Returns list of neighboing squares that can be moved to by turning one joint by the granularity
         neighbors = []
-        for a, b in possibleNeighbors:
-            if self.isValidMove(a,b):
-                neighbors.append((a,b))
+        for i in range(len(angles)):
+            for step in (self.granularity, -self.granularity):
+                neighbor = angles[:i] + (angles[i] + step,) + angles[i + 1:]
+                if self.isValidMove(*neighbor):
+                    neighbors.append(neighbor)
         return neighbors
 
     def saveToFile(self, filename):
-        # Export the maze to the text file
-        outputMap = ""
-        for beta in range(self.__dimensions[1]):
-            for alpha in range(self.__dimensions[0]):
-                outputMap += self.__map[alpha][beta]
-            outputMap += "\n"
+        # Export the maze to the text file, beta along the lines and alpha across them;
+        # with more joints every further index gets its own block, the blocks separated by an empty line
+        grid = self.__map.reshape(self.__dimensions[0], self.__dimensions[1] if len(self.__dimensions) > 1 else 1, -1)
+        blocks = []
+        for block in range(grid.shape[2]):
+            lines = np.ascontiguousarray(grid[:, :, block].T)
+            blocks.append("".join(line.tobytes().decode('ascii') + "\n" for line in lines))
 
         with open(filename, 'w') as f:
-            f.write(outputMap)
+            f.write("\n".join(blocks))
 
-        return True        
\ No newline at end of file
+        return True
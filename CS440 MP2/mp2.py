@@ -20,7 +20,7 @@ import copy
 from pygame.locals import *
 from arm import Arm
 from transform import transformToMaze
-from search import search
+from search import search, frontierStats
 from const import *
 from util import *
 from geometry import *
@@ -80,6 +80,8 @@ class Application:
             print("Done!")
             print("Searching the path...")
             path, num_explored = search(maze, searchMethod)            
+            print("Stale Pops Avoided:", frontierStats["stale_pops_avoided"])
+            print("Peak Frontier Size:", frontierStats["peak_frontier_size"])
             for i in range(len(path)):
                 self.arm.setArmAngle(path[i])
                 if (trajectory > 0) and (i % trajectory == 0):
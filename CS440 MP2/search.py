@@ -17,9 +17,12 @@ This file contains search functions.
 # maze is a Maze object based on the maze from the file specified by input filename
 # searchMethod is the search method specified by --method flag (bfs,dfs,greedy,astar)
 # You may need to slight change your previous search functions in MP1 since this is 3-d maze
-import queue as Q
 import sys
 
+from frontier import IndexedHeap
+import observers
+from util import *
+
 
 class Node:
     """A node value that encapsulates the node data and its heuristic value
@@ -47,6 +50,12 @@ class Node:
         return self.heuristic_value < other.heuristic_value
 
 
+"""
+Counters of the IndexedHeap frontier, summed over every executor call since the last resetFrontierStats()
+"""
+frontierStats = {"stale_pops_avoided": 0, "peak_frontier_size": 0}
+
+
 def search(maze, searchMethod):
     return {
         "bfs": bfs,
@@ -78,39 +87,74 @@ def astar_executor(maze, start_state, objectives):
     We tried out different heuristics, most of which are admissible
     We got the best results from a weighted minimum manhattan distance to the nearest goal and have used that as the default one
     Each Heuristic has been described in the corresponding sections
+    Frontier priorities are (f, h) so that among equal f the state closer to the goal comes out first.
+    The frontier is an IndexedHeap keyed by the flat index of the (alpha, beta, ...) cell. g_score holds the cost
+    so far; lowering a state's g_score lowers its frontier entry, or pushes it again if it was already expanded.
+    States are tuples of every joint angle, so the same search runs over the alpha/beta/gamma space of a 3-link arm.
+    The heuristic is read from manhattanTable, built once per call: a 3-link arm's goal covers thousands of cells,
+    which the per-state loop of getAstarHeuristicMinDistanceToAnyObjective would walk on every push.
     :param maze:
     :param start_state:
     :param objectives:
     :return:
     """
-    frontier = Q.PriorityQueue()
-    start_node = Node(start_state, getAstarHeuristicMinDistanceToAnyObjective(start_state, objectives) + 0)
-    frontier.put(start_node)
-    visited = set()
+    observer = observers.attached
+    if observer is not None:
+        observer.on_phase("search")
+    frontier = IndexedHeap()
+    goals = set(objectives)
+    lookup = manhattanTable(maze, objectives).ravel()
+    start_key = cellId(maze, start_state)
+    start_heuristic = int(lookup[start_key])
+    frontier.push(start_key, (start_heuristic + 0, start_heuristic), start_state)
+    if observer is not None:
+        observer.on_push(start_state, (start_heuristic, start_heuristic), len(frontier))
     parent_map = {}
+    g_score = {start_state: 0}
     num_states_explored = 0
     flag = False
-    while frontier and frontier.qsize() > 0:
-        current_node = frontier.get()
-        current_position = current_node.position
-        if current_position in visited:
-            continue
-        visited.add(current_position)
+    while frontier:
+        _, current_position, priority = frontier.pop()
+        if observer is not None:
+            observer.on_pop(current_position, priority, len(frontier))
         num_states_explored += 1
-        if current_position in objectives:
+        if current_position in goals:
             current_goal = current_position
             flag = True
+            if observer is not None:
+                observer.on_goal(current_position)
             break
-        neighbour_nodes = maze.getNeighbors(current_position[0], current_position[1])
+        neighbour_cost = g_score[current_position] + 1
+        neighbour_nodes = maze.getNeighbors(*current_position)
+        if observer is not None:
+            observer.on_expand(current_position, neighbour_nodes)
         for each_neighbour in neighbour_nodes:
-            if maze.isValidMove(each_neighbour[0], each_neighbour[1]) and each_neighbour not in visited:
+            neighbour_key = cellId(maze, each_neighbour)
+            if maze.isValidMove(*each_neighbour) and \
+                    neighbour_cost < g_score.get(each_neighbour, sys.maxsize):
+                g_score[each_neighbour] = neighbour_cost
                 parent_map[each_neighbour] = current_position
-                frontier.put(Node(each_neighbour, getAstarHeuristicMinDistanceToAnyObjective(each_neighbour, objectives) +
-                                                  len(backtrace(parent_map, start_state, current_position))))
+                neighbour_heuristic = int(lookup[neighbour_key])
+                neighbour_priority = (neighbour_heuristic + neighbour_cost, neighbour_heuristic)
+                frontier.push(neighbour_key, neighbour_priority, each_neighbour)
+                if observer is not None:
+                    observer.on_push(each_neighbour, neighbour_priority, len(frontier))
+            elif neighbour_key in frontier:
+                frontier.noteDuplicate()
+                if observer is not None:
+                    observer.on_stale(each_neighbour)
+    recordFrontierStats(frontier)
     if not flag:
         print("Map is not solvable!")
+        if observer is not None:
+            observer.on_finish()
         return [], 0
-    return backtrace(parent_map, start_state, current_goal), num_states_explored
+    if observer is not None:
+        observer.on_phase("reconstruct")
+    path = backtrace(parent_map, start_state, current_goal)
+    if observer is not None:
+        observer.on_finish()
+    return path, num_states_explored
 
 
 def astar(maze):
@@ -119,6 +163,7 @@ def astar(maze):
     :param maze:
     :return: full_path, total_states_explored
     """
+    resetFrontierStats()
     start_state = maze.getStart()
     objectives = maze.getObjectives()
     return astar_executor(maze, start_state, objectives)
@@ -129,7 +174,7 @@ def astar(maze):
 
 def getAstarHeuristicMinDistanceToAnyObjective(current_state, objectives):
     """
-    This is a simple Manhattan Distance heuristic
+    This is a simple Manhattan Distance heuristic, summed over every joint angle
     We return the minimum manhattan distance to the nearest goal
     :param current_state:
     :param objectives:
@@ -137,15 +182,75 @@ def getAstarHeuristicMinDistanceToAnyObjective(current_state, objectives):
     """
     min_heuristic = sys.maxsize
     for each_objective in objectives:
-        manhattan_objective = abs(current_state[0] - each_objective[0]) + abs(current_state[1] - each_objective[1])
+        manhattan_objective = 0
+        for angle, objective_angle in zip(current_state, each_objective):
+            manhattan_objective += abs(angle - objective_angle)
         if manhattan_objective < min_heuristic:
             min_heuristic = manhattan_objective
     return min_heuristic
 
 
+def manhattanTable(maze, objectives):
+    """
+    getAstarHeuristicMinDistanceToAnyObjective for every cell of the maze at once
+    The minimum Manhattan distance is separable by joint, so it is the L1 distance transform of the objective
+    cells: one forward and one backward sweep along each axis, each step a NumPy minimum over a whole slice
+    :param maze:
+    :param objectives:
+    :return: int64 ndarray of the maze's dimensions, in degrees like the angles
+    """
+    import numpy as np
+
+    dimensions = maze.getDimensions()
+    table = np.full(dimensions, sum(dimensions) + 1, dtype=np.int64)
+    for each_objective in objectives:
+        table[angleToIdx(each_objective, maze.offsets, maze.granularity)] = 0
+    for axis in range(len(dimensions)):
+        sweep = np.moveaxis(table, axis, 0)
+        for i in range(1, dimensions[axis]):
+            np.minimum(sweep[i], sweep[i - 1] + 1, out=sweep[i])
+        for i in range(dimensions[axis] - 2, -1, -1):
+            np.minimum(sweep[i], sweep[i + 1] + 1, out=sweep[i])
+    return table * maze.granularity
+
+
 # UTILITY FUNCTION
 
 
+def cellId(maze, position):
+    """
+    Flat id of an (alpha, beta, ...) position, the row-major index of its cell,
+    alpha index * number of beta cells + beta index for two joints
+    :param maze:
+    :param position:
+    :return: int
+    """
+    dimensions = maze.getDimensions()
+    flat = 0
+    for i, index in enumerate(angleToIdx(position, maze.offsets, maze.granularity)):
+        flat = flat * dimensions[i] + index
+    return flat
+
+
+def resetFrontierStats():
+    """
+    Clears frontierStats before a new search
+    :return:
+    """
+    frontierStats["stale_pops_avoided"] = 0
+    frontierStats["peak_frontier_size"] = 0
+
+
+def recordFrontierStats(frontier):
+    """
+    Adds the counters of a finished executor's frontier to frontierStats
+    :param frontier: IndexedHeap
+    :return:
+    """
+    frontierStats["stale_pops_avoided"] += frontier.stale_pops_avoided
+    frontierStats["peak_frontier_size"] = max(frontierStats["peak_frontier_size"], frontier.peak_size)
+
+
 def backtrace(parent_map, start, end):
     """
     This method is a utility function.
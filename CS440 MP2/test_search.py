@@ -0,0 +1,139 @@
+# test_search.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Regression checks for the MP2 search functions.
+Run with python -m pytest from this directory.
+"""
+
+from collections import deque
+import random
+
+import numpy as np
+
+from const import *
+from maze import Maze
+import observers
+import search
+
+# alpha is the row and beta the column, as transformToMaze builds it
+SYNTHETIC_MAP = [
+    "P  %     ",
+    " % % %%% ",
+    " %   %   ",
+    " %%%%% % ",
+    "       %.",
+]
+
+
+def buildMaze(granularity=2, offsets=(0, -4)):
+    return Maze([list(row) for row in SYNTHETIC_MAP], list(offsets), granularity)
+
+
+def shortestPathLength(maze):
+    start = maze.getStart()
+    objectives = maze.getObjectives()
+    distance = {start: 1}
+    queue = deque([start])
+    while queue:
+        current = queue.popleft()
+        if current in objectives:
+            return distance[current]
+        for neighbour in maze.getNeighbors(*current):
+            if neighbour not in distance:
+                distance[neighbour] = distance[current] + 1
+                queue.append(neighbour)
+    return 0
+
+
+def test_astar_is_optimal_on_synthetic_map():
+    maze = buildMaze()
+    path, states_explored = search.search(maze, "astar")
+    assert len(path) == shortestPathLength(maze) == 17
+    assert path[0] == maze.getStart() and path[-1] in maze.getObjectives()
+    for a, b in zip(path, path[1:]):
+        assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == maze.granularity
+        assert not maze.isWall(b[0], b[1])
+    assert states_explored >= len(path)
+
+
+def test_frontier_stats_after_astar():
+    maze = buildMaze()
+    search.search(maze, "astar")
+    assert search.frontierStats["peak_frontier_size"] >= 2
+    assert search.frontierStats["stale_pops_avoided"] >= 0
+    # the counters are reset by every call rather than summed across searches
+    first = dict(search.frontierStats)
+    search.search(maze, "astar")
+    assert search.frontierStats == first
+
+
+def test_astar_unsolvable_map_returns_empty_path(capsys):
+    blocked = [list(row) for row in SYNTHETIC_MAP]
+    blocked[3][8] = WALL_CHAR
+    maze = Maze(blocked, [0, -4], 2)
+    path, states_explored = search.search(maze, "astar")
+    assert "not solvable" in capsys.readouterr().out
+    assert path == [] and states_explored == 0
+
+
+def test_observer_sees_every_expansion():
+    counter = observers.CounterObserver()
+    timer = observers.PhaseTimer()
+    observers.attach(observers.ObserverGroup([counter, timer]))
+    try:
+        path, states_explored = search.search(buildMaze(), "astar")
+    finally:
+        observers.detach()
+    assert counter.counts["pop"] == states_explored
+    assert counter.counts["goal"] == 1
+    assert counter.counts["push"] >= states_explored - 1
+    assert set(timer.seconds) == {"search", "reconstruct"}
+
+
+def randomCube(shape, density, seed):
+    rng = random.Random(seed)
+    grid = np.full(shape, ord(SPACE_CHAR), dtype=np.uint8)
+    grid[np.array([rng.random() < density for _ in range(grid.size)]).reshape(shape)] = ord(WALL_CHAR)
+    cells = rng.sample(range(grid.size), 3)
+    grid.ravel()[cells[0]] = ord(START_CHAR)
+    grid.ravel()[cells[1:]] = ord(OBJECTIVE_CHAR)
+    return grid
+
+
+def test_manhattan_table_matches_the_heuristic():
+    for maze in (buildMaze(), Maze(randomCube((5, 6, 7), 0.3, 1), [0, -6, 10], 3)):
+        table = search.manhattanTable(maze, maze.getObjectives())
+        for index in np.ndindex(*maze.getDimensions()):
+            state = tuple(int(i * maze.granularity + offset) for i, offset in zip(index, maze.offsets))
+            assert table[index] == search.getAstarHeuristicMinDistanceToAnyObjective(state, maze.getObjectives())
+
+
+def test_astar_is_optimal_in_three_dimensions(capsys):
+    for seed in range(20):
+        maze = Maze(randomCube((6, 7, 8), 0.25, seed), [0, 0, -4], 1)
+        path, states_explored = search.search(maze, "astar")
+        assert len(path) == shortestPathLength(maze)
+        if path:
+            assert path[0] == maze.getStart() and path[-1] in maze.getObjectives()
+            for a, b in zip(path, path[1:]):
+                assert sum(abs(x - y) for x, y in zip(a, b)) == 1 and not maze.isWall(*b)
+
+
+def test_maze_keeps_one_byte_per_cell(tmp_path):
+    maze = buildMaze()
+    assert maze.getMap().dtype == np.uint8 and maze.getMap().shape == (5, 9)
+    assert maze.getChar(0, -4) == START_CHAR and maze.isObjective(8, 12) and maze.isWall(0, 2)
+    filename = str(tmp_path / "maze.txt")
+    maze.saveToFile(filename)
+    with open(filename) as f:
+        assert f.read() == "".join("".join(row[column] for row in SYNTHETIC_MAP) + "\n" for column in range(9))
+    cube = Maze(randomCube((2, 3, 4), 0, 0), [0, 0, 0], 1)
+    cube.saveToFile(filename)
+    with open(filename) as f:
+        blocks = f.read().split("\n\n")
+    assert len(blocks) == 4 and all(block.count("\n") in (2, 3) for block in blocks)
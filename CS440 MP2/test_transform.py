@@ -0,0 +1,122 @@
+# test_transform.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+Checks that the NumPy transformToMaze builds the maze transformToMazeLoop does, and the
+configuration space of 3-link arms.
+Run with python -m pytest from this directory.
+"""
+
+import configparser
+import math
+import random
+
+import numpy as np
+import pytest
+
+from arm import Arm
+from const import *
+from geometry import doesArmTouchGoals, doesArmTouchObstacles
+import search
+import transform
+
+
+def loadMap(name):
+    config = configparser.ConfigParser()
+    config.read(CONFIG_FILE)
+    armLinks = eval(config.get(name, 'ArmLinks'))
+    arm = lambda: Arm(eval(config.get(name, 'ArmBase')), armLinks)
+    return arm, eval(config.get(name, 'Goals')), eval(config.get(name, 'Obstacles')), eval(config.get(name, 'Window'))
+
+
+def tangentGap(armPos, obstacles):
+    """Smallest |distance from a link to an obstacle centre - its radius|, 0 where a link grazes an obstacle"""
+    gap = math.inf
+    for (x1, y1), (x2, y2) in armPos:
+        for x, y, r in obstacles:
+            t = ((x - x1) * (x2 - x1) + (y - y1) * (y2 - y1)) / ((x2 - x1) ** 2 + (y2 - y1) ** 2)
+            t = min(max(t, 0), 1)
+            gap = min(gap, abs(math.hypot(x1 + t * (x2 - x1) - x, y1 + t * (y2 - y1) - y) - r))
+    return gap
+
+
+def buildBoth(name, granularity):
+    arm, goals, obstacles, window = loadMap(name)
+    mazes = []
+    for build in (transform.transformToMazeLoop, transform.transformToMaze):
+        try:
+            mazes.append(build(arm(), goals, obstacles, window, granularity))
+        except SystemExit:
+            mazes.append(None)
+    return mazes
+
+
+@pytest.mark.parametrize("name", ["BasicMap", "Map1", "Map2", "Map3", "Map4"])
+@pytest.mark.parametrize("granularity", [2, 5, 10])
+def test_same_maze_as_the_loop(name, granularity, capsys):
+    loop, vectorized = buildBoth(name, granularity)
+    assert (loop is None) == (vectorized is None)
+    if loop is None:
+        return
+    assert loop.getDimensions() == vectorized.getDimensions()
+    assert loop.getStart() == vectorized.getStart()
+    assert loop.getObjectives() == vectorized.getObjectives()
+    arm, _, obstacles, _ = loadMap(name)
+    probe = arm()
+    rows, columns = loop.getDimensions()
+    for row in range(rows):
+        for column in range(columns):
+            alpha, beta = row * granularity + loop.offsets[0], column * granularity + loop.offsets[1]
+            if loop.getChar(alpha, beta) != vectorized.getChar(alpha, beta):
+                # np.dot and the broadcast products round differently, which only matters where a link
+                # exactly grazes an obstacle
+                probe.setArmAngle((alpha, beta))
+                assert tangentGap(probe.getArmPos(), obstacles) < 1e-6
+
+
+def test_granularity_one_map(capsys):
+    loop, vectorized = buildBoth("Map1", 1)
+    assert loop.getDimensions() == vectorized.getDimensions() == [181, 301]
+    rows, columns = loop.getDimensions()
+    assert all(loop.getChar(alpha, beta - 150) == vectorized.getChar(alpha, beta - 150)
+               for alpha in range(rows) for beta in range(columns))
+
+
+@pytest.mark.parametrize("name", ["Map6", "Map7"])
+def test_three_link_arm_gets_a_three_dimensional_maze(name, capsys):
+    arm, goals, obstacles, window = loadMap(name)
+    maze = transform.transformToMaze(arm(), goals, obstacles, window, 2)
+    limits = arm().getArmLimit()
+    assert maze.getDimensions() == [(limit[1] - limit[0]) // 2 + 1 for limit in limits]
+    assert maze.getMap().dtype == np.uint8 and maze.getMap().nbytes == np.prod(maze.getDimensions())
+    assert maze.getStart() == tuple(arm().getArmAngle())
+    probe = arm()
+    rng = random.Random(440)
+    cells = [tuple(rng.randrange(limit[0], limit[1] + 1, 2) for limit in limits) for _ in range(300)]
+    for angles in cells + maze.getObjectives()[:50]:
+        if angles == maze.getStart():
+            continue
+        probe.setArmAngle(angles)
+        if doesArmTouchObstacles(probe.getArmPos(), obstacles):
+            expected = WALL_CHAR
+        elif doesArmTouchGoals(probe.getEnd(), goals):
+            expected = OBJECTIVE_CHAR
+        else:
+            expected = SPACE_CHAR
+        assert maze.getChar(*angles) == expected or tangentGap(probe.getArmPos(), obstacles) < 1e-6
+
+
+def test_three_link_arm_reaches_its_goal(capsys):
+    arm, goals, obstacles, window = loadMap("Map6")
+    maze = transform.transformToMaze(arm(), goals, obstacles, window, 2)
+    path, states_explored = search.search(maze, "astar")
+    assert path[0] == (90, 0, 0) and path[-1] in maze.getObjectives()
+    probe = arm()
+    for angles in path:
+        probe.setArmAngle(angles)
+        assert not doesArmTouchObstacles(probe.getArmPos(), obstacles)
+    assert doesArmTouchGoals(probe.getEnd(), goals)
@@ -13,6 +13,7 @@ This file contains the transform function that converts the robot arm map
 to the maze.
 """
 import copy
+import numpy as np
 from arm import Arm
 from maze import Maze
 from search import *
@@ -22,6 +23,62 @@ from util import *
 
 def transformToMaze(arm, goals, obstacles, window, granularity):
     """This function transforms the given 2D map to the maze in MP1.
+        It builds the configuration space of every joint of the arm, one maze axis per joint (alpha, beta and,
+        for a 3-link arm, gamma), with NumPy: the link end positions of the whole angle grid are computed by
+        broadcasting, every link is tested against the obstacles over the grid at once, and the characters of
+        every cell are picked in one pass. For a 2-link arm it is the maze transformToMazeLoop builds.
+    
+        Args:
+            arm (Arm): arm instance
+            goals (list): [(x, y, r)] of goals
+            obstacles (list): [(x, y, r)] of obstacles
+            window (tuple): (width, height) of the window
+            granularity (int): unit of increasing/decreasing degree for angles
+
+        Return:
+            Maze: the maze instance generated based on input arguments, its map an n-D uint8 array.
+
+    """
+    angles = arm.getArmAngle()
+    limits = arm.getArmLimit()
+    lengths = arm.getArmLinkLengths()
+    joints = len(lengths)
+    shape = tuple(int((limit[1]-limit[0])/(granularity) + 1) for limit in limits)
+    # the angles of joint i vary along axis i only, so link i's end depends on the first i + 1 axes
+    joint_angles = [(limits[i][0] + granularity * np.arange(shape[i])).reshape(shape[i:i + 1] + (1,) * (joints - i - 1))
+                    for i in range(joints)]
+
+    startX, startY = np.float64(arm.getBase()[0]), np.float64(arm.getBase()[1])
+    total_angle = 0
+    link_hits = []
+    for length, angle in zip(lengths, joint_angles):
+        total_angle = total_angle + angle
+        endX, endY = computeCoordinates(startX, startY, length, total_angle % 360)
+        link_hits.append(doLinksTouchObstacles(startX, startY, endX, endY, obstacles))
+        startX, startY = endX, endY
+
+    start = np.ones(shape, dtype=bool)
+    for i in range(joints):
+        start &= joint_angles[i] == angles[i]
+    base_hit = np.zeros(shape, dtype=bool)
+    for hit in link_hits[:-1]:
+        base_hit |= hit
+    arm_hit = base_hit | link_hits[-1]
+    # the loop walls off the rest of a row once the links before the last touch an obstacle
+    trigger = base_hit & ~start
+    walled_row = np.zeros(shape, dtype=bool)
+    walled_row[..., 1:] = np.logical_or.accumulate(trigger, axis=-1)[..., :-1]
+
+    maze_Map = np.full(shape, ord(SPACE_CHAR), dtype=np.uint8)
+    maze_Map[np.broadcast_to(doEndsTouchGoals(startX, startY, goals), shape)] = ord(OBJECTIVE_CHAR)
+    maze_Map[arm_hit] = ord(WALL_CHAR)
+    maze_Map[start] = ord(START_CHAR)
+    maze_Map[walled_row] = ord(WALL_CHAR)
+    return Maze(maze_Map, [limit[0] for limit in limits], granularity)
+
+
+def transformToMazeLoop(arm, goals, obstacles, window, granularity):
+    """This function transforms the given 2D map to the maze in MP1, one (alpha, beta) pair at a time.
     
         Args:
             arm (Arm): arm instance